@@ -0,0 +1,73 @@
+"""
+Benchmark de throughput de `loads_many` frente al bucle de un solo núcleo.
+
+Genera muchos documentos pequeños con defectos típicos (y una fracción de
+repetidos, como en tráfico real) y mide documentos/segundo para:
+  - el bucle `[pyparsejson.loads(t) for t in docs]`
+  - `loads_many(..., executor="thread")`
+  - `loads_many(..., executor="process")`
+
+Uso:
+    python -m benchmarks.batch_throughput [--docs N] [--workers W] [--chunksize C] [--dup-ratio R]
+"""
+import argparse
+import os
+import random
+import time
+
+import pyparsejson
+
+
+def build_documents(n_docs: int, dup_ratio: float, seed: int = 0) -> list:
+    rng = random.Random(seed)
+    templates = [
+        "user: {name}, age: {n}, active: si",
+        "{{'id': {n}, 'tags': [a, b, c], 'name': '{name}'}}",
+        '{{"id": {n} "name": "{name}", "score": {n}.5,}}',
+        "name = {name}\ncount = {n}",
+    ]
+    docs = []
+    for i in range(n_docs):
+        if docs and rng.random() < dup_ratio:
+            docs.append(rng.choice(docs))
+            continue
+        template = rng.choice(templates)
+        docs.append(template.format(name=f"user{i}", n=i))
+    return docs
+
+
+def timed(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--docs", type=int, default=4000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--chunksize", type=int, default=64)
+    parser.add_argument("--dup-ratio", type=float, default=0.2)
+    args = parser.parse_args()
+
+    docs = build_documents(args.docs, args.dup_ratio)
+
+    runs = {
+        "loop (1 core)": lambda: [pyparsejson.loads(d) for d in docs],
+        "loads_many thread": lambda: pyparsejson.loads_many(docs, workers=args.workers, executor="thread",
+                                                            chunksize=args.chunksize),
+        "loads_many process": lambda: pyparsejson.loads_many(docs, workers=args.workers, executor="process",
+                                                             chunksize=args.chunksize),
+    }
+
+    print(f"docs: {len(docs)}  workers: {args.workers}  chunksize: {args.chunksize}")
+    baseline = None
+    for name, fn in runs.items():
+        elapsed = timed(fn)
+        rate = len(docs) / elapsed
+        baseline = baseline or rate
+        print(f"{name:20s} {elapsed:8.3f} s  {rate:10.0f} docs/s  x{rate / baseline:.2f}")
+
+
+if __name__ == "__main__":
+    main()
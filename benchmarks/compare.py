@@ -0,0 +1,62 @@
+"""
+Compara dos resultados guardados por `benchmarks.suite --out` y señala regresiones.
+
+Para cada caso presente en ambos archivos muestra la latencia p50 antes y después y
+el cambio relativo. Un caso es una regresión si su p50 empeora más que `--threshold`
+(por defecto 10 %). El código de salida es 1 si hay alguna regresión.
+
+Uso:
+    python -m benchmarks.compare base.json new.json [--threshold 0.10] [--metric p50_ms]
+"""
+import argparse
+import json
+import sys
+from typing import Dict, List, Sequence, Tuple
+
+
+def load_results(path: str) -> Dict[str, dict]:
+    with open(path, encoding="utf-8") as fp:
+        return {result["case"]: result for result in json.load(fp)["results"]}
+
+
+def compare(base: Dict[str, dict], new: Dict[str, dict], metric: str = "p50_ms",
+            threshold: float = 0.10) -> List[Tuple[str, float, float, float, bool]]:
+    """Filas (caso, antes, después, cambio relativo, es_regresión) para los casos comunes."""
+    rows = []
+    for case in base:
+        if case not in new:
+            continue
+        before = base[case]["latency"][metric]
+        after = new[case]["latency"][metric]
+        change = (after - before) / before if before else 0.0
+        rows.append((case, before, after, change, change > threshold))
+    return rows
+
+
+def main(argv: Sequence[str] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("base")
+    parser.add_argument("new")
+    parser.add_argument("--threshold", type=float, default=0.10)
+    parser.add_argument("--metric", default="p50_ms", choices=("mean_ms", "p50_ms", "p90_ms", "p99_ms"))
+    args = parser.parse_args(argv)
+
+    base, new = load_results(args.base), load_results(args.new)
+    rows = compare(base, new, args.metric, args.threshold)
+
+    print(f"{'case':32s} {'before':>10s} {'after':>10s} {'change':>9s}")
+    for case, before, after, change, regression in rows:
+        flag = "  ← REGRESIÓN" if regression else ""
+        print(f"{case:32s} {before:>10.2f} {after:>10.2f} {change:>+8.1%}{flag}")
+
+    only = sorted(set(base) ^ set(new))
+    if only:
+        print(f"\nCasos presentes en un solo archivo: {', '.join(only)}")
+
+    regressions = sum(row[4] for row in rows)
+    print(f"\n{regressions} regresiones de {len(rows)} casos (umbral {args.threshold:.0%} en {args.metric})")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,150 @@
+"""
+Corpus sintético de entradas dañadas para los benchmarks.
+
+Cada clase de daño corresponde a un defecto que las reglas saben reparar. Los
+documentos se generan de forma determinista a partir de una semilla y se hacen
+crecer registro a registro hasta el tamaño pedido (de 100 B a 50 MB).
+
+La clase "pathological" usa como registros las entradas del corpus patológico
+(`pathological.json`, generado por `python -m tools.perf_fuzz`): las que más
+coste de reparación por byte han mostrado.
+
+Uso:
+    python -m benchmarks.corpus missing_commas 10KB [--seed S]   # imprime el documento
+"""
+import argparse
+import json
+import os
+import random
+from functools import lru_cache
+from typing import Callable, Dict, List
+
+SIZES: Dict[str, int] = {
+    "100B": 100,
+    "1KB": 1_000,
+    "10KB": 10_000,
+    "100KB": 100_000,
+    "1MB": 1_000_000,
+    "10MB": 10_000_000,
+    "50MB": 50_000_000,
+}
+
+PATHOLOGICAL_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "pathological.json")
+
+_WORDS = ["alpha", "beta", "gamma", "delta", "epsilon", "zeta", "eta", "theta", "iota", "kappa"]
+
+
+def _valid(rng: random.Random, i: int) -> str:
+    word = rng.choice(_WORDS)
+    return (f'"k{i}": {{"id": {i}, "name": "{word}", "score": {rng.randint(0, 999)}.5, '
+            f'"active": {rng.choice(["true", "false"])}, "tags": ["{word}", "x{i % 7}"]}}')
+
+
+def _missing_commas(rng: random.Random, i: int) -> str:
+    word = rng.choice(_WORDS)
+    return f'"k{i}": {{"id": {i} "name": "{word}" "tags": ["{word}" "x{i % 7}"]}}'
+
+
+def _equals_separators(rng: random.Random, i: int) -> str:
+    word = rng.choice(_WORDS)
+    return f'"k{i}" = {{"id" = {i}, "name" = "{word}", "score" = {rng.randint(0, 999)}}}'
+
+
+def _bare_keys(rng: random.Random, i: int) -> str:
+    word = rng.choice(_WORDS)
+    return f"k{i}: {{id: {i}, name: '{word}', active: True, extra: None}}"
+
+
+def _tuples(rng: random.Random, i: int) -> str:
+    return f'"k{i}": {{"point": ({rng.randint(0, 99)}, {rng.randint(0, 99)}), "pair": ("{rng.choice(_WORDS)}", {i})}}'
+
+
+def _comments(rng: random.Random, i: int) -> str:
+    comment = f"// registro {i}\n" if i % 2 else f"/* {rng.choice(_WORDS)} */ "
+    return comment + f'"k{i}": {{"id": {i}, "name": "{rng.choice(_WORDS)}"}}'
+
+
+def _implicit_arrays(rng: random.Random, i: int) -> str:
+    values = ", ".join(str(rng.randint(0, 99)) for _ in range(4))
+    return f'"k{i}": {{"ids": {values}, "name": "{rng.choice(_WORDS)}"}}'
+
+
+@lru_cache(maxsize=None)
+def _pathological_texts(path: str) -> List[str]:
+    with open(path, encoding="utf-8") as fp:
+        return [entry["text"] for entry in json.load(fp)["inputs"]]
+
+
+def load_pathological(path: str = PATHOLOGICAL_PATH) -> List[Dict]:
+    """Entradas del corpus patológico: texto y coste medido al guardarlas (ver `tools.perf_fuzz`)."""
+    with open(path, encoding="utf-8") as fp:
+        return json.load(fp)["inputs"]
+
+
+def _pathological(rng: random.Random, i: int) -> str:
+    return f'"k{i}": {rng.choice(_pathological_texts(PATHOLOGICAL_PATH))}'
+
+
+_RECORDS: Dict[str, Callable[[random.Random, int], str]] = {
+    "valid": _valid,
+    "missing_commas": _missing_commas,
+    "equals_separators": _equals_separators,
+    "bare_keys": _bare_keys,
+    "tuples": _tuples,
+    "comments": _comments,
+    "prefix_garbage": _valid,
+    "truncation": _valid,
+    "implicit_arrays": _implicit_arrays,
+    "pathological": _pathological,
+}
+
+DAMAGE_CLASSES = tuple(_RECORDS)
+
+_PREFIXES = [
+    "INFO response payload => ",
+    "SELECT * FROM users WHERE id = 1;\n",
+    "Respuesta del modelo >>> ",
+    "<pre>",
+]
+
+
+def generate(damage: str, size: int, seed: int = 0) -> str:
+    """
+    Documento de la clase `damage` de aproximadamente `size` caracteres (al menos un registro).
+    La misma (clase, tamaño, semilla) produce siempre el mismo texto.
+    """
+    if damage not in _RECORDS:
+        raise ValueError(f"Unknown damage class '{damage}'. Use one of: {', '.join(DAMAGE_CLASSES)}")
+
+    rng = random.Random(f"{damage}:{size}:{seed}")
+    record = _RECORDS[damage]
+    separator = "\n" if damage == "missing_commas" else ",\n"
+    prefix = rng.choice(_PREFIXES) if damage == "prefix_garbage" else ""
+
+    parts = []
+    length = len(prefix) + 2
+    i = 0
+    while i == 0 or length < size:
+        part = record(rng, i)
+        parts.append(part)
+        length += len(part) + len(separator)
+        i += 1
+
+    text = prefix + "{" + separator.join(parts) + "}"
+    if damage == "truncation":
+        # Corte en el último 10% del documento, en cualquier punto (incluso dentro de un string)
+        text = text[:max(1, len(text) - 1 - rng.randint(0, max(1, len(text) // 10)))]
+    return text
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("damage", choices=DAMAGE_CLASSES)
+    parser.add_argument("size", choices=list(SIZES))
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    print(generate(args.damage, SIZES[args.size], args.seed))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Benchmark del coste de la instrumentación con el logging desactivado.
+
+Mide, por token:
+  1. Un bucle vacío (referencia).
+  2. Un punto de log protegido (`if logger.debug_enabled:`), como en las rutas calientes.
+  3. Un punto de log sin proteger (`logger.debug(f"...")`), como antes de protegerlos.
+y lo compara con el coste de `Repair.parse` por token, para estimar qué fracción del
+tiempo total se va en instrumentación desactivada.
+
+Uso:
+    python -m benchmarks.logging_overhead [--members N] [--repeat R]
+"""
+import argparse
+import logging
+import time
+
+from pyparsejson.core.repair import Repair
+from pyparsejson.phases.tokenize import TolerantTokenizer
+from pyparsejson.utils.logger import RepairLogger
+
+
+def build_document(n_members: int) -> str:
+    """Documento con los defectos típicos: claves sin comillas, comillas simples, comas ausentes."""
+    members = []
+    for i in range(n_members):
+        members.append(f"key_{i}: 'valor {i}' " if i % 3 else f"key_{i}: {i}, ")
+    return "{" + "".join(members) + "}"
+
+
+def best_of(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def measure_points(tokens: list, repeat: int) -> dict:
+    logger = RepairLogger("pyparsejson.bench", level=logging.WARNING)
+
+    def empty():
+        for i, token in enumerate(tokens):
+            pass
+
+    def guarded():
+        for i, token in enumerate(tokens):
+            if logger.debug_enabled:
+                logger.debug(f"[FINALIZE] Token {i}: {token.type.name} = '{token.value}'")
+
+    def unguarded():
+        for i, token in enumerate(tokens):
+            logger.debug(f"[FINALIZE] Token {i}: {token.type.name} = '{token.value}'")
+
+    n = len(tokens)
+    return {name: best_of(fn, repeat) / n * 1e9
+            for name, fn in (("empty", empty), ("guarded", guarded), ("unguarded", unguarded))}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--members", type=int, default=2000, help="miembros del documento de prueba")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    text = build_document(args.members)
+    tokens = TolerantTokenizer().tokenize(text)
+    repair = Repair(log_level=logging.WARNING)
+
+    parse_ns = best_of(lambda: repair.parse(text), args.repeat) / len(tokens) * 1e9
+    points = measure_points(tokens, args.repeat * 4)
+    guard_ns = max(points["guarded"] - points["empty"], 0.0)
+    unguarded_ns = max(points["unguarded"] - points["empty"], 0.0)
+
+    print(f"tokens:                         {len(tokens)}")
+    print(f"Repair.parse por token:         {parse_ns:8.1f} ns")
+    print(f"punto protegido (desactivado):  {guard_ns:8.1f} ns  ({guard_ns / parse_ns:.2%} del parseo)")
+    print(f"punto sin proteger:             {unguarded_ns:8.1f} ns  ({unguarded_ns / parse_ns:.2%} del parseo)")
+
+
+if __name__ == "__main__":
+    main()
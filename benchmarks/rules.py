@@ -0,0 +1,287 @@
+"""
+Microbenchmarks de reglas sobre Contexts sintéticos.
+
+Construye listas de tokens directamente (sin pasar por el tokenizador) con una mezcla
+de defectos controlada (`MIXES`) y un tamaño exacto en tokens, y mide por separado
+`Rule.applies` y `Rule.apply` de cada regla de `RuleRegistry` y de las reglas que se
+pasen con `--rule modulo:Clase`. Para cada regla muestra:
+  - el tiempo de `applies()` y `apply()` en el tamaño mayor (µs) y los ns por token;
+  - el exponente de crecimiento (pendiente log-log entre tamaños: ~1 lineal, ~2 cuadrático);
+  - si la regla se dispara (`applies()` devuelve True) con esa mezcla;
+  - la curva de escalado (tiempo total por tamaño).
+
+Uso:
+    python -m benchmarks.rules [--mix mixed] [--sizes 1000,4000,16000] [--repeat 5]
+                               [--sort total] [--rule mi_paquete.reglas:MiRegla] [--filter Quote]
+                               [--out rules.json]
+"""
+import argparse
+import copy
+import gc
+import importlib
+import json
+import math
+import random
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence, Type
+
+import pyparsejson  # noqa: F401  (registra las reglas incluidas)
+from pyparsejson.core.context import Context
+from pyparsejson.core.token import Token, TokenType
+from pyparsejson.rules.base import Rule
+from pyparsejson.rules.registry import RuleRegistry
+
+DEFAULT_SIZES = (1_000, 4_000, 16_000)
+
+# Probabilidad de cada defecto por campo de registro
+DEFECTS = ("bare_key", "single_quotes", "equals", "missing_comma", "trailing_comma",
+           "tuple", "python_literal", "implicit_array", "free_text")
+
+MIXES: Dict[str, Dict[str, float]] = {
+    "clean": {},
+    "bare_keys": {"bare_key": 0.8, "single_quotes": 0.3},
+    "separators": {"equals": 0.5, "missing_comma": 0.4, "trailing_comma": 0.3},
+    "python": {"single_quotes": 0.6, "python_literal": 0.5, "tuple": 0.3, "bare_key": 0.2},
+    "values": {"implicit_array": 0.3, "free_text": 0.3, "python_literal": 0.3},
+    "mixed": {defect: 0.15 for defect in DEFECTS},
+}
+
+SORT_KEYS = ("name", "applies", "apply", "total", "ns_per_token", "exponent")
+
+
+def fit_exponent(sizes: Sequence[float], seconds: Sequence[float]) -> float:
+    """Pendiente por mínimos cuadrados de log(seconds) frente a log(sizes)."""
+    xs = [math.log(s) for s in sizes]
+    ys = [math.log(max(t, 1e-9)) for t in seconds]
+    mean_x, mean_y = sum(xs) / len(xs), sum(ys) / len(ys)
+    return (sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys))
+            / sum((x - mean_x) ** 2 for x in xs))
+
+
+def best_time(fn: Callable[[Any], Any], make_arg: Callable[[], Any], repeat: int = 5) -> float:
+    """Mejor de `repeat` mediciones de fn(make_arg()) con el GC desactivado; make_arg no se mide."""
+    best = math.inf
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            arg = make_arg()
+            start = time.perf_counter()
+            fn(arg)
+            best = min(best, time.perf_counter() - start)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return best
+
+
+class _TokenWriter:
+    """Acumula tokens con posiciones coherentes (un espacio entre tokens)."""
+
+    def __init__(self):
+        self.tokens: List[Token] = []
+        self.position = 0
+
+    def add(self, ttype: TokenType, value: str):
+        self.tokens.append(Token(ttype, value, value, self.position, 1, self.position + 1))
+        self.position += len(value) + 1
+
+
+def synthetic_tokens(size: int, mix: Dict[str, float], seed: int = 0) -> List[Token]:
+    """
+    Lista de aproximadamente `size` tokens: un array de registros `{clave: valor, ...}` en
+    el que cada campo sufre cada defecto de `mix` con la probabilidad indicada.
+    """
+    rng = random.Random(f"{sorted(mix.items())}:{size}:{seed}")
+    out = _TokenWriter()
+    out.add(TokenType.LBRACKET, "[")
+    record = 0
+
+    while record == 0 or len(out.tokens) < size - 1:
+        if record:
+            out.add(TokenType.COMMA, ",")
+        out.add(TokenType.LBRACE, "{")
+        fields = rng.randint(2, 5)
+        for field_index in range(fields):
+            has = {defect: rng.random() < p for defect, p in mix.items()}
+            key = f"k{field_index}"
+            if has.get("bare_key"):
+                out.add(TokenType.BARE_WORD, key)
+            else:
+                out.add(TokenType.STRING, f"'{key}'" if has.get("single_quotes") else f'"{key}"')
+            out.add(TokenType.ASSIGN, "=") if has.get("equals") else out.add(TokenType.COLON, ":")
+            _write_value(out, rng, has)
+            last = field_index == fields - 1
+            if not last and not has.get("missing_comma"):
+                out.add(TokenType.COMMA, ",")
+            elif last and has.get("trailing_comma"):
+                out.add(TokenType.COMMA, ",")
+        out.add(TokenType.RBRACE, "}")
+        record += 1
+
+    out.add(TokenType.RBRACKET, "]")
+    return out.tokens
+
+
+def _write_value(out: _TokenWriter, rng: random.Random, has: Dict[str, bool]):
+    number = str(rng.randint(0, 999))
+    if has.get("tuple"):
+        out.add(TokenType.LPAREN, "(")
+        out.add(TokenType.NUMBER, number)
+        out.add(TokenType.COMMA, ",")
+        out.add(TokenType.NUMBER, str(rng.randint(0, 999)))
+        out.add(TokenType.RPAREN, ")")
+    elif has.get("implicit_array"):
+        for i in range(3):
+            if i:
+                out.add(TokenType.COMMA, ",")
+            out.add(TokenType.NUMBER, str(rng.randint(0, 99)))
+    elif has.get("free_text"):
+        for word in rng.sample(["hola", "mundo", "valor", "libre", "texto"], 3):
+            out.add(TokenType.BARE_WORD, word)
+    elif has.get("python_literal"):
+        out.add(TokenType.BARE_WORD, rng.choice(["True", "False", "None"]))
+    elif has.get("single_quotes"):
+        out.add(TokenType.STRING, f"'v{number}'")
+    else:
+        out.add(TokenType.NUMBER, number)
+
+
+def synthetic_context(size: int, mix: str = "mixed", seed: int = 0) -> Context:
+    """Context con `synthetic_tokens(size, MIXES[mix], seed)` y su índice estructural ya construido."""
+    if mix not in MIXES:
+        raise ValueError(f"Unknown mix '{mix}'. Use one of: {', '.join(MIXES)}")
+    context = Context("")
+    context.tokens = synthetic_tokens(size, MIXES[mix], seed)
+    context.structure  # fuera de la medición: en el motor suele estar ya construido
+    return context
+
+
+def _fresh(template: Context) -> Context:
+    """Copia de `template` con tokens propios (apply() los muta in-place)."""
+    context = Context(template.initial_text)
+    context.tokens = [copy.copy(token) for token in template.tokens]
+    context.structure
+    return context
+
+
+def bench_rule(rule_cls: Type[Rule], contexts: Dict[int, Context], repeat: int = 5) -> Dict[str, Any]:
+    """Mide applies() y apply() de `rule_cls` en cada tamaño de `contexts`."""
+    rule = rule_cls()
+    sizes = sorted(contexts)
+    applies = [best_time(rule.applies, lambda size=size: _fresh(contexts[size]), repeat) for size in sizes]
+    apply = [best_time(rule.apply, lambda size=size: _fresh(contexts[size]), repeat) for size in sizes]
+    largest = contexts[sizes[-1]]
+    tokens = len(largest.tokens)
+    total = applies[-1] + apply[-1]
+    return {
+        "name": rule_cls.__name__,
+        "priority": rule_cls.priority,
+        "fires": bool(rule.applies(_fresh(largest))),
+        "tokens": [len(contexts[size].tokens) for size in sizes],
+        "applies": applies,
+        "apply": apply,
+        "total": total,
+        "ns_per_token": 1e9 * total / tokens,
+        "exponent": {
+            "applies": fit_exponent(sizes, applies),
+            "apply": fit_exponent(sizes, apply),
+        },
+    }
+
+
+def registered_rules() -> List[Type[Rule]]:
+    """Reglas registradas, sin duplicados, en orden de prioridad."""
+    return list(dict.fromkeys(RuleRegistry.get_rules("all")))
+
+
+def load_rule(path: str) -> Type[Rule]:
+    """Carga una regla de usuario a partir de 'modulo:Clase'."""
+    module_name, _, class_name = path.partition(":")
+    if not class_name:
+        raise ValueError(f"Expected 'module:Class', got '{path}'")
+    rule_cls = getattr(importlib.import_module(module_name), class_name)
+    if not (isinstance(rule_cls, type) and issubclass(rule_cls, Rule)):
+        raise TypeError(f"{path} is not a Rule subclass")
+    return rule_cls
+
+
+def run(rules: Optional[Sequence[Type[Rule]]] = None, sizes: Sequence[int] = DEFAULT_SIZES,
+        mix: str = "mixed", repeat: int = 5, seed: int = 0, sort: str = "total") -> List[Dict[str, Any]]:
+    """
+    Resultados de `bench_rule` para `rules` (por defecto, todas las registradas),
+    ordenados de mayor a menor por `sort` (alfabéticamente si sort="name").
+    """
+    if sort not in SORT_KEYS:
+        raise ValueError(f"Unknown sort key '{sort}'. Use one of: {', '.join(SORT_KEYS)}")
+    contexts = {size: synthetic_context(size, mix, seed) for size in sorted(sizes)}
+    results = [bench_rule(rule_cls, contexts, repeat) for rule_cls in (rules or registered_rules())]
+
+    if sort == "name":
+        return sorted(results, key=lambda r: r["name"])
+    if sort == "exponent":
+        return sorted(results, key=lambda r: max(r["exponent"].values()), reverse=True)
+    if sort in ("applies", "apply"):
+        return sorted(results, key=lambda r: r[sort][-1], reverse=True)
+    return sorted(results, key=lambda r: r[sort], reverse=True)
+
+
+def format_table(results: List[Dict[str, Any]]) -> str:
+    lines = [f"{'rule':34s} {'prio':>4s} {'fires':>5s} {'applies µs':>11s} {'apply µs':>10s} "
+             f"{'ns/token':>9s} {'k applies':>9s} {'k apply':>8s}"]
+    for r in results:
+        lines.append(f"{r['name']:34s} {r['priority']:>4d} {'yes' if r['fires'] else 'no':>5s} "
+                     f"{1e6 * r['applies'][-1]:>11.1f} {1e6 * r['apply'][-1]:>10.1f} "
+                     f"{r['ns_per_token']:>9.1f} {r['exponent']['applies']:>9.2f} {r['exponent']['apply']:>8.2f}")
+    return "\n".join(lines)
+
+
+def format_curves(results: List[Dict[str, Any]], sizes: Sequence[int]) -> str:
+    """Tiempo total (applies + apply, µs) de cada regla por tamaño."""
+    sizes = sorted(sizes)
+    lines = [f"{'rule':34s} " + " ".join(f"{size:>10d}" for size in sizes)]
+    for r in results:
+        totals = [1e6 * (a + b) for a, b in zip(r["applies"], r["apply"])]
+        lines.append(f"{r['name']:34s} " + " ".join(f"{t:>10.1f}" for t in totals))
+    return "\n".join(lines)
+
+
+def main(argv: Sequence[str] = None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--mix", default="mixed", choices=list(MIXES))
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)),
+                        type=lambda v: [int(s) for s in v.split(",") if s.strip()],
+                        help="Tamaños en tokens, separados por comas (al menos dos).")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--sort", default="total", choices=SORT_KEYS)
+    parser.add_argument("--rule", action="append", default=[], metavar="MODULE:CLASS",
+                        help="Regla de usuario a medir (repetible).")
+    parser.add_argument("--only-custom", action="store_true", help="No medir las reglas registradas.")
+    parser.add_argument("--filter", help="Solo reglas cuyo nombre contenga este texto.")
+    parser.add_argument("--out", help="Guarda los resultados en este archivo JSON.")
+    args = parser.parse_args(argv)
+    if len(args.sizes) < 2:
+        parser.error("--sizes needs at least two sizes to fit a growth exponent")
+
+    rules = [] if args.only_custom else registered_rules()
+    rules += [rule_cls for rule_cls in map(load_rule, args.rule) if rule_cls not in rules]
+    if args.filter:
+        rules = [rule_cls for rule_cls in rules if args.filter.lower() in rule_cls.__name__.lower()]
+    if not rules:
+        parser.error("no rules to benchmark")
+
+    results = run(rules, args.sizes, args.mix, args.repeat, args.seed, args.sort)
+    print(f"Mezcla '{args.mix}', tamaños {', '.join(map(str, sorted(args.sizes)))} tokens\n")
+    print(format_table(results))
+    print("\nCurvas de escalado (applies + apply, µs):")
+    print(format_curves(results, args.sizes))
+
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as fp:
+            json.dump({"mix": args.mix, "sizes": sorted(args.sizes), "results": results}, fp, indent=2)
+        print(f"\nResultados guardados en {args.out}")
+
+
+if __name__ == "__main__":
+    main()
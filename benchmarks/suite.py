@@ -0,0 +1,213 @@
+"""
+Suite de benchmarks de extremo a extremo sobre el corpus sintético (`benchmarks.corpus`).
+
+Para cada (clase de daño, tamaño) mide:
+  - latencia de `Repair.parse` (media y percentiles p50/p90/p99, en ms);
+  - tokens/segundo por fase, según `RepairReport.timings` (pre-normalización,
+    tokenización, bucle de reglas, construcción, json.loads, fallback, calidad);
+  - para la clase `valid`, la latencia de `json.loads` como referencia;
+  - con `--memory`, el pico y la memoria retenida por fase (tracemalloc, ver
+    `RepairReport.memory`) en una reparación adicional perfilada.
+
+Los resultados pueden guardarse en JSON (`--out`) y compararse entre ejecuciones con
+`python -m benchmarks.compare`.
+
+Uso:
+    python -m benchmarks.suite [--sizes 100B,1KB,10KB] [--damage bare_keys,tuples]
+                               [--repeat N] [--max-seconds S] [--seed S] [--memory] [--out results.json]
+    python -m benchmarks.suite --sizes all    # hasta 50 MB: puede tardar mucho
+"""
+import argparse
+import json
+import math
+import platform
+import sys
+import time
+from typing import Any, Dict, List, Sequence
+
+import pyparsejson
+from benchmarks.corpus import DAMAGE_CLASSES, SIZES, generate
+from pyparsejson.core.repair import Repair
+from pyparsejson.report.repair_report import PhaseTimings
+
+DEFAULT_SIZES = ("100B", "1KB", "10KB", "100KB")
+
+
+def percentile(samples: Sequence[float], q: float) -> float:
+    """Percentil `q` (0-100) por rango más cercano."""
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, math.ceil(q / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def profile_phases(pipeline: Repair, text: str) -> Dict[str, Any]:
+    """Repara `text` una vez y devuelve los tiempos por fase (s) de `RepairReport.timings`."""
+    report = pipeline.parse(text).evaluate_quality()
+    timings = report.timings
+    return {
+        "tokens": timings.tokens_before,
+        "tokens_after": timings.tokens_after,
+        "rule_evaluations": timings.rule_evaluations,
+        "seconds": timings.as_dict(),
+    }
+
+
+def profile_memory(text: str) -> Dict[str, Any]:
+    """Repara `text` con tracemalloc y devuelve pico/retenido por fase (bytes) de `RepairReport.memory`."""
+    memory = Repair(profile_memory=True).parse(text).memory.as_dict()
+    size = len(text.encode("utf-8"))
+    memory["peak_per_byte"] = memory["peak"] / size
+    memory["retained_per_byte"] = memory["retained"] / size
+    return memory
+
+
+def _latencies(fn, repeat: int, max_seconds: float) -> List[float]:
+    """Hasta `repeat` mediciones de `fn` (al menos una), sin pasar de `max_seconds` en total."""
+    samples = []
+    deadline = time.perf_counter() + max_seconds
+    while len(samples) < repeat and (not samples or time.perf_counter() < deadline):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def _summary(samples: Sequence[float]) -> Dict[str, float]:
+    return {
+        "runs": len(samples),
+        "mean_ms": 1000 * sum(samples) / len(samples),
+        "p50_ms": 1000 * percentile(samples, 50),
+        "p90_ms": 1000 * percentile(samples, 90),
+        "p99_ms": 1000 * percentile(samples, 99),
+    }
+
+
+def run_case(damage: str, size_label: str, repeat: int, max_seconds: float, seed: int = 0,
+             memory: bool = False) -> Dict[str, Any]:
+    text = generate(damage, SIZES[size_label], seed)
+    pipeline = Repair()
+
+    # Solo el último reporte: conservarlos todos hace crecer la memoria con repeat × tamaño
+    last = []
+
+    def parse():
+        last[:] = [pipeline.parse(text)]
+
+    latency = _summary(_latencies(parse, repeat, max_seconds))
+    phases = profile_phases(pipeline, text)
+    tokens = phases["tokens"]
+
+    result = {
+        "case": f"{damage}/{size_label}",
+        "damage": damage,
+        "size": size_label,
+        "chars": len(text),
+        "tokens": tokens,
+        "rule_evaluations": phases["rule_evaluations"],
+        "status": last[0].status.name,
+        "latency": latency,
+        "phases": {
+            phase: {
+                "ms": 1000 * seconds,
+                "tokens_per_sec": tokens / seconds if seconds > 0 else None,
+            }
+            for phase, seconds in phases["seconds"].items()
+        },
+    }
+
+    if damage == "valid":
+        baseline = _summary(_latencies(lambda: json.loads(text), repeat, max_seconds))
+        result["json_loads"] = baseline
+        result["slowdown_vs_json"] = latency["p50_ms"] / baseline["p50_ms"] if baseline["p50_ms"] else None
+    if memory:
+        result["memory"] = profile_memory(text)
+    return result
+
+
+def _kib(n: int) -> str:
+    return f"{n / 1024:.1f}"
+
+
+def format_memory(results: Sequence[Dict[str, Any]]) -> str:
+    """Tabla de pico/retenido por fase (KiB) de los casos perfilados con `--memory`."""
+    phases = [phase for phase in PhaseTimings.PHASES
+              if any(phase in r["memory"]["phases"] for r in results if "memory" in r)]
+    lines = [f"{'case':32s} {'peak':>9s} {'B/B':>6s} " + " ".join(f"{p[:12]:>14s}" for p in phases)
+             + f" {'diffs':>8s} {'issues':>8s}",
+             f"{'':32s} {'KiB':>9s} {'':>6s} " + " ".join(f"{'peak/ret KiB':>14s}" for _ in phases)]
+    for result in results:
+        memory = result.get("memory")
+        if memory is None:
+            continue
+        cells = []
+        for phase in phases:
+            usage = memory["phases"].get(phase)
+            cells.append(f"{_kib(usage['peak']) + '/' + _kib(usage['retained']):>14s}" if usage else f"{'-':>14s}")
+        lines.append(f"{result['case']:32s} {_kib(memory['peak']):>9s} {memory['peak_per_byte']:>6.0f} "
+                     + " ".join(cells) + f" {_kib(memory['report_diffs']):>8s} {_kib(memory['report_issues']):>8s}")
+    return "\n".join(lines)
+
+
+def _parse_list(value: str, allowed: Sequence[str], everything: Sequence[str]) -> List[str]:
+    if value == "all":
+        return list(everything)
+    items = [item.strip() for item in value.split(",") if item.strip()]
+    unknown = [item for item in items if item not in allowed]
+    if unknown:
+        raise argparse.ArgumentTypeError(f"unknown values: {', '.join(unknown)}")
+    return items
+
+
+def main(argv: Sequence[str] = None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default=",".join(DEFAULT_SIZES),
+                        type=lambda v: _parse_list(v, SIZES, SIZES), help="Tamaños separados por comas, o 'all'.")
+    parser.add_argument("--damage", default="all",
+                        type=lambda v: _parse_list(v, DAMAGE_CLASSES, DAMAGE_CLASSES),
+                        help="Clases de daño separadas por comas, o 'all'.")
+    parser.add_argument("--repeat", type=int, default=20, help="Mediciones por caso (como máximo).")
+    parser.add_argument("--max-seconds", type=float, default=5.0, help="Presupuesto de tiempo por caso.")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--memory", action="store_true",
+                        help="Añade pico y memoria retenida por fase (tracemalloc).")
+    parser.add_argument("--out", help="Guarda los resultados en este archivo JSON.")
+    args = parser.parse_args(argv)
+
+    results = []
+    print(f"{'case':32s} {'chars':>10s} {'tokens':>9s} {'p50 ms':>10s} {'p99 ms':>10s} "
+          f"{'tok/s loop':>12s}  status")
+    for size_label in args.sizes:
+        for damage in args.damage:
+            result = run_case(damage, size_label, args.repeat, args.max_seconds, args.seed, args.memory)
+            results.append(result)
+            rules_rate = result["phases"]["repair_loop"]["tokens_per_sec"] or 0
+            line = (f"{result['case']:32s} {result['chars']:>10d} {result['tokens']:>9d} "
+                    f"{result['latency']['p50_ms']:>10.2f} {result['latency']['p99_ms']:>10.2f} "
+                    f"{rules_rate:>12.0f}  {result['status']}")
+            if "slowdown_vs_json" in result:
+                line += f"  (x{result['slowdown_vs_json']:.0f} vs json.loads)"
+            print(line, flush=True)
+
+    if args.memory:
+        print("\nMemoria por fase (tracemalloc):")
+        print(format_memory(results))
+
+    if args.out:
+        payload = {
+            "meta": {
+                "version": pyparsejson.__version__,
+                "python": sys.version.split()[0],
+                "platform": platform.platform(),
+                "seed": args.seed,
+                "repeat": args.repeat,
+                "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            },
+            "results": results,
+        }
+        with open(args.out, "w", encoding="utf-8") as fp:
+            json.dump(payload, fp, indent=2)
+        print(f"\nResultados guardados en {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,21 +6,32 @@ Este módulo expone las funciones principales `load` y `loads`, diseñadas para
 reemplazos directos (drop-in replacements) de las funciones estándar de `json`,
 pero con capacidades avanzadas de recuperación de errores.
 """
+import asyncio
 import json
-from typing import TextIO, Any, Optional
+from concurrent.futures import Executor
+from typing import TextIO, BinaryIO, Any, Optional, Callable, Union
 
 from pyparsejson.core.repair import Repair
+from pyparsejson.batch import iter_load_lines, loads_many, loads_sharded
 from pyparsejson.core.flow import Flow
-from pyparsejson.report.repair_report import RepairStatus
+from pyparsejson.extract import find_all
+from pyparsejson.incremental import IncrementalRepair, iter_items
+from pyparsejson.report.repair_report import RepairReport, RepairStatus
+from pyparsejson.utils.aio import ASYNC_INLINE_LIMIT
 
 # Nota: Se eliminó la importación directa de JSONDecodeError para evitar conflictos con el manejo interno de excepciones.
 # La librería usa `raise json.JSONDecodeError` explícitamente cuando falla en modo strict.
 
 __version__ = "0.2.1"
-__all__ = ["load", "loads", "Repair", "Flow", "RepairStatus"]
+__all__ = ["load", "loads", "aloads", "loads_many", "loads_sharded", "iter_load_lines", "find_all", "repair_to", "IncrementalRepair", "iter_items", "Repair", "Flow", "RepairStatus"]
 
 
-def loads(text: str, *, auto_flows: bool = True, flow: Optional[Flow] = None, mode: str = "lax") -> Any:
+def loads(text: str, *, auto_flows: bool = True, flow: Optional[Flow] = None, mode: str = "lax",
+          salvage: bool = False,
+          object_hook: Optional[Callable[[dict], Any]] = None,
+          object_pairs_hook: Optional[Callable[[list], Any]] = None,
+          parse_float: Optional[Callable[[str], Any]] = None,
+          parse_int: Optional[Callable[[str], Any]] = None) -> Any:
     """
     Deserializa `text` (un string que contiene un documento JSON posiblemente roto)
     a un objeto Python.
@@ -34,6 +45,9 @@ def loads(text: str, *, auto_flows: bool = True, flow: Optional[Flow] = None, mo
         flow: Una instancia de Flow personalizada para sobrescribir el comportamiento.
         mode: "lax" (default) devuelve {} si falla la reparación.
               "strict" lanza json.JSONDecodeError si el resultado no es válido.
+        salvage: Si es True, para entradas truncadas devuelve el mayor objeto recuperable
+                 en lugar de {} (o de la excepción en modo strict).
+        object_hook, object_pairs_hook, parse_float, parse_int: Igual que en `json.loads`.
 
     Returns:
         El objeto Python resultante (dict, list, etc).
@@ -41,41 +55,53 @@ def loads(text: str, *, auto_flows: bool = True, flow: Optional[Flow] = None, mo
     Raises:
         json.JSONDecodeError: Si mode="strict" y no se pudo reparar el texto.
     """
+    pipeline = make_pipeline(auto_flows=auto_flows, flow=flow, mode=mode, salvage=salvage,
+                             object_hook=object_hook, object_pairs_hook=object_pairs_hook,
+                             parse_float=parse_float, parse_int=parse_int)
+    return pipeline.loads(text)
+
+
+async def aloads(text: str, *, executor: Optional[Executor] = None, cooperative: bool = False,
+                 inline_limit: int = ASYNC_INLINE_LIMIT, yield_every: int = 1,
+                 limiter: Optional[asyncio.Semaphore] = None, **options: Any) -> Any:
+    """
+    Versión asíncrona de `loads` para servicios asyncio.
+
+    Las entradas pequeñas (hasta `inline_limit` caracteres) se reparan inline; las
+    grandes se limitan con `limiter` y se ejecutan en `executor` o, con
+    `cooperative=True`, en el propio loop cediendo el control cada `yield_every` pasos.
+    Ver `Repair.aparse`.
+
+    Args:
+        **options: Las mismas opciones que `loads` (mode, salvage, hooks, ...).
+    """
+    pipeline = make_pipeline(**options)
+    return await pipeline.aloads(text, executor=executor, cooperative=cooperative, inline_limit=inline_limit,
+                                 yield_every=yield_every, limiter=limiter)
+
+
+def make_pipeline(*, auto_flows: bool = True, flow: Optional[Flow] = None, mode: str = "lax",
+                  salvage: bool = False, **decode_kwargs: Any) -> Repair:
+    """
+    Construye el pipeline que usa `loads`. Las APIs por lotes lo crean una vez por
+    worker y lo reutilizan para todos sus documentos.
+    """
     if mode not in ("lax", "strict"):
         raise ValueError(f"Invalid mode '{mode}'. Use 'lax' or 'strict'.")
 
-    if not isinstance(text, str):
-        # Intento de compatibilidad con json.loads que también acepta bytes
-        try:
-            text = text.decode('utf-8')
-        except AttributeError:
-            # Si no tiene decode, asumimos que ya es str o fallará más adelante
-            pass
-
-    # Inicializamos el motor de reparación
-    pipeline = Repair(auto_flows=auto_flows, mode=mode)
+    # loads() solo devuelve el objeto: no hace falta generar el texto JSON intermedio
+    pipeline = Repair(auto_flows=auto_flows, mode=mode, emit_json_text=False, salvage=salvage,
+                      **decode_kwargs)
 
     # Si el usuario proveyó un flujo personalizado, lo añadimos
     if flow:
         pipeline.add_flow(flow)
 
-    # Ejecutamos el parsing
-    report = pipeline.parse(text)
-
-    if report.success:
-        return report.python_object
-    else:
-        # Si fallamos, lanzamos la excepción estándar de Python para mantener compatibilidad
-        # con bloques try/except existentes en otros proyectos.
-        error_msg = report.errors[-1] if report.errors else "Unknown unrecoverable error"
-        raise json.JSONDecodeError(
-            msg=f"PyParseJson failed to repair input: {error_msg}",
-            doc=text,
-            pos=0
-        )
+    return pipeline
 
 
-def load(fp: TextIO, *, auto_flows: bool = True, flow: Optional[Flow] = None, mode: str = "lax") -> Any:
+def load(fp: TextIO, *, auto_flows: bool = True, flow: Optional[Flow] = None, mode: str = "lax",
+         **kwargs: Any) -> Any:
     """
     Deserializa `fp` (un archivo .read() soportado) a un objeto Python.
 
@@ -87,12 +113,42 @@ def load(fp: TextIO, *, auto_flows: bool = True, flow: Optional[Flow] = None, mo
         flow: Una instancia de Flow personalizada.
         mode: "lax" (default) devuelve {} si falla.
               "strict" lanza excepción si falla.
+        **kwargs: Hooks de decodificación aceptados por `loads` (object_hook, parse_float, ...).
 
     Returns:
         El objeto Python resultante.
     """
     text = fp.read()
-    return loads(text, auto_flows=auto_flows, flow=flow, mode=mode)
+    return loads(text, auto_flows=auto_flows, flow=flow, mode=mode, **kwargs)
+
+
+def repair_to(fp: Union[TextIO, BinaryIO], text: str, *, auto_flows: bool = True, flow: Optional[Flow] = None,
+              mode: str = "lax", chunk_size: int = 65536, binary: Optional[bool] = None) -> RepairReport:
+    """
+    Repara `text` y escribe el JSON resultante en `fp` por fragmentos, sin construir
+    el string completo ni el objeto Python. Pensado para pipelines de reparar-y-reenviar.
+
+    Args:
+        fp: Un objeto file-like que soporte .write() (texto o binario).
+        text: El string con el JSON a reparar.
+        auto_flows: Si es True (default), usa los flujos de reparación estándar.
+        flow: Una instancia de Flow personalizada.
+        mode: "lax" (default) escribe {} si falla.
+              "strict" lanza excepción si falla, sin escribir nada.
+        chunk_size: Tamaño aproximado de cada escritura, en caracteres.
+        binary: Fuerza escribir `bytes` UTF-8 (True) o `str` (False). Por defecto se deduce de `fp`.
+
+    Returns:
+        El RepairReport de la reparación.
+    """
+    if mode not in ("lax", "strict"):
+        raise ValueError(f"Invalid mode '{mode}'. Use 'lax' or 'strict'.")
+
+    pipeline = Repair(auto_flows=auto_flows, mode=mode)
+    if flow:
+        pipeline.add_flow(flow)
+
+    return pipeline.repair_to(fp, text, chunk_size=chunk_size, binary=binary)
 
 
 def __getattr__(name):
@@ -0,0 +1,7 @@
+# Path: pyparsejson\__main__.py
+import sys
+
+from pyparsejson.cli import main
+
+if __name__ == "__main__":
+    sys.exit(main())
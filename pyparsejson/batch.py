@@ -0,0 +1,318 @@
+# Path: pyparsejson\batch.py
+"""
+Reparación por lotes de muchos documentos pequeños.
+
+`loads_many` reparte los documentos en bloques entre un pool de hilos o procesos.
+`iter_load_lines` hace lo mismo con un archivo NDJSON / JSON Lines, en streaming, y
+`loads_sharded` con los elementos de un único array raíz enorme.
+Cada worker construye su pipeline una sola vez (en el initializer del pool) y lo
+reutiliza para todos los documentos que recibe.
+"""
+import copy
+import json
+import os
+import threading
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import IO, Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from pyparsejson import metrics
+from pyparsejson.core.flow import Flow
+from pyparsejson.core.repair import Repair
+from pyparsejson.core.segments import split_array
+from pyparsejson.report.repair_report import RepairStatus, RepairSummary
+
+# Pipeline del worker actual. En un pool de procesos es efectivamente global del
+# proceso; en un pool de hilos, cada hilo tiene el suyo.
+_worker_state = threading.local()
+
+_EXECUTORS = {"process": ProcessPoolExecutor, "thread": ThreadPoolExecutor}
+
+
+def _init_worker(options: Dict[str, Any]):
+    # Import diferido: pyparsejson/__init__.py importa este módulo
+    from pyparsejson import make_pipeline
+    _worker_state.pipeline = make_pipeline(**options)
+
+
+def _repair_one(pipeline: Repair, text: Union[str, bytes],
+                with_reports: bool = False) -> Tuple[bool, Any, Optional[RepairSummary]]:
+    """Devuelve (éxito, objeto o excepción, resumen si se pidió)."""
+    try:
+        if not with_reports:
+            return True, pipeline.loads(text), None
+        value, report = pipeline.loads_with_report(text)
+        return True, value, report.summary()
+    except Exception as e:
+        summary = RepairSummary(status=RepairStatus.FAILED_UNRECOVERABLE, errors=[str(e)]) if with_reports else None
+        return False, e, summary
+
+
+def _repair_chunk(texts: List[Union[str, bytes]],
+                  with_reports: bool = False) -> List[Tuple[bool, Any, Optional[RepairSummary]]]:
+    pipeline = _worker_state.pipeline
+    return [_repair_one(pipeline, text, with_reports) for text in texts]
+
+
+def loads_many(texts: Iterable[Union[str, bytes]], *, workers: Optional[int] = None, executor: str = "process",
+               chunksize: int = 64, return_exceptions: bool = True, auto_flows: bool = True,
+               flow: Optional[Flow] = None, mode: str = "lax", salvage: bool = False,
+               **decode_kwargs: Any) -> List[Any]:
+    """
+    Equivalente a `[pyparsejson.loads(t, ...) for t in texts]`, repartido entre varios workers.
+
+    Args:
+        texts: Documentos a reparar (str o bytes UTF-8).
+        workers: Número de workers. Por defecto `os.cpu_count()`. Con 1 (o si solo hay un
+            bloque) todo se procesa en el hilo actual, sin pool.
+        executor: "process" (default) o "thread". Con "process", `flow` y los hooks deben
+            poder serializarse con pickle.
+        chunksize: Documentos por bloque enviado a un worker; amortiza el coste de IPC/pickle.
+        return_exceptions: Si es True (default), un documento que falla deja la excepción en
+            su posición del resultado. Si es False, se relanza la primera.
+        auto_flows, flow, mode, salvage, **decode_kwargs: Igual que en `pyparsejson.loads`.
+
+    Returns:
+        Lista con un resultado (o excepción) por documento, en el orden de entrada. Los
+        documentos idénticos se reparan una sola vez; cada repetición recibe su propia copia.
+    """
+    if executor not in _EXECUTORS:
+        raise ValueError(f"Invalid executor '{executor}'. Use 'process' or 'thread'.")
+    if chunksize < 1:
+        raise ValueError("chunksize must be >= 1")
+
+    options = dict(decode_kwargs, auto_flows=auto_flows, flow=flow, mode=mode, salvage=salvage)
+
+    # Deduplicar: solo se envían los documentos distintos
+    positions: Dict[Union[str, bytes], int] = {}
+    unique: List[Union[str, bytes]] = []
+    order: List[int] = []
+    for text in texts:
+        position = positions.get(text)
+        if position is None:
+            position = positions[text] = len(unique)
+            unique.append(text)
+        order.append(position)
+
+    registry = metrics.get_registry()
+    if registry is not None:
+        registry.record_cache(hits=len(order) - len(unique), misses=len(unique))
+
+    chunks = [unique[i:i + chunksize] for i in range(0, len(unique), chunksize)]
+    workers = min(workers or os.cpu_count() or 1, len(chunks))
+
+    if workers <= 1:
+        from pyparsejson import make_pipeline
+        pipeline = make_pipeline(**options)
+        results = [_repair_one(pipeline, text) for text in unique]
+    else:
+        pool_cls = _EXECUTORS[executor]
+        with pool_cls(max_workers=workers, initializer=_init_worker, initargs=(options,)) as pool:
+            results = [result for chunk in pool.map(_repair_chunk, chunks) for result in chunk]
+
+    output = []
+    delivered = set()
+    for position in order:
+        ok, value, _ = results[position]
+        if not ok:
+            if not return_exceptions:
+                raise value
+        elif position in delivered:
+            # Repetición: copia independiente para que mutar un resultado no afecte a otro
+            value = copy.deepcopy(value)
+        delivered.add(position)
+        output.append(value)
+
+    return output
+
+
+def _iter_lines(fp: IO, block_size: int) -> Iterator[Union[str, bytes]]:
+    """Lee `fp` en bloques de `block_size` y produce las líneas sin el salto final."""
+    pending = None
+    while True:
+        block = fp.read(block_size)
+        if not block:
+            break
+        lines = block.split(b"\n" if isinstance(block, bytes) else "\n")
+        if pending is not None:
+            lines[0] = pending + lines[0]
+        pending = lines.pop()
+        yield from lines
+    if pending:
+        yield pending
+
+
+def iter_load_lines(fp: IO, *, workers: Optional[int] = None, executor: str = "process", chunksize: int = 256,
+                    max_in_flight: Optional[int] = None, with_reports: bool = False,
+                    return_exceptions: bool = True, block_size: int = 1 << 20, auto_flows: bool = True,
+                    flow: Optional[Flow] = None, mode: str = "lax", salvage: bool = False,
+                    **decode_kwargs: Any) -> Iterator[Any]:
+    """
+    Repara un archivo NDJSON / JSON Lines línea a línea, en streaming.
+
+    Las líneas que ya son JSON válido se decodifican directamente con `json.loads`
+    (camino rápido). El resto se agrupa en bloques de hasta `chunksize` líneas y se
+    repara en un pool de workers. Los resultados se producen en el orden del archivo,
+    y como mucho `max_in_flight` bloques están pendientes a la vez, así que la memoria
+    no depende del tamaño del archivo. Las líneas en blanco se omiten.
+
+    Args:
+        fp: Archivo (texto o binario) abierto para lectura.
+        workers: Número de workers. Por defecto `os.cpu_count()`. Con 1 todo se repara
+            en el hilo actual.
+        executor: "process" (default) o "thread".
+        chunksize: Líneas por bloque enviado a un worker.
+        max_in_flight: Bloques pendientes como máximo. Por defecto `2 * workers`.
+        with_reports: Si es True, produce tuplas `(resultado, RepairSummary)`; el resumen
+            incluye el número de línea (empezando en 1) y si se usó el camino rápido.
+        return_exceptions: Si es True (default), una línea que falla produce su excepción
+            en su posición. Si es False, se relanza.
+        block_size: Tamaño de cada lectura de `fp`.
+        auto_flows, flow, mode, salvage, **decode_kwargs: Igual que en `pyparsejson.loads`.
+
+    Yields:
+        Un resultado (o excepción, o tupla con resumen) por línea no vacía.
+    """
+    if executor not in _EXECUTORS:
+        raise ValueError(f"Invalid executor '{executor}'. Use 'process' or 'thread'.")
+    if chunksize < 1:
+        raise ValueError("chunksize must be >= 1")
+
+    options = dict(decode_kwargs, auto_flows=auto_flows, flow=flow, mode=mode, salvage=salvage)
+    workers = workers or os.cpu_count() or 1
+    max_in_flight = max_in_flight or 2 * workers
+
+    pool = None
+    pipeline = None
+    if workers > 1:
+        pool = _EXECUTORS[executor](max_workers=workers, initializer=_init_worker, initargs=(options,))
+    else:
+        from pyparsejson import make_pipeline
+        pipeline = make_pipeline(**options)
+
+    def submit(texts: List[Union[str, bytes]]):
+        if pool is not None:
+            return pool.submit(_repair_chunk, texts, with_reports)
+        return [_repair_one(pipeline, text, with_reports) for text in texts]
+
+    def emit(block):
+        line_numbers, results, slots, job = block
+        if slots:
+            repaired = job.result() if isinstance(job, Future) else job
+            for slot, result in zip(slots, repaired):
+                results[slot] = result
+        for line_number, (ok, value, summary) in zip(line_numbers, results):
+            if not ok and not return_exceptions:
+                raise value
+            if with_reports:
+                summary.line = line_number
+                yield value, summary
+            else:
+                yield value
+
+    registry = metrics.get_registry()
+    pending = deque()
+    try:
+        line_numbers, results, slots, to_repair = [], [], [], []
+        for line_number, text in enumerate(_iter_lines(fp, block_size), start=1):
+            if not text.strip():
+                continue
+
+            line_numbers.append(line_number)
+            try:
+                value = json.loads(text, **decode_kwargs)
+            except ValueError:
+                # JSONDecodeError (o bytes no UTF-8): al pipeline de reparación
+                slots.append(len(results))
+                to_repair.append(text)
+                results.append(None)
+            else:
+                fast = RepairSummary(status=RepairStatus.SUCCESS_STRICT_JSON, quality_score=1.0,
+                                     fast_path=True) if with_reports else None
+                results.append((True, value, fast))
+
+            if len(line_numbers) >= chunksize:
+                if registry is not None:
+                    registry.record_fast_path(hits=len(line_numbers) - len(slots), misses=len(slots))
+                pending.append((line_numbers, results, slots, submit(to_repair) if to_repair else None))
+                line_numbers, results, slots, to_repair = [], [], [], []
+                while len(pending) >= max_in_flight:
+                    yield from emit(pending.popleft())
+
+        if line_numbers:
+            if registry is not None:
+                registry.record_fast_path(hits=len(line_numbers) - len(slots), misses=len(slots))
+            pending.append((line_numbers, results, slots, submit(to_repair) if to_repair else None))
+        while pending:
+            yield from emit(pending.popleft())
+    finally:
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _shard_texts(text: str, bounds: Tuple[int, int, List[int]], shard_size: int) -> List[str]:
+    """Agrupa elementos consecutivos en shards de al menos `shard_size` caracteres, cada uno como array."""
+    start, end, commas = bounds
+    shards = []
+    shard_start = start
+    for comma in commas:
+        if comma - shard_start >= shard_size:
+            shards.append("[" + text[shard_start:comma] + "]")
+            shard_start = comma + 1
+    shards.append("[" + text[shard_start:end] + "]")
+    return shards
+
+
+def loads_sharded(text: Union[str, bytes], *, workers: Optional[int] = None, executor: str = "process",
+                  shard_size: int = 1 << 20, auto_flows: bool = True, flow: Optional[Flow] = None,
+                  mode: str = "lax", salvage: bool = False, **decode_kwargs: Any) -> Any:
+    """
+    Repara un array raíz enorme repartiendo sus elementos entre varios workers.
+
+    Un recorrido lineal localiza las comas de primer nivel (`split_array`); los
+    elementos se agrupan en shards de unos `shard_size` caracteres, cada shard se
+    repara como un array independiente con los flujos estándar y los resultados se
+    concatenan en orden. Si las fronteras son ambiguas, o algún shard no se repara
+    como array, se recurre a reparar el documento completo (igual que `loads`).
+
+    Args:
+        text: Documento (str o bytes UTF-8).
+        workers: Número de workers. Por defecto `os.cpu_count()`.
+        executor: "process" (default) o "thread".
+        shard_size: Tamaño mínimo de cada shard, en caracteres.
+        auto_flows, flow, mode, salvage, **decode_kwargs: Igual que en `pyparsejson.loads`.
+
+    Raises:
+        json.JSONDecodeError: Si mode="strict" y no se pudo reparar el texto.
+    """
+    if executor not in _EXECUTORS:
+        raise ValueError(f"Invalid executor '{executor}'. Use 'process' or 'thread'.")
+    if shard_size < 1:
+        raise ValueError("shard_size must be >= 1")
+
+    from pyparsejson import make_pipeline
+    options = dict(decode_kwargs, auto_flows=auto_flows, flow=flow, mode=mode, salvage=salvage)
+    text = Repair._decode_input(text)
+    workers = workers or os.cpu_count() or 1
+
+    bounds = split_array(text)
+    shards = _shard_texts(text, bounds, shard_size) if bounds is not None else []
+    if len(shards) < 2:
+        return make_pipeline(**options).loads(text)
+
+    chunks = [[shard] for shard in shards]
+    if workers <= 1:
+        pipeline = make_pipeline(**options)
+        results = [_repair_one(pipeline, shard) for shard in shards]
+    else:
+        with _EXECUTORS[executor](max_workers=min(workers, len(shards)), initializer=_init_worker,
+                                  initargs=(options,)) as pool:
+            results = [result for chunk in pool.map(_repair_chunk, chunks) for result in chunk]
+
+    output = []
+    for ok, value, _ in results:
+        if not ok or not isinstance(value, list):
+            # Un shard que no es un array reparable: la frontera no era fiable
+            return make_pipeline(**options).loads(text)
+        output.extend(value)
+    return output
@@ -0,0 +1,272 @@
+# Path: pyparsejson\cli.py
+"""
+Línea de comandos: `python -m pyparsejson`.
+
+Repara archivos, directorios (recursivamente) o stdin, repartiendo los archivos
+entre un pool de procesos. Cada worker lee su archivo, lo repara y escribe el
+resultado por fragmentos (`Repair.repair_to`) en un archivo temporal que luego
+renombra, así que una ejecución interrumpida nunca deja salidas a medias.
+
+Ejemplos:
+    python -m pyparsejson roto.json                   # resultado por stdout
+    python -m pyparsejson datos/ --out-dir reparados/ --jobs 8
+    python -m pyparsejson datos/ --in-place --manifest run.jsonl
+    cat roto.json | python -m pyparsejson -
+"""
+import argparse
+import fnmatch
+import io
+import json
+import os
+import stat
+import sys
+import tempfile
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from typing import Dict, Iterator, List, Optional, Sequence, TextIO, Tuple
+
+from pyparsejson.core.repair import Repair
+from pyparsejson.report.repair_report import RepairStatus
+
+# Estado registrado para archivos que no se pudieron leer o escribir
+ERROR_STATUS = "ERROR"
+_FAILED = {RepairStatus.FAILED_UNRECOVERABLE.name, RepairStatus.FAILURE_NO_STRUCTURE.name, ERROR_STATUS}
+
+_worker_pipeline: Optional[Repair] = None
+
+
+@dataclass
+class FileTask:
+    source: str
+    target: Optional[str]  # None: el resultado se devuelve para escribirlo en stdout
+
+
+@dataclass
+class FileResult:
+    path: str
+    status: str
+    size: int = 0
+    mtime_ns: int = 0
+    seconds: float = 0.0
+    error: str = ""
+    output: Optional[str] = None
+
+
+def _init_worker(mode: str, salvage: bool):
+    global _worker_pipeline
+    _worker_pipeline = Repair(auto_flows=True, mode=mode, salvage=salvage)
+
+
+def _target_mode(target: str) -> int:
+    """Permisos para `target`: los del archivo que se reemplaza o, si es nuevo, 0666 menos la umask."""
+    try:
+        return stat.S_IMODE(os.stat(target).st_mode)
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+
+def _write_atomic(target: str, text: str, pipeline: Repair) -> RepairStatus:
+    directory = os.path.dirname(target) or "."
+    os.makedirs(directory, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix=".pyparsejson-", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as out:
+            report = pipeline.repair_to(out, text)
+        # mkstemp crea el temporal con 0600
+        os.chmod(temp_path, _target_mode(target))
+        os.replace(temp_path, target)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+    return report.status
+
+
+def _repair_file(task: FileTask) -> FileResult:
+    start = time.perf_counter()
+    result = FileResult(path=task.source, status=ERROR_STATUS)
+    try:
+        with open(task.source, encoding="utf-8", errors="replace") as fp:
+            text = fp.read()
+        result.size = len(text)
+
+        try:
+            if task.target is None:
+                buffer = io.StringIO()
+                status = _worker_pipeline.repair_to(buffer, text).status
+                result.output = buffer.getvalue()
+            else:
+                status = _write_atomic(task.target, text, _worker_pipeline)
+        except json.JSONDecodeError as e:
+            # Modo strict: no se escribió nada
+            result.status = RepairStatus.FAILED_UNRECOVERABLE.name
+            result.error = e.msg
+        else:
+            result.status = status.name
+            result.mtime_ns = os.stat(task.source).st_mtime_ns
+    except OSError as e:
+        result.error = str(e)
+    result.seconds = time.perf_counter() - start
+    return result
+
+
+def _iter_sources(paths: Sequence[str], pattern: str) -> Iterator[Tuple[str, str]]:
+    """Produce (archivo, raíz) por cada archivo a reparar; `raíz` sirve para reflejar la estructura en --out-dir."""
+    for path in paths:
+        if os.path.isdir(path):
+            for dirpath, dirnames, filenames in os.walk(path):
+                dirnames.sort()
+                for name in sorted(filenames):
+                    if fnmatch.fnmatch(name, pattern):
+                        yield os.path.join(dirpath, name), path
+        else:
+            yield path, os.path.dirname(path)
+
+
+def _load_manifest(path: Optional[str]) -> Dict[str, dict]:
+    """Entradas ya completadas de un manifiesto previo, por ruta absoluta (la última gana)."""
+    entries: Dict[str, dict] = {}
+    if not path or not os.path.exists(path):
+        return entries
+    with open(path, encoding="utf-8") as fp:
+        for line in fp:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue  # línea cortada por una interrupción
+            entries[entry["path"]] = entry
+    return entries
+
+
+def _is_done(source: str, entry: Optional[dict]) -> bool:
+    if entry is None or entry.get("status") in _FAILED:
+        return False
+    try:
+        stat = os.stat(source)
+    except OSError:
+        return False
+    # En --in-place se registra el mtime tras reescribir, así que un archivo ya reparado
+    # también se reconoce
+    return entry.get("mtime_ns") == stat.st_mtime_ns
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m pyparsejson", description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("paths", nargs="*", default=["-"],
+                        help="Archivos o directorios a reparar ('-' o nada: stdin).")
+    output = parser.add_mutually_exclusive_group()
+    output.add_argument("-o", "--out-dir", help="Directorio de salida (refleja la estructura de la entrada).")
+    output.add_argument("-i", "--in-place", action="store_true", help="Sobrescribe cada archivo con su reparación.")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1, help="Procesos en paralelo.")
+    parser.add_argument("--glob", default="*.json", help="Patrón de archivos dentro de directorios (default: *.json).")
+    parser.add_argument("--manifest", help="Archivo JSON Lines de progreso; al relanzar se omiten los ya hechos.")
+    parser.add_argument("--mode", choices=("lax", "strict"), default="lax")
+    parser.add_argument("--salvage", action="store_true", help="Recupera el mayor prefijo de entradas truncadas.")
+    parser.add_argument("-q", "--quiet", action="store_true", help="No imprime el resumen final.")
+    return parser
+
+
+def _print_summary(results: List[FileResult], skipped: int, elapsed: float, stream: TextIO):
+    size = sum(r.size for r in results)
+    counts = Counter(r.status for r in results)
+    rate = len(results) / elapsed if elapsed > 0 else 0.0
+    throughput = size / elapsed / 1e6 if elapsed > 0 else 0.0
+
+    print(f"► ARCHIVOS: {len(results)} reparados, {skipped} omitidos (manifiesto)", file=stream)
+    print(f"► TIEMPO: {elapsed:.2f}s ({rate:.1f} archivos/s, {throughput:.2f} MB/s)", file=stream)
+    for status in [s.name for s in RepairStatus] + [ERROR_STATUS]:
+        if counts[status]:
+            print(f"  {status}: {counts[status]}", file=stream)
+    for result in results:
+        if result.error:
+            print(f"  ✗ {result.path}: {result.error}", file=stream)
+
+
+def _repair_stdin(args, stdout: TextIO) -> FileResult:
+    start = time.perf_counter()
+    text = sys.stdin.read()
+    pipeline = Repair(auto_flows=True, mode=args.mode, salvage=args.salvage)
+    result = FileResult(path="<stdin>", status=ERROR_STATUS, size=len(text))
+    try:
+        result.status = pipeline.repair_to(stdout, text).status.name
+        stdout.write("\n")
+    except json.JSONDecodeError as e:
+        result.status = RepairStatus.FAILED_UNRECOVERABLE.name
+        result.error = e.msg
+    result.seconds = time.perf_counter() - start
+    return result
+
+
+def main(argv: Optional[Sequence[str]] = None, stdout: TextIO = None, stderr: TextIO = None) -> int:
+    """
+    Punto de entrada de la CLI.
+
+    Returns:
+        0 si todas las entradas se repararon con éxito; 1 si alguna falló.
+    """
+    stdout = stdout or sys.stdout
+    stderr = stderr or sys.stderr
+    args = _build_parser().parse_args(argv)
+    if args.jobs < 1:
+        print("error: --jobs must be >= 1", file=stderr)
+        return 2
+
+    start = time.perf_counter()
+    if args.paths == ["-"]:
+        results = [_repair_stdin(args, stdout)]
+        skipped = 0
+    else:
+        done = _load_manifest(args.manifest)
+        tasks: List[FileTask] = []
+        skipped = 0
+        for source, root in _iter_sources(args.paths, args.glob):
+            if _is_done(os.path.abspath(source), done.get(os.path.abspath(source))):
+                skipped += 1
+                continue
+            if args.in_place:
+                target = source
+            elif args.out_dir:
+                target = os.path.join(args.out_dir, os.path.relpath(source, root or "."))
+            else:
+                target = None
+            tasks.append(FileTask(source, target))
+
+        results = []
+        manifest = open(args.manifest, "a", encoding="utf-8") if args.manifest else None
+        try:
+            for result in _run_tasks(tasks, args):
+                results.append(result)
+                if result.output is not None:
+                    stdout.write(result.output)
+                    stdout.write("\n")
+                    result.output = None
+                if manifest is not None:
+                    entry = asdict(result)
+                    entry["path"] = os.path.abspath(result.path)
+                    del entry["output"]
+                    manifest.write(json.dumps(entry) + "\n")
+                    manifest.flush()
+        finally:
+            if manifest is not None:
+                manifest.close()
+
+    if not args.quiet:
+        _print_summary(results, skipped, time.perf_counter() - start, stderr)
+
+    return 1 if any(r.status in _FAILED for r in results) else 0
+
+
+def _run_tasks(tasks: List[FileTask], args) -> Iterator[FileResult]:
+    """Resultados en el orden de `tasks`; con un solo archivo o `--jobs 1`, sin pool."""
+    if args.jobs == 1 or len(tasks) <= 1:
+        _init_worker(args.mode, args.salvage)
+        yield from map(_repair_file, tasks)
+        return
+
+    with ProcessPoolExecutor(max_workers=args.jobs, initializer=_init_worker,
+                             initargs=(args.mode, args.salvage)) as pool:
+        yield from pool.map(_repair_file, tasks)
@@ -1,7 +1,12 @@
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional
+from pyparsejson.core.hooks import RepairHooks
+from pyparsejson.core.structure import StructuralIndex
 from pyparsejson.core.token import Token
-from pyparsejson.report.repair_report import RepairReport, RepairModification
+from pyparsejson.report.repair_report import RepairReport, RepairModification, RuleStats
+
+if TYPE_CHECKING:
+    from pyparsejson.core.scheduler import AdaptiveRuleScheduler
 
 @dataclass
 class Context:
@@ -15,14 +20,58 @@ class Context:
     max_iterations: int = 10
     current_iteration: int = 0
     dry_run: bool = False
+    collect_rule_stats: bool = False
+    hooks: Optional[RepairHooks] = None
+    scheduler: Optional["AdaptiveRuleScheduler"] = None
+    # Se incrementa cada vez que los tokens pueden haber cambiado (ver `AdaptiveRuleScheduler`)
+    version: int = 0
+    # Clase de regla -> `version` en la que su applies() devolvió False
+    rejected_rules: Dict[type, int] = field(default_factory=dict, repr=False, compare=False)
     _changed: bool = False
+    _structure: Optional[StructuralIndex] = field(default=None, repr=False, compare=False)
 
     @property
     def changed(self) -> bool:
         return self._changed
 
+    @property
+    def structure(self) -> StructuralIndex:
+        """
+        Índice estructural de los tokens actuales (profundidad, parejas de llaves,
+        separadores, spans clave/valor). Se calcula bajo demanda en una pasada y se
+        reutiliza hasta que los tokens cambian.
+        """
+        index = self.cached_structure
+        if index is None:
+            index = StructuralIndex(self.tokens)
+            self._structure = index
+        return index
+
+    @property
+    def cached_structure(self) -> Optional[StructuralIndex]:
+        """El índice estructural si sigue vigente, sin construirlo."""
+        index = self._structure
+        if index is None or index.tokens is not self.tokens or index.size != len(self.tokens):
+            return None
+        return index
+
+    def detach(self) -> "Context":
+        """
+        Contexto mínimo con los tokens actuales (y su índice, si sigue vigente), sin el
+        texto de entrada ni el reporte: lo que necesita una evaluación posterior a la reparación.
+        """
+        detached = Context("", tokens=self.tokens)
+        detached._structure = self.cached_structure
+        return detached
+
+    def invalidate_structure(self):
+        self._structure = None
+        self.version += 1
+
     def mark_changed(self):
         self._changed = True
+        self._structure = None
+        self.version += 1
 
     def reset_changed_flag(self):
         self._changed = False
@@ -35,5 +84,11 @@ class Context:
         mod = RepairModification(rule_name=rule_name, diff=diff)
         self.report.modifications.append(mod)
 
+    def rule_stats(self, rule_name: str) -> RuleStats:
+        stats = self.report.rule_stats.get(rule_name)
+        if stats is None:
+            stats = self.report.rule_stats[rule_name] = RuleStats()
+        return stats
+
     def get_tokens_as_string(self) -> str:
         return "".join(t.value for t in self.tokens)
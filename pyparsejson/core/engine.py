@@ -1,10 +1,17 @@
 import copy
 import difflib
-from typing import List
+from time import perf_counter
+from typing import Generator, List, TypeVar
 from pyparsejson.core.context import Context
+from pyparsejson.core.hooks import RuleEdits
 from pyparsejson.rules.base import Rule
 from pyparsejson.rules.registry import RuleRegistry
 
+T = TypeVar("T")
+
+# Un "paso" cooperativo: cede None después de cada evaluación de regla y devuelve el resultado al final
+Steps = Generator[None, None, T]
+
 
 class RuleEngine:
     """
@@ -28,6 +35,15 @@ class RuleEngine:
             return diff_text[:200] + "..."
         return diff_text
 
+    @staticmethod
+    def drain(steps: Steps[T]) -> T:
+        """Ejecuta un generador de pasos hasta el final y devuelve su resultado."""
+        try:
+            while True:
+                next(steps)
+        except StopIteration as stop:
+            return stop.value
+
     @staticmethod
     def run_rules(context: Context, rules: List[Rule]) -> bool:
         """
@@ -40,17 +56,61 @@ class RuleEngine:
         Returns:
             True si alguna regla modificó el contexto.
         """
+        return RuleEngine.drain(RuleEngine.iter_rules(context, rules))
+
+    @staticmethod
+    def iter_rules(context: Context, rules: List[Rule]) -> Steps[bool]:
+        """
+        Versión cooperativa de `run_rules`: cede el control antes de evaluar cada regla.
+
+        Con `context.collect_rule_stats` activo acumula, por regla, llamadas y tiempo de
+        `applies()` / `apply()`, tokens recorridos y cambios en `context.report.rule_stats`.
+        Cualquier regla que pase por el motor (incluidas las registradas por el usuario)
+        queda contabilizada; desactivado, el coste es una comprobación por regla.
+        Si el contexto tiene hooks, se les notifica cada regla que cambia los tokens.
+        Con `context.scheduler` (modo adaptativo) es el planificador quien decide si hace
+        falta llamar a `applies()`; el orden de las reglas no cambia.
+        """
         context.reset_changed_flag()
+        collect_stats = context.collect_rule_stats
+        hooks = context.hooks
+        scheduler = context.scheduler
+        timed = collect_stats or hooks is not None
 
         for rule in rules:
-            if rule.applies(context):
+            yield
+            if collect_stats:
+                stats = context.rule_stats(rule.name)
+                stats.applies_calls += 1
+                stats.tokens_scanned += len(context.tokens)
+                start = perf_counter()
+                applies = rule.applies(context) if scheduler is None else scheduler.applies(rule, context)
+                stats.applies_seconds += perf_counter() - start
+            elif scheduler is not None:
+                applies = scheduler.applies(rule, context)
+            else:
+                applies = rule.applies(context)
+
+            if applies:
                 # 1. Capturar estado previo
                 # Nota: deepcopy puede ser costoso, pero es necesario para garantizar
                 # la integridad del diff y la detección precisa de cambios estructurales.
                 text_before = context.get_tokens_as_string()
+                tokens_before = len(context.tokens)
 
                 # 2. Ejecutar regla (mutación in-place)
-                rule.apply(context)
+                if timed:
+                    start = perf_counter()
+                    rule.apply(context)
+                    elapsed = perf_counter() - start
+                    if collect_stats:
+                        stats.apply_calls += 1
+                        stats.tokens_scanned += tokens_before
+                        stats.apply_seconds += elapsed
+                else:
+                    rule.apply(context)
+                # Las reglas pueden mutar tokens in-place: el índice estructural ya no es fiable
+                context.invalidate_structure()
 
                 # 3. Verificar cambios
                 text_after = context.get_tokens_as_string()
@@ -58,6 +118,8 @@ class RuleEngine:
                 if text_before != text_after:
                     context.mark_changed()
                     context.record_rule(rule.name)
+                    if collect_stats:
+                        stats.changes += 1
 
                     diff_preview = RuleEngine._generate_diff(text_before, text_after)
 
@@ -72,6 +134,11 @@ class RuleEngine:
                     else:
                         context.record_modification(rule.name, diff_preview)
 
+                    if hooks is not None:
+                        hooks.on_rule_applied(rule, RuleEdits(context.current_iteration, tokens_before,
+                                                              len(context.tokens), elapsed, diff_preview))
+
+        context.report.timings.rule_evaluations += len(rules)
         return context.changed
 
     @staticmethod
@@ -83,14 +150,17 @@ class RuleEngine:
         Returns:
             True si al menos una regla aplicó cambios.
         """
+        return RuleEngine.drain(RuleEngine.iter_flow(context, tags))
+
+    @staticmethod
+    def iter_flow(context: Context, tags: List[str]) -> Steps[bool]:
+        """Versión cooperativa de `run_flow`."""
         context.reset_changed_flag()
 
-        rules_to_run = set()
-        for tag in tags:
-            for rule_cls in RuleRegistry.get_rules(tag):
-                rules_to_run.add(rule_cls)
+        rules_to_run = (rule_cls for tag in tags for rule_cls in RuleRegistry.get_rules(tag))
 
-        # Instanciar y ordenar por prioridad (menor valor = mayor prioridad)
-        sorted_rules = sorted([cls() for cls in rules_to_run], key=lambda r: r.priority)
+        # Ordenar por prioridad (menor valor = mayor prioridad) e instanciar; a igual
+        # prioridad, orden de registro (ver `RuleRegistry.ordered`)
+        sorted_rules = [cls() for cls in RuleRegistry.ordered(rules_to_run)]
 
-        return RuleEngine.run_rules(context, sorted_rules)
+        return (yield from RuleEngine.iter_rules(context, sorted_rules))
@@ -1,7 +1,7 @@
 from abc import ABC, abstractmethod
 from typing import List, Optional
 from pyparsejson.core.context import Context
-from pyparsejson.core.engine import RuleEngine
+from pyparsejson.core.engine import RuleEngine, Steps
 from pyparsejson.core.rule_selector import RuleSelector
 
 
@@ -29,6 +29,15 @@ class Flow(ABC):
         """
         pass
 
+    def iter_execute(self, context: Context) -> Steps[bool]:
+        """
+        Versión cooperativa de `execute`, que cede el control entre evaluaciones de reglas
+        (ver `Repair.aparse`). Por defecto ejecuta `execute` de una vez, así que los flujos
+        propios siguen funcionando sin cambios; los flujos incluidos la sobrescriben.
+        """
+        yield from ()
+        return self.execute(context)
+
     def run_with_retries(self, context: Context, tags: List[str]) -> bool:
         """
         Ejecuta reglas seleccionadas por tags iterativamente mientras sigan produciendo cambios.
@@ -40,9 +49,13 @@ class Flow(ABC):
         Returns:
             True si hubo algún cambio en cualquiera de las pasadas.
         """
+        return self.engine.drain(self.iter_run_with_retries(context, tags))
+
+    def iter_run_with_retries(self, context: Context, tags: List[str]) -> Steps[bool]:
+        """Versión cooperativa de `run_with_retries`."""
         flow_changed = False
         for _ in range(self.max_passes):
-            changed_this_pass = self.engine.run_flow(context, tags)
+            changed_this_pass = yield from self.engine.iter_flow(context, tags)
             if changed_this_pass:
                 flow_changed = True
             else:
@@ -57,6 +70,10 @@ class Flow(ABC):
         Returns:
             True si hubo cambios.
         """
+        return self.engine.drain(self.iter_run(context))
+
+    def iter_run(self, context: Context) -> Steps[bool]:
+        """Versión cooperativa de `run`."""
         if not self.selector:
             return False
 
@@ -67,7 +84,7 @@ class Flow(ABC):
         rules = [cls() for cls in rule_classes]
 
         for _ in range(self.max_passes):
-            if self.engine.run_rules(context, rules):
+            if (yield from self.engine.iter_rules(context, rules)):
                 changed = True
             else:
                 break
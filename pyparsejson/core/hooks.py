@@ -0,0 +1,90 @@
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Optional, Sequence
+
+if TYPE_CHECKING:
+    from pyparsejson.rules.base import Rule
+
+
+@dataclass
+class RuleEdits:
+    """Cambios que una regla acaba de aplicar sobre los tokens (ver `RepairHooks.on_rule_applied`)."""
+    iteration: int
+    tokens_before: int
+    tokens_after: int
+    seconds: float
+    diff: str
+
+
+class RepairHooks:
+    """
+    Interfaz de hooks para observar el pipeline de reparación sin modificarlo.
+
+    Se hereda y se sobrescriben solo los métodos necesarios; los demás no hacen nada.
+    Se registran con `Repair(hooks=[...])`. Sin hooks registrados, cada punto de
+    enganche del pipeline cuesta una única comprobación `is not None`.
+
+    Fases (mismos nombres que `PhaseTimings`, más "parse" para la reparación completa):
+    parse, pre_normalize, tokenize, repair_loop, local_repair, build, finalize,
+    json_loads, fallback y quality. `tokens` es el número de tokens en ese momento
+    (0 antes de tokenizar).
+
+    Los hooks se llaman en el hilo que repara. Con executors de procesos (`loads_many`,
+    `aparse(executor=ProcessPoolExecutor())`) deben poder serializarse con pickle.
+    """
+
+    def on_phase_start(self, phase: str, tokens: int):
+        pass
+
+    def on_phase_end(self, phase: str, seconds: float, tokens: int):
+        pass
+
+    def on_rule_applied(self, rule: "Rule", edits: RuleEdits):
+        """Una regla modificó los tokens (no se llama si `apply()` los dejó igual)."""
+        pass
+
+    def on_iteration(self, iteration: int, changed: bool, seconds: float, tokens: int):
+        """Fin de una pasada del bucle de reparación."""
+        pass
+
+    def on_fallback(self, error: Optional[str], recovered: bool, salvaged: bool, seconds: float):
+        """
+        El JSON reparado no parseó y se aplicó la lógica de fallback. `error` es el último
+        error de parseo; `recovered` indica si el fallback obtuvo un objeto.
+        """
+        pass
+
+
+class HookChain(RepairHooks):
+    """Reenvía cada llamada a varios hooks, en orden de registro."""
+
+    def __init__(self, hooks: Sequence[RepairHooks]):
+        self.hooks = list(hooks)
+
+    def on_phase_start(self, phase: str, tokens: int):
+        for hook in self.hooks:
+            hook.on_phase_start(phase, tokens)
+
+    def on_phase_end(self, phase: str, seconds: float, tokens: int):
+        for hook in self.hooks:
+            hook.on_phase_end(phase, seconds, tokens)
+
+    def on_rule_applied(self, rule: "Rule", edits: RuleEdits):
+        for hook in self.hooks:
+            hook.on_rule_applied(rule, edits)
+
+    def on_iteration(self, iteration: int, changed: bool, seconds: float, tokens: int):
+        for hook in self.hooks:
+            hook.on_iteration(iteration, changed, seconds, tokens)
+
+    def on_fallback(self, error: Optional[str], recovered: bool, salvaged: bool, seconds: float):
+        for hook in self.hooks:
+            hook.on_fallback(error, recovered, salvaged, seconds)
+
+
+def combine_hooks(hooks: Optional[Sequence[RepairHooks]]) -> Optional[RepairHooks]:
+    """None si no hay hooks, el propio hook si hay uno, o un `HookChain`."""
+    if not hooks:
+        return None
+    if isinstance(hooks, RepairHooks):
+        return hooks
+    return hooks[0] if len(hooks) == 1 else HookChain(hooks)
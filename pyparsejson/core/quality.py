@@ -1,6 +1,6 @@
 from typing import List, Tuple
 from pyparsejson.core.context import Context
-from pyparsejson.core.token import TokenType, Token
+from pyparsejson.core.token import TokenType
 
 
 class RepairQualityEvaluator:
@@ -14,6 +14,13 @@ class RepairQualityEvaluator:
     WEIGHT_TOKENS = 0.3
     WEIGHT_SYNTAX = 0.3
 
+    # Máximo de problemas individuales (por token) descritos en texto.
+    # Pasado este límite se siguen contando para el score, pero no se formatean.
+    MAX_ISSUES = 20
+
+    _VALUE_TYPES = (TokenType.STRING, TokenType.NUMBER, TokenType.BOOLEAN, TokenType.NULL, TokenType.BARE_WORD)
+    _CLOSERS = (TokenType.RBRACE, TokenType.RBRACKET)
+
     def evaluate(self, context: Context) -> Tuple[float, List[str]]:
         """
         Calcula el score de calidad y detecta problemas potenciales.
@@ -27,9 +34,8 @@ class RepairQualityEvaluator:
         if not tokens:
             return 0.0, ["Empty input"]
 
-        balance_score = self._check_balance(tokens, issues)
-        token_score = self._check_tokens(tokens, issues)
-        syntax_score = self._check_syntax(tokens, issues)
+        balance_score = self._check_balance(context, issues)
+        token_score, syntax_score = self._scan_tokens(tokens, issues)
 
         final_score = (
             (balance_score * self.WEIGHT_BALANCE) +
@@ -39,72 +45,77 @@ class RepairQualityEvaluator:
         
         return round(final_score, 2), issues
 
-    def _check_balance(self, tokens: List[Token], issues: List[str]) -> float:
-        """Verifica el balance de llaves y corchetes."""
-        stack = []
-        errors = 0
-        
-        for t in tokens:
-            if t.type in (TokenType.LBRACE, TokenType.LBRACKET):
-                stack.append(t.type)
-            elif t.type in (TokenType.RBRACE, TokenType.RBRACKET):
-                if not stack:
-                    errors += 1
-                else:
-                    last = stack.pop()
-                    if (t.type == TokenType.RBRACE and last != TokenType.LBRACE) or \
-                       (t.type == TokenType.RBRACKET and last != TokenType.LBRACKET):
-                        errors += 1
-        
-        errors += len(stack)  # Elementos abiertos sin cerrar
-        
+    def _check_balance(self, context: Context, issues: List[str]) -> float:
+        """Verifica el balance de llaves y corchetes (a partir del índice estructural)."""
+        errors = context.structure.balance_errors
+
         if errors > 0:
             issues.append(f"Unbalanced structure: {errors} errors")
             return max(0.0, 1.0 - (errors * 0.1))
         return 1.0
 
-    def _check_tokens(self, tokens: List[Token], issues: List[str]) -> float:
-        """Detecta tokens desconocidos o sospechosos."""
+    def _scan_tokens(self, tokens, issues: List[str]) -> Tuple[float, float]:
+        """
+        Recorre los tokens UNA sola vez para detectar tokens desconocidos o sospechosos
+        y errores de sintaxis básicos (adyacencia ilegal de valores, coma antes de cierre).
+
+        Returns:
+            Una tupla (token_score, syntax_score).
+        """
+        value_types = self._VALUE_TYPES
+        closers = self._CLOSERS
+        max_issues = self.MAX_ISSUES
+
+        token_issues = []
+        omitted = 0
         bad_tokens = 0
-        total = len(tokens)
-        
+        syntax_errors = 0
+        prev_type = None
+
         for t in tokens:
-            if t.type == TokenType.UNKNOWN:
+            ttype = t.type
+
+            if ttype == TokenType.UNKNOWN:
                 bad_tokens += 1
-            elif t.type == TokenType.STRING:
+            elif ttype == TokenType.STRING:
                 val = t.value
                 # Detectar strings mal formados (ej: ""key"")
                 if val.count('"') > 2:
-                    issues.append(f"Suspicious string format: {val}")
                     bad_tokens += 0.5
+                    if len(token_issues) < max_issues:
+                        token_issues.append(f"Suspicious string format: {val}")
+                    else:
+                        omitted += 1
                 if not (val.startswith('"') and val.endswith('"')):
-                     issues.append(f"Unclosed string: {val}")
-                     bad_tokens += 1
-
-        if bad_tokens > 0:
-            issues.append(f"Invalid/Suspicious tokens: {bad_tokens}")
-            return max(0.0, 1.0 - (bad_tokens / total))
-        return 1.0
+                    bad_tokens += 1
+                    if len(token_issues) < max_issues:
+                        token_issues.append(f"Unclosed string: {val}")
+                    else:
+                        omitted += 1
 
-    def _check_syntax(self, tokens: List[Token], issues: List[str]) -> float:
-        """Detecta errores de sintaxis básicos como adyacencia ilegal de valores."""
-        syntax_errors = 0
-        value_types = (TokenType.STRING, TokenType.NUMBER, TokenType.BOOLEAN, TokenType.NULL, TokenType.BARE_WORD)
-        
-        for i in range(len(tokens) - 1):
-            curr = tokens[i]
-            next_t = tokens[i+1]
-            
             # Dos valores seguidos sin separador (ej: "key" "value")
-            if curr.type in value_types and next_t.type in value_types:
+            if prev_type in value_types and ttype in value_types:
                 syntax_errors += 1
-            
+
             # Coma seguida inmediatamente de cierre (trailing comma no estándar)
             # Nota: Aunque algunos parsers lo aceptan, aquí lo penalizamos ligeramente como "issue"
-            if curr.type == TokenType.COMMA and next_t.type in (TokenType.RBRACE, TokenType.RBRACKET):
+            if prev_type == TokenType.COMMA and ttype in closers:
                 syntax_errors += 1
 
+            prev_type = ttype
+
+        issues.extend(token_issues)
+        if omitted:
+            issues.append(f"... {omitted} more suspicious tokens omitted")
+
+        token_score = 1.0
+        if bad_tokens > 0:
+            issues.append(f"Invalid/Suspicious tokens: {bad_tokens}")
+            token_score = max(0.0, 1.0 - (bad_tokens / len(tokens)))
+
+        syntax_score = 1.0
         if syntax_errors > 0:
             issues.append(f"Syntax adjacency errors: {syntax_errors}")
-            return max(0.0, 1.0 - (syntax_errors * 0.05))
-        return 1.0
+            syntax_score = max(0.0, 1.0 - (syntax_errors * 0.05))
+
+        return token_score, syntax_score
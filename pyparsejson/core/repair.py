@@ -1,20 +1,34 @@
+import asyncio
+import io
 import json
 import logging
 import re
-from typing import List, Optional, Any
+from concurrent.futures import Executor
+from functools import partial
+from itertools import islice
+from time import perf_counter
+from typing import List, Optional, Any, Callable, Sequence, TextIO, BinaryIO, Union
 
+import pyparsejson.metrics as _metrics
 from pyparsejson.core.context import Context
-from pyparsejson.core.engine import RuleEngine
+from pyparsejson.core.engine import RuleEngine, Steps
 from pyparsejson.core.flow import Flow
+from pyparsejson.core.hooks import RepairHooks, combine_hooks
 from pyparsejson.core.quality import RepairQualityEvaluator
+from pyparsejson.core.scheduler import AdaptiveRuleScheduler
 from pyparsejson.core.token import TokenType, Token
 from pyparsejson.flows.bootstrap import BootstrapRepairFlow
 from pyparsejson.flows.presets import StandardJSONRepairFlow
 from pyparsejson.phases.json_finalize import JSONFinalize
+from pyparsejson.phases.local_repair import LocalRepairer
+from pyparsejson.phases.object_build import TokenObjectBuilder, TokenBuildError
 from pyparsejson.phases.pre_normalize import PreNormalizeText
+from pyparsejson.phases.salvage import TruncationSalvager
 from pyparsejson.phases.tokenize import TolerantTokenizer
-from pyparsejson.report.repair_report import RepairReport, RepairStatus
-from pyparsejson.utils.logger import RepairLogger
+from pyparsejson.report.repair_report import PhaseTimings, RepairReport, RepairStatus
+from pyparsejson.utils.aio import ASYNC_INLINE_LIMIT, default_limiter, drive
+from pyparsejson.utils.logger import EventSink, RepairLogger
+from pyparsejson.utils.memory import MemoryProfileHook
 
 
 class Repair:
@@ -23,8 +37,20 @@ class Repair:
     Coordina las fases de normalización, tokenización, aplicación de reglas y finalización.
     """
 
+    # Tokens por paso cooperativo durante la tokenización (ver `aparse`)
+    TOKEN_STEP = 1024
+
     def __init__(self, auto_flows: bool = True, dry_run: bool = False, debug: bool = False,
-                 log_level: int = logging.WARNING, mode: str = "lax"):
+                 log_level: int = logging.WARNING, mode: str = "lax", eager_quality: bool = False,
+                 emit_json_text: bool = True, object_hook: Optional[Callable[[dict], Any]] = None,
+                 object_pairs_hook: Optional[Callable[[List[tuple]], Any]] = None,
+                 parse_float: Optional[Callable[[str], Any]] = None,
+                 parse_int: Optional[Callable[[str], Any]] = None,
+                 event_sink: Optional[EventSink] = None, salvage: bool = False,
+                 local_repair: bool = False, collect_rule_stats: bool = False,
+                 hooks: Optional[Sequence[RepairHooks]] = None,
+                 metrics: Optional[_metrics.MetricsRegistry] = None, adaptive_rules: bool = False,
+                 profile_memory: bool = False):
         """
         Inicializa el motor de reparación.
 
@@ -33,17 +59,68 @@ class Repair:
             dry_run: Si es True, ejecuta en modo auditoría sin aplicar cambios finales.
             debug: Si es True, imprime información de debugging.
             mode: "lax" (default) devuelve {} si falla. "strict" lanza excepción.
+            eager_quality: Si es True, evalúa la calidad al terminar cada parseo. Por defecto
+                la evaluación (quality_score, detected_issues, status) se difiere hasta que
+                se lee alguno de esos campos del reporte.
+            emit_json_text: Si es False, no se genera `RepairReport.json_text` cuando el objeto
+                se construye directamente desde los tokens (solo se genera si hace falta el
+                camino de texto de respaldo).
+            object_hook, object_pairs_hook, parse_float, parse_int: Igual que en `json.loads`.
+            event_sink: Callable `(nombre, campos)` que recibe los eventos estructurados
+                (p. ej. `parse_failed`, `fallback`). Sin él, los eventos solo se emiten
+                como log DEBUG y no cuestan nada si ese nivel está desactivado.
+            salvage: Si es True, cuando el JSON reparado no parsea (típicamente entrada
+                truncada) se recupera el mayor prefijo válido en lugar de devolver {}.
+                El reporte queda con `salvaged=True` y status PARTIAL_REPAIR.
+            local_repair: Si es True, cuando tras el bucle de reparación los tokens aún no son
+                JSON estricto, se corrigen localmente alrededor de la posición del error
+                (ver `LocalRepairer`) antes de recurrir al fallback.
+            collect_rule_stats: Si es True, el motor registra por regla llamadas, tiempos,
+                tokens recorridos y cambios en `RepairReport.rule_stats`.
+            hooks: Instancias de `RepairHooks` que reciben el inicio y fin de cada fase,
+                las reglas aplicadas, las pasadas del bucle y el fallback (ver
+                `pyparsejson.core.hooks`; referencia en `pyparsejson.utils.tracing`).
+            metrics: `MetricsRegistry` donde agregar latencia, status, tamaño y reglas de cada
+                reparación. Por defecto se usa el registro del proceso si se activó con
+                `pyparsejson.metrics.enable()`; si no, no se registra nada.
+            adaptive_rules: Si es True, un `AdaptiveRuleScheduler` (en `self.scheduler`) acumula
+                la tasa de acierto y el coste de `applies()` de cada regla y evita las
+                evaluaciones cuyo resultado ya se conoce (tokens sin cambios o sin los tipos de
+                `Rule.requires`). La salida es idéntica a la del modo estático.
+            profile_memory: Si es True, cada reporte incluye en `memory` el pico y la memoria
+                retenida por fase medidos con tracemalloc (ver `PhaseMemory`). Fuerza la
+                evaluación de calidad dentro de la reparación y la hace varias veces más lenta.
         """
         self.engine = RuleEngine()
         self.pre_normalize = PreNormalizeText()
         self.tokenizer = TolerantTokenizer()
-        self.logger = RepairLogger("pyparsejson.repair", level=log_level)
+        self.logger = RepairLogger("pyparsejson.repair", level=log_level, event_sink=event_sink)
         self.finalizer = JSONFinalize(log_level)
         self.quality_evaluator = RepairQualityEvaluator()
+        self.builder = TokenObjectBuilder(object_hook=object_hook, object_pairs_hook=object_pairs_hook,
+                                          parse_float=parse_float, parse_int=parse_int)
+        # Argumentos equivalentes para el camino de texto (json.loads)
+        self._decode_kwargs = {k: v for k, v in (("object_hook", object_hook),
+                                                 ("object_pairs_hook", object_pairs_hook),
+                                                 ("parse_float", parse_float),
+                                                 ("parse_int", parse_int)) if v is not None}
 
         self.dry_run = dry_run
         self.debug = debug
         self.mode = mode
+        self.eager_quality = eager_quality
+        self.emit_json_text = emit_json_text
+        self.salvage = salvage
+        self.salvager = TruncationSalvager(self._decode_kwargs)
+        self.local_repair = local_repair
+        self.local_repairer = LocalRepairer(self.engine)
+        self.collect_rule_stats = collect_rule_stats
+        self.memory_profiler = MemoryProfileHook() if profile_memory else None
+        if self.memory_profiler is not None:
+            hooks = [self.memory_profiler, *([hooks] if isinstance(hooks, RepairHooks) else hooks or [])]
+        self.hooks = combine_hooks(hooks)
+        self.metrics = metrics
+        self.scheduler = AdaptiveRuleScheduler() if adaptive_rules else None
 
         self.bootstrap_flow = BootstrapRepairFlow(self.engine)
 
@@ -56,34 +133,111 @@ class Repair:
             print(f"[DEBUG] {message}")
 
     def _run(self, text: str, dry_run: bool = False) -> RepairReport:
+        return self.engine.drain(self._iter_run(text, dry_run))
+
+    def _iter_run(self, text: str, dry_run: bool = False) -> Steps[RepairReport]:
+        """
+        Pipeline completo como generador de pasos: cede el control cada `TOKEN_STEP`
+        tokens durante la tokenización y antes de cada evaluación de regla.
+        """
+        metrics = self.metrics or _metrics._active
+        if metrics is None:
+            return (yield from self._iter_pipeline(text, dry_run))
+
+        start = perf_counter()
+        try:
+            report = yield from self._iter_pipeline(text, dry_run)
+        except Exception:
+            metrics.observe_error(perf_counter() - start, len(text))
+            raise
+        metrics.observe_parse(report, perf_counter() - start, len(text))
+        return report
+
+    def _iter_pipeline(self, text: str, dry_run: bool) -> Steps[RepairReport]:
+        hooks = self.hooks
+        if hooks is not None:
+            parse_start = perf_counter()
+            hooks.on_phase_start("parse", 0)
+
+        context, early_report = yield from self._iter_repair_tokens(text, dry_run)
+        if early_report is not None:
+            if hooks is not None:
+                hooks.on_phase_end("parse", perf_counter() - parse_start, early_report.timings.tokens_after)
+            return self._attach_memory(early_report)
+
+        success, python_obj, final_json = self._build_object(context)
+
+        if not success:
+            self._debug_log("Parse failed, applying fallback logic")
+            success, python_obj, final_json = self._timed_fallback(context, success, python_obj, final_json)
+
+        self._finalize_report(context, success, python_obj, final_json)
+
+        if hooks is not None:
+            hooks.on_phase_end("parse", perf_counter() - parse_start, len(context.tokens))
+        return self._attach_memory(context.report)
+
+    def _attach_memory(self, report: RepairReport) -> RepairReport:
+        if self.memory_profiler is not None:
+            report.memory = self.memory_profiler.collect(report)
+        return report
+
+    def _repair_tokens(self, text: str, dry_run: bool) -> tuple[Optional[Context], Optional[RepairReport]]:
+        return self.engine.drain(self._iter_repair_tokens(text, dry_run))
+
+    def _iter_repair_tokens(self, text: str, dry_run: bool) -> Steps[tuple[Optional[Context], Optional[RepairReport]]]:
+        """
+        Normaliza, tokeniza y ejecuta el bucle de reparación. Devuelve el contexto con los
+        tokens reparados, o un reporte final si la entrada está vacía o no tiene estructura.
+        """
+        hooks = self.hooks
+        timings = PhaseTimings()
+        if hooks is not None:
+            hooks.on_phase_start("pre_normalize", 0)
+        start = perf_counter()
         clean_text = self.pre_normalize.process(text)
-        self._debug_log(f"Pre-normalized text: {clean_text[:100]}...")
+        timings.pre_normalize = perf_counter() - start
+        if hooks is not None:
+            hooks.on_phase_end("pre_normalize", timings.pre_normalize, 0)
+        if self.debug:
+            self._debug_log(f"Pre-normalized text: {clean_text[:100]}...")
 
         if not clean_text:
-            return RepairReport(
+            return None, RepairReport(
                 success=True,
                 status=RepairStatus.SUCCESS_EMPTY_INPUT,
                 json_text="{}",
                 python_object={},
                 quality_score=0.0,
                 iterations=0,
-                applied_rules=[]
+                applied_rules=[],
+                timings=timings
             )
 
-        context = Context(clean_text)
-        context.tokens = self.tokenizer.tokenize(clean_text)
+        context = Context(clean_text, collect_rule_stats=self.collect_rule_stats, hooks=hooks,
+                          scheduler=self.scheduler)
+        context.report.timings = timings
+        if hooks is not None:
+            hooks.on_phase_start("tokenize", 0)
+        start = perf_counter()
+        context.tokens = yield from self._iter_tokenize(clean_text)
+        timings.tokenize = perf_counter() - start
+        timings.tokens_before = timings.tokens_after = len(context.tokens)
+        if hooks is not None:
+            hooks.on_phase_end("tokenize", timings.tokenize, timings.tokens_before)
         context.dry_run = dry_run
         context.report.was_dry_run = dry_run
 
-        self._debug_log(
-            f"Initial tokens ({len(context.tokens)}): {[f'{t.type.name}:{t.value}' for t in context.tokens[:10]]}")
+        if self.debug:
+            self._debug_log(
+                f"Initial tokens ({len(context.tokens)}): {[f'{t.type.name}:{t.value}' for t in context.tokens[:10]]}")
 
-        has_structure = any(t.type in (TokenType.LBRACE, TokenType.LBRACKET, TokenType.COLON, TokenType.ASSIGN)
-                            for t in context.tokens)
+        has_structure = context.structure.has_any(TokenType.LBRACE, TokenType.LBRACKET,
+                                                  TokenType.COLON, TokenType.ASSIGN)
 
         if not has_structure:
             self._debug_log("No structure detected, returning empty object")
-            return RepairReport(
+            return None, RepairReport(
                 success=False,
                 status=RepairStatus.FAILURE_NO_STRUCTURE,
                 json_text="{}",
@@ -91,75 +245,179 @@ class Repair:
                 quality_score=0.0,
                 iterations=0,
                 applied_rules=[],
-                detected_issues=["⚠️ No JSON structure detected in input"]
+                detected_issues=["⚠️ No JSON structure detected in input"],
+                timings=timings
             )
 
-        self._execute_repair_loop(context)
-
-        self._debug_log(f"After repair loop: {len(context.tokens)} tokens")
-
-        final_json = self.finalizer.process(context)
-        self._debug_log(f"Finalized JSON: {final_json}")
-
-        success, python_obj = self._attempt_parse(final_json, context)
-
-        if not success:
-            self._debug_log("Parse failed, applying fallback logic")
-            success, python_obj, final_json = self._apply_fallback_if_needed(context, success, python_obj, final_json)
-
-        self._finalize_report(context, success, python_obj, final_json)
-
-        return context.report
+        if hooks is not None:
+            hooks.on_phase_start("repair_loop", timings.tokens_before)
+        start = perf_counter()
+        yield from self._iter_repair_loop(context)
+        timings.repair_loop = perf_counter() - start
+        if hooks is not None:
+            hooks.on_phase_end("repair_loop", timings.repair_loop, len(context.tokens))
 
-    def _execute_repair_loop(self, context: Context):
+        if self.debug:
+            self._debug_log(f"After repair loop: {len(context.tokens)} tokens")
+
+        if self.local_repair:
+            if hooks is not None:
+                hooks.on_phase_start("local_repair", len(context.tokens))
+            start = perf_counter()
+            fixed = self.local_repairer.repair(context)
+            timings.local_repair = perf_counter() - start
+            if hooks is not None:
+                hooks.on_phase_end("local_repair", timings.local_repair, len(context.tokens))
+            if self.logger.events_enabled:
+                self.logger.event("local_repair", fixed=fixed, tokens=len(context.tokens))
+
+        timings.tokens_after = len(context.tokens)
+        return context, None
+
+    def _iter_tokenize(self, text: str) -> Steps[List[Token]]:
+        tokens: List[Token] = []
+        iterator = self.tokenizer.iter_tokens(text)
+        while True:
+            batch = list(islice(iterator, self.TOKEN_STEP))
+            tokens.extend(batch)
+            if len(batch) < self.TOKEN_STEP:
+                return tokens
+            yield
+
+    def _iter_repair_loop(self, context: Context) -> Steps[None]:
+        hooks = context.hooks
         while context.current_iteration < context.max_iterations:
             context.current_iteration += 1
             any_changed = False
+            if hooks is not None:
+                iteration_start = perf_counter()
 
-            self._debug_log(f"Iteration {context.current_iteration}")
+            if self.debug:
+                self._debug_log(f"Iteration {context.current_iteration}")
 
-            if self.bootstrap_flow.execute(context):
+            if (yield from self.bootstrap_flow.iter_execute(context)):
                 any_changed = True
-                self._debug_log(f"Bootstrap changed tokens: {len(context.tokens)}")
+                if self.debug:
+                    self._debug_log(f"Bootstrap changed tokens: {len(context.tokens)}")
 
             for flow in self.user_flows:
-                if flow.execute(context):
+                if (yield from flow.iter_execute(context)):
                     any_changed = True
-                    self._debug_log(f"Flow {flow.__class__.__name__} changed tokens")
+                    if self.debug:
+                        self._debug_log(f"Flow {flow.__class__.__name__} changed tokens")
+
+            if hooks is not None:
+                hooks.on_iteration(context.current_iteration, any_changed, perf_counter() - iteration_start,
+                                   len(context.tokens))
 
             if not any_changed:
-                self._debug_log(f"Converged at iteration {context.current_iteration}")
+                if self.debug:
+                    self._debug_log(f"Converged at iteration {context.current_iteration}")
                 break
 
-    @staticmethod
-    def _attempt_parse(json_text: str, context: Context) -> tuple[bool, Any]:
+    def _build_object(self, context: Context) -> tuple[bool, Any, str]:
+        """
+        Construye el objeto directamente desde los tokens. Si los tokens no forman JSON
+        estricto, recurre al camino de texto (JSONFinalize + json.loads), que registra el
+        error exacto y alimenta la lógica de fallback.
+        """
+        timings = context.report.timings
+        hooks = context.hooks
+        if hooks is not None:
+            hooks.on_phase_start("build", len(context.tokens))
+        start = perf_counter()
         try:
-            obj = json.loads(json_text)
+            python_obj = self.builder.build(context.tokens)
+        except TokenBuildError:
+            timings.build = perf_counter() - start
+            if hooks is not None:
+                hooks.on_phase_end("build", timings.build, len(context.tokens))
+            final_json = self._finalize_text(context)
+            if self.debug:
+                self._debug_log(f"Finalized JSON: {final_json}")
+            success, python_obj = self._attempt_parse(final_json, context)
+            return success, python_obj, final_json
+
+        timings.build = perf_counter() - start
+        if hooks is not None:
+            hooks.on_phase_end("build", timings.build, len(context.tokens))
+        final_json = self._finalize_text(context) if self.emit_json_text else ""
+        return True, python_obj, final_json
+
+    def _finalize_text(self, context: Context) -> str:
+        hooks = context.hooks
+        if hooks is not None:
+            hooks.on_phase_start("finalize", len(context.tokens))
+        start = perf_counter()
+        final_json = self.finalizer.process(context)
+        context.report.timings.finalize = perf_counter() - start
+        if hooks is not None:
+            hooks.on_phase_end("finalize", context.report.timings.finalize, len(context.tokens))
+        return final_json
+
+    def _timed_fallback(self, context: Context, success: bool, python_obj: Any, final_json: str):
+        """`_apply_fallback_if_needed` con su tiempo en `timings.fallback` y notificación a los hooks."""
+        hooks = context.hooks
+        if hooks is not None:
+            hooks.on_phase_start("fallback", len(context.tokens))
+        start = perf_counter()
+        result = self._apply_fallback_if_needed(context, success, python_obj, final_json)
+        elapsed = context.report.timings.fallback = perf_counter() - start
+        if hooks is not None:
+            hooks.on_phase_end("fallback", elapsed, len(context.tokens))
+        return result
+
+    def _attempt_parse(self, json_text: str, context: Context) -> tuple[bool, Any]:
+        hooks = context.hooks
+        if hooks is not None:
+            hooks.on_phase_start("json_loads", len(context.tokens))
+        start = perf_counter()
+        try:
+            obj = json.loads(json_text, **self._decode_kwargs)
             return True, obj
         except json.JSONDecodeError as e:
-            print(f"[FALLA] JSONDecodeError al intentar parsear: {repr(json_text)}")
+            if self.logger.events_enabled:
+                self.logger.event("parse_failed", error=e.msg, pos=e.pos, lineno=e.lineno,
+                                  colno=e.colno, length=len(json_text),
+                                  excerpt=json_text[max(0, e.pos - 40):e.pos + 40])
             context.report.errors.append(str(e))
             return False, None
+        finally:
+            elapsed = perf_counter() - start
+            context.report.timings.json_loads += elapsed
+            if hooks is not None:
+                hooks.on_phase_end("json_loads", elapsed, len(context.tokens))
 
     def _apply_fallback_if_needed(self, context: Context, success: bool, python_obj: Any, final_json: str):
         if success:
             return success, python_obj, final_json
+        start = perf_counter()
 
-        self._debug_log(f"Parse failed. Input: '{final_json}'")
+        if self.debug:
+            self._debug_log(f"Parse failed. Input: '{final_json}'")
 
         is_structurally_incomplete = False
-        if re.search(r'\{\s*$', final_json.strip()) or re.search(r'\}\s*\.\.\.', final_json):
+        if self.salvage:
+            # Prefijo válido más largo con el sufijo de cierre exacto (una pasada)
+            salvaged, salvaged_obj, salvaged_json = self.salvager.salvage(final_json)
+            if salvaged:
+                context.report.salvaged = True
+                context.report.detected_issues.append(
+                    f"⚠️ Salvage: JSON truncado recuperado ({len(salvaged_json)} de {len(final_json)} caracteres)"
+                )
+                success, python_obj, final_json = True, salvaged_obj, salvaged_json
+        elif re.search(r'\{\s*$', final_json.strip()) or re.search(r'\}\s*\.\.\.', final_json):
             is_structurally_incomplete = True
 
         if is_structurally_incomplete:
             self._debug_log("Detected incomplete JSON, attempting to fix...")
             try:
                 try:
-                    json.loads(final_json + "}")
+                    python_obj = json.loads(final_json + "}", **self._decode_kwargs)
                     final_json = final_json + "}"
                     success = True
-                    python_obj = json.loads(final_json)
-                    self._debug_log(f"Fixed incomplete JSON: {final_json}")
+                    if self.debug:
+                        self._debug_log(f"Fixed incomplete JSON: {final_json}")
                 except:
                     final_json = "{}"
                     python_obj = {}
@@ -171,6 +429,13 @@ class Repair:
         else:
             pass
 
+        if self.logger.events_enabled:
+            self.logger.event("fallback", mode=self.mode, incomplete=is_structurally_incomplete,
+                              salvaged=context.report.salvaged, recovered=success)
+        if context.hooks is not None:
+            error = context.report.errors[-1] if context.report.errors else None
+            context.hooks.on_fallback(error, success, context.report.salvaged, perf_counter() - start)
+
         if self.mode == "strict":
             if not success:
                 self._debug_log("Strict mode enabled, raising exception")
@@ -202,32 +467,53 @@ class Repair:
             context.report.detected_issues.append("⚠️ Fallback: Forzado '{}' debido a JSON incompleto inválido.")
             return
 
-        quality_score, issues = self.quality_evaluator.evaluate(context)
-
         context.report.success = success
-        context.report.quality_score = quality_score
-        context.report.detected_issues.extend(issues)
         context.report.json_text = final_json
         context.report.python_object = python_obj
         context.report.iterations = context.current_iteration
 
-        if success:
-            if python_obj == {}:
-                if not context.report.applied_rules:
-                     context.report.status = RepairStatus.SUCCESS_STRICT_JSON
+        # La evaluación de calidad (y el status que depende de ella) solo se calcula
+        # cuando alguien la consulta: loads() nunca la necesita. Lo diferido retiene solo
+        # los tokens finales, no el contexto (texto de entrada) ni el pipeline.
+        context.report.defer(partial(type(self)._evaluate_quality, self.quality_evaluator, context.hooks,
+                                     context.detach()))
+        # El perfil de memoria incluye la fase de calidad: se evalúa dentro de la reparación
+        if self.eager_quality or self.memory_profiler is not None:
+            context.report.evaluate_quality()
+
+    @staticmethod
+    def _evaluate_quality(evaluator: RepairQualityEvaluator, hooks: Optional[RepairHooks], context: Context,
+                          report: RepairReport):
+        if hooks is not None:
+            hooks.on_phase_start("quality", len(context.tokens))
+        start = perf_counter()
+        quality_score, issues = evaluator.evaluate(context)
+        report.timings.quality = perf_counter() - start
+        if hooks is not None:
+            hooks.on_phase_end("quality", report.timings.quality, len(context.tokens))
+
+        report.quality_score = quality_score
+        report.detected_issues.extend(issues)
+
+        if report.success:
+            if report.salvaged:
+                report.status = RepairStatus.PARTIAL_REPAIR
+            elif report.python_object == {}:
+                if not report.applied_rules:
+                     report.status = RepairStatus.SUCCESS_STRICT_JSON
                 else:
-                    context.report.status = RepairStatus.SUCCESS_WITH_WARNINGS
-                    if "No JSON structure detected" not in str(context.report.detected_issues):
-                        context.report.detected_issues.append("Returned empty object after repair")
+                    report.status = RepairStatus.SUCCESS_WITH_WARNINGS
+                    if "No JSON structure detected" not in str(report.detected_issues):
+                        report.detected_issues.append("Returned empty object after repair")
             elif quality_score < 1.0:
-                context.report.status = RepairStatus.SUCCESS_WITH_WARNINGS
+                report.status = RepairStatus.SUCCESS_WITH_WARNINGS
             else:
-                context.report.status = RepairStatus.SUCCESS_STRICT_JSON
+                report.status = RepairStatus.SUCCESS_STRICT_JSON
         else:
-            if context.report.applied_rules:
-                context.report.status = RepairStatus.PARTIAL_REPAIR
+            if report.applied_rules:
+                report.status = RepairStatus.PARTIAL_REPAIR
             else:
-                context.report.status = RepairStatus.FAILED_UNRECOVERABLE
+                report.status = RepairStatus.FAILED_UNRECOVERABLE
 
     def add_flow(self, flow: Flow):
         if not hasattr(flow, "engine") or flow.engine is None:
@@ -250,3 +536,180 @@ class Repair:
         """
         effective_dry_run = self.dry_run if dry_run is None else dry_run
         return self._run(text, dry_run=effective_dry_run)
+
+    def loads(self, text: Union[str, bytes]) -> Any:
+        """
+        Repara `text` y devuelve solo el objeto Python, con la semántica de
+        `pyparsejson.loads` (acepta bytes UTF-8; lanza si la reparación falla).
+
+        Raises:
+            json.JSONDecodeError: Si no se pudo reparar el texto.
+        """
+        return self.loads_with_report(text)[0]
+
+    def loads_with_report(self, text: Union[str, bytes]) -> tuple[Any, RepairReport]:
+        """
+        Como `loads`, pero devuelve también el RepairReport.
+
+        Raises:
+            json.JSONDecodeError: Si no se pudo reparar el texto.
+        """
+        text = self._decode_input(text)
+        report = self.parse(text)
+        return self._object_or_raise(report, text), report
+
+    async def aparse(self, text: str, dry_run: Optional[bool] = None, *, executor: Optional[Executor] = None,
+                     cooperative: bool = False, inline_limit: int = ASYNC_INLINE_LIMIT, yield_every: int = 1,
+                     limiter: Optional[asyncio.Semaphore] = None) -> RepairReport:
+        """
+        Versión asíncrona de `parse` para servicios asyncio.
+
+        - Entradas de hasta `inline_limit` caracteres se reparan inline.
+        - Las mayores esperan plaza en `limiter` (por defecto, un semáforo compartido por
+          el event loop; ver `pyparsejson.utils.aio`), de modo que unas pocas entradas
+          enormes no acaparan todos los recursos. Luego:
+            * con `cooperative=True` se reparan en el propio loop, cediendo el control cada
+              `yield_every` pasos (cada paso: `TOKEN_STEP` tokens o una evaluación de regla);
+            * si no, en `executor` (None = el executor por defecto del loop). Con un
+              ProcessPoolExecutor la instancia debe poder serializarse con pickle.
+
+        Raises:
+            json.JSONDecodeError: Si mode="strict" y la reparación falla.
+        """
+        effective_dry_run = self.dry_run if dry_run is None else dry_run
+        if len(text) <= inline_limit:
+            return self._run(text, effective_dry_run)
+
+        async with (limiter or default_limiter()):
+            if cooperative:
+                return await drive(self._iter_run(text, effective_dry_run), yield_every)
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(executor, self._run, text, effective_dry_run)
+
+    async def aloads(self, text: Union[str, bytes], **options: Any) -> Any:
+        """
+        Versión asíncrona de `loads`. Acepta las mismas opciones que `aparse`.
+        """
+        text = self._decode_input(text)
+        return self._object_or_raise(await self.aparse(text, **options), text)
+
+    @staticmethod
+    def _decode_input(text: Union[str, bytes]) -> str:
+        if not isinstance(text, str):
+            # Intento de compatibilidad con json.loads que también acepta bytes
+            try:
+                text = text.decode('utf-8')
+            except AttributeError:
+                # Si no tiene decode, asumimos que ya es str o fallará más adelante
+                pass
+        return text
+
+    @staticmethod
+    def _object_or_raise(report: RepairReport, text: str) -> Any:
+        if report.success:
+            return report.python_object
+
+        # Si fallamos, lanzamos la excepción estándar de Python para mantener compatibilidad
+        # con bloques try/except existentes en otros proyectos.
+        error_msg = report.errors[-1] if report.errors else "Unknown unrecoverable error"
+        raise json.JSONDecodeError(
+            msg=f"PyParseJson failed to repair input: {error_msg}",
+            doc=text,
+            pos=0
+        )
+
+    def repair_to(self, stream: Union[TextIO, BinaryIO], text: str, dry_run: Optional[bool] = None,
+                  chunk_size: int = 65536, binary: Optional[bool] = None) -> RepairReport:
+        """
+        Repara `text` y escribe el JSON resultante en `stream` en fragmentos de
+        aproximadamente `chunk_size` caracteres, sin materializar el string final ni el
+        objeto Python.
+
+        Antes de escribir se valida el flujo de tokens; si no es JSON estricto se recurre
+        al camino de texto de respaldo (que sí materializa el texto) y se escribe su
+        resultado. En modo strict, si la reparación falla no se escribe nada.
+
+        Args:
+            stream: Destino con método `write` (archivo, socket.makefile, BytesIO, ...).
+            text: El texto a reparar.
+            dry_run: Sobrescribe la configuración de dry_run de la instancia si no es None.
+            chunk_size: Tamaño aproximado de cada escritura, en caracteres.
+            binary: Si es True se escriben `bytes` UTF-8; si es False, `str`. Por defecto se
+                deduce del tipo de `stream` (streams binarios de `io` → bytes).
+
+        Returns:
+            El RepairReport. En el camino directo `json_text` queda vacío y
+            `python_object` es None.
+
+        Raises:
+            json.JSONDecodeError: Si mode="strict" y la reparación falla.
+        """
+        if binary is None:
+            binary = isinstance(stream, (io.RawIOBase, io.BufferedIOBase))
+        effective_dry_run = self.dry_run if dry_run is None else dry_run
+
+        metrics = self.metrics or _metrics._active
+        if metrics is None:
+            return self._write_repaired(stream, text, effective_dry_run, chunk_size, binary)
+
+        start = perf_counter()
+        try:
+            report = self._write_repaired(stream, text, effective_dry_run, chunk_size, binary)
+        except Exception:
+            metrics.observe_error(perf_counter() - start, len(text))
+            raise
+        metrics.observe_parse(report, perf_counter() - start, len(text))
+        return report
+
+    def _write_repaired(self, stream: Union[TextIO, BinaryIO], text: str, effective_dry_run: bool,
+                        chunk_size: int, binary: bool) -> RepairReport:
+        write = stream.write
+        hooks = self.hooks
+        if hooks is not None:
+            parse_start = perf_counter()
+            hooks.on_phase_start("parse", 0)
+        context, early_report = self._repair_tokens(text, effective_dry_run)
+        if early_report is not None:
+            if self.mode == "strict" and not early_report.success:
+                # Sin estructura: en strict no se escribe el `{}` de respaldo
+                raise json.JSONDecodeError(msg="PyParseJson (Strict Mode) failed to repair input: "
+                                               "No JSON structure detected", doc=text[:200], pos=0)
+            write(b"{}" if binary else "{}")
+            if hooks is not None:
+                hooks.on_phase_end("parse", perf_counter() - parse_start, early_report.timings.tokens_after)
+            return self._attach_memory(early_report)
+
+        if hooks is not None:
+            hooks.on_phase_start("build", len(context.tokens))
+        start = perf_counter()
+        try:
+            self.builder.validate(context.tokens)
+        except TokenBuildError:
+            context.report.timings.build = perf_counter() - start
+            if hooks is not None:
+                hooks.on_phase_end("build", context.report.timings.build, len(context.tokens))
+            # Camino de respaldo: mismo resultado que parse(), escrito por fragmentos
+            final_json = self._finalize_text(context)
+            success, python_obj = self._attempt_parse(final_json, context)
+            if not success:
+                success, python_obj, final_json = self._timed_fallback(context, success, python_obj, final_json)
+            self._finalize_report(context, success, python_obj, final_json)
+            chunks = (context.report.json_text[i:i + chunk_size]
+                      for i in range(0, len(context.report.json_text), chunk_size))
+        else:
+            context.report.timings.build = perf_counter() - start
+            if hooks is not None:
+                hooks.on_phase_end("build", context.report.timings.build, len(context.tokens))
+            tokens = context.tokens
+            # El objeto vacío se reporta igual que en parse() para que el status coincida
+            is_empty_object = (len(tokens) == 2 and tokens[0].type == TokenType.LBRACE
+                               and tokens[1].type == TokenType.RBRACE)
+            self._finalize_report(context, True, {} if is_empty_object else None, "")
+            chunks = self.finalizer.iter_chunks(tokens, chunk_size)
+
+        for chunk in chunks:
+            write(chunk.encode("utf-8") if binary else chunk)
+
+        if hooks is not None:
+            hooks.on_phase_end("parse", perf_counter() - parse_start, len(context.tokens))
+        return self._attach_memory(context.report)
@@ -1,4 +1,4 @@
-from typing import List, Type, Set
+from typing import List, Type
 from pyparsejson.rules.base import Rule
 from pyparsejson.rules.registry import RuleRegistry
 
@@ -34,20 +34,18 @@ class RuleSelector:
         Resuelve la lista final de clases de reglas, aplicando inclusiones,
         exclusiones y ordenamiento por prioridad.
         """
-        rules: Set[Type[Rule]] = set()
+        rules: List[Type[Rule]] = []
 
         # 1. Recolectar reglas por tags
         for tag in self.tags:
-            rules.update(RuleRegistry.get_rules(tag))
+            rules.extend(RuleRegistry.get_rules(tag))
 
         # 2. Añadir reglas explícitas
-        rules.update(self.explicit_rules)
+        rules.extend(self.explicit_rules)
 
         # 3. Aplicar exclusiones
-        rules.difference_update(self.exclude)
+        excluded = set(self.exclude)
 
-        # 4. Ordenar por prioridad (menor valor = mayor prioridad)
-        return sorted(
-            list(rules),
-            key=lambda r: r.priority
-        )
+        # 4. Ordenar por prioridad (menor valor = mayor prioridad); a igual prioridad,
+        #    orden de registro, sin depender del orden de los tags
+        return RuleRegistry.ordered(r for r in rules if r not in excluded)
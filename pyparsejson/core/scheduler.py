@@ -0,0 +1,122 @@
+from dataclasses import dataclass
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, Dict, Type
+
+from pyparsejson.core.context import Context
+
+if TYPE_CHECKING:
+    from pyparsejson.rules.base import Rule
+
+
+@dataclass
+class RuleHitStats:
+    """Estadísticas acumuladas de una regla bajo el planificador adaptativo."""
+    evaluations: int = 0     # llamadas reales a applies()
+    hits: int = 0            # applies() devolvió True
+    seconds: float = 0.0     # tiempo total dentro de applies()
+    tokens: int = 0          # tokens de entrada sumados sobre esas llamadas
+    gated: int = 0           # evaluaciones evitadas por `Rule.requires`
+    memoized: int = 0        # evaluaciones evitadas porque los tokens no cambiaron
+
+    @property
+    def hit_rate(self) -> float:
+        return self.hits / self.evaluations if self.evaluations else 0.0
+
+    @property
+    def mean_seconds(self) -> float:
+        return self.seconds / self.evaluations if self.evaluations else 0.0
+
+    @property
+    def seconds_per_token(self) -> float:
+        return self.seconds / self.tokens if self.tokens else 0.0
+
+
+class AdaptiveRuleScheduler:
+    """
+    Decide, regla a regla, si hace falta llamar a `applies()` (ver `Repair(adaptive_rules=True)`).
+
+    Solo se salta una evaluación cuando su resultado se conoce de antemano y es False, así
+    que la salida es idéntica a la del orden estático:
+
+      - memo negativo: si `applies()` devolvió False y los tokens no han cambiado desde
+        entonces (`Context.version`), vuelve a devolver False;
+      - `Rule.requires`: si la regla declara los tipos de token sin los que nunca aplica y
+        no hay ninguno, se salta. La comprobación es O(1) con el índice estructural ya
+        calculado; si está invalidado, reconstruirlo cuesta una pasada, y solo se paga para
+        reglas que, tras `warmup` evaluaciones, aplican en menos de `gate_below` de los casos
+        y cuyo applies() cuesta por token más que esa reconstrucción.
+
+    El orden de las reglas no se altera: reglas de igual prioridad no conmutan en general
+    (p. ej. AddMissingCommasRule y MergeFreeTextValueRule) y reproducir exactamente el
+    orden estático con otro orden de evaluación no ahorra ninguna llamada.
+
+    Las estadísticas se acumulan entre reparaciones de un mismo `Repair`. Con varios hilos
+    los contadores pueden perder algún incremento; eso solo afecta a la política, nunca a
+    la salida.
+    """
+
+    def __init__(self, warmup: int = 32, gate_below: float = 0.5):
+        self.warmup = warmup
+        self.gate_below = gate_below
+        self.stats: Dict[Type["Rule"], RuleHitStats] = {}
+        # Coste medido de las reconstrucciones del índice estructural que pidió la política
+        self.index_seconds = 0.0
+        self.index_tokens = 0
+
+    def stats_for(self, rule: "Rule") -> RuleHitStats:
+        stats = self.stats.get(rule.__class__)
+        if stats is None:
+            stats = self.stats[rule.__class__] = RuleHitStats()
+        return stats
+
+    def _gate(self, rule: "Rule", stats: RuleHitStats, context: Context) -> bool:
+        """True si `rule.requires` demuestra que applies() devolvería False."""
+        if context.cached_structure is None:
+            # Reconstruir el índice solo compensa si la regla casi nunca aplica y su
+            # applies() cuesta, por token, más que construirlo
+            if stats.evaluations < self.warmup or stats.hit_rate >= self.gate_below:
+                return False
+            if self.index_tokens and stats.seconds_per_token < self.index_seconds / self.index_tokens:
+                return False
+            start = perf_counter()
+            index = context.structure
+            self.index_seconds += perf_counter() - start
+            self.index_tokens += index.size or 1
+        return not context.structure.has_any(*rule.requires)
+
+    def applies(self, rule: "Rule", context: Context) -> bool:
+        """Equivalente a `rule.applies(context)`, evitando las llamadas de resultado conocido."""
+        stats = self.stats_for(rule)
+        rejected = context.rejected_rules
+        if rejected.get(rule.__class__) == context.version:
+            stats.memoized += 1
+            return False
+        if rule.requires and self._gate(rule, stats, context):
+            stats.gated += 1
+            rejected[rule.__class__] = context.version
+            return False
+
+        start = perf_counter()
+        result = rule.applies(context)
+        stats.seconds += perf_counter() - start
+        stats.evaluations += 1
+        stats.tokens += len(context.tokens)
+        if result:
+            stats.hits += 1
+        else:
+            rejected[rule.__class__] = context.version
+        return result
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Estadísticas por nombre de regla, serializables a JSON."""
+        return {
+            cls.__name__: {
+                "evaluations": s.evaluations,
+                "hits": s.hits,
+                "hit_rate": s.hit_rate,
+                "mean_seconds": s.mean_seconds,
+                "gated": s.gated,
+                "memoized": s.memoized,
+            }
+            for cls, s in sorted(self.stats.items(), key=lambda item: item[0].__name__)
+        }
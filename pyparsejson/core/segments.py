@@ -0,0 +1,295 @@
+# Path: pyparsejson\core\segments.py
+import re
+from typing import Dict, Iterator, List, Optional, Tuple
+
+# Tipos de evento estructural
+OPEN = 0       # '{' o '['
+CLOSE = 1      # '}' o ']'
+COMMA = 2      # ',' fuera de paréntesis: frontera entre miembros
+SEPARATOR = 3  # ':' o '=' fuera de paréntesis: separador clave/valor
+PAREN = 4      # '(' o ')' (solo con `feed(..., parens=True)`)
+
+# Evento: (tipo, offset absoluto, carácter)
+Event = Tuple[int, int, str]
+
+_STRUCTURAL = re.compile(r'[{}\[\](),:="\']')
+_STRING_END = {'"': re.compile(r'["\\]'), "'": re.compile(r"['\\]")}
+# Una comilla simple solo abre un string al inicio de un valor o clave; en medio de
+# una palabra (`it's`) es un apóstrofo.
+_QUOTE_CONTEXT = frozenset('{[,:=(')
+
+
+class SegmentScanner:
+    """
+    Escáner de caracteres reanudable que sigue la estructura de un texto JSON
+    (posiblemente roto) a medida que llega por fragmentos.
+
+    Lleva el estado entre llamadas (dentro/fuera de string, escape pendiente,
+    profundidad) y en cada `feed` devuelve los eventos estructurales encontrados fuera
+    de strings, con offsets absolutos respecto al inicio del flujo. No tokeniza ni
+    valida: solo localiza fronteras, así que su coste es lineal en el texto nuevo.
+    """
+
+    def __init__(self):
+        self.offset = 0
+        self.depth = 0
+        self.paren_depth = 0
+        self.quote: Optional[str] = None
+        self.escape = False
+        self.last: Optional[str] = None  # último carácter significativo fuera de strings
+
+    @property
+    def in_string(self) -> bool:
+        return self.quote is not None
+
+    def feed(self, chunk: str, stop_at_root: bool = False, parens: bool = False) -> List[Event]:
+        """
+        Consume `chunk` y devuelve sus eventos estructurales en orden.
+
+        Con `stop_at_root=True` se detiene tras el cierre que devuelve la profundidad a 0
+        (el resto de `chunk` queda sin consumir). Con `parens=True` también se emiten los
+        paréntesis (PAREN), que suprimen las comas y separadores que contienen.
+        """
+        events: List[Event] = []
+        base = self.offset
+        n = len(chunk)
+        i = 0
+
+        while i < n:
+            if self.quote is not None:
+                if self.escape:
+                    self.escape = False
+                    i += 1
+                    continue
+                match = _STRING_END[self.quote].search(chunk, i)
+                if match is None:
+                    i = n
+                    break
+                i = match.end()
+                if match.group() == '\\':
+                    self.escape = True
+                else:
+                    self.quote = None
+                    self.last = match.group()
+                continue
+
+            match = _STRUCTURAL.search(chunk, i)
+            if match is None:
+                rest = chunk[i:].rstrip()
+                if rest:
+                    self.last = rest[-1]
+                i = n
+                break
+
+            j = match.start()
+            c = match.group()
+            if c == "'" and i < j:
+                # Solo aquí importa el último carácter significativo previo
+                between = chunk[i:j].rstrip()
+                if between:
+                    self.last = between[-1]
+            i = j + 1
+
+            if c == '"' or (c == "'" and (self.last is None or self.last in _QUOTE_CONTEXT)):
+                self.quote = c
+                continue
+            if c == '{' or c == '[':
+                self.depth += 1
+                events.append((OPEN, base + j, c))
+            elif c == '}' or c == ']':
+                if self.depth > 0:
+                    self.depth -= 1
+                    events.append((CLOSE, base + j, c))
+                    if stop_at_root and self.depth == 0:
+                        self.last = c
+                        break
+            elif c == '(':
+                self.paren_depth += 1
+                if parens:
+                    events.append((PAREN, base + j, c))
+            elif c == ')':
+                self.paren_depth = max(0, self.paren_depth - 1)
+                if parens:
+                    events.append((PAREN, base + j, c))
+            elif self.paren_depth == 0:
+                if c == ',':
+                    events.append((COMMA, base + j, c))
+                elif c != "'":
+                    events.append((SEPARATOR, base + j, c))
+            self.last = c
+
+        self.offset += i
+        return events
+
+
+def _looks_like_json(kind: str, closed: bool, separators: int, commas: int, children: int) -> bool:
+    """Filtro por densidad de la estructura de primer nivel de una región."""
+    if kind == "{":
+        # Cada hijo de un objeto necesita su clave; `{name}` o `{}` no son candidatos
+        return separators >= 1 and (closed or separators >= children)
+    # En un array no hay ':' de primer nivel (`[12:30:01]`), y sin cerrar se exigen las comas
+    if separators or not (commas or children):
+        return False
+    return closed or commas >= children - 1
+
+
+Region = Tuple[int, bool, bool]
+
+
+def _scan_nested(text: str, start: int, max_gap: int) -> Dict[int, Region]:
+    """
+    Recorre el contenedor que abre en `text[start]` (ver `scan_region`) y devuelve el
+    resultado `(fin, cerrada, candidata)` de ese contenedor y de cada uno anidado en él.
+
+    Un contenedor anidado abierto fuera de paréntesis se comporta igual que si se
+    recorriera por separado desde su apertura (mismo estado de strings, mismos eventos
+    después), así que su resultado es el que daría `scan_region` en esa posición. Los
+    abiertos dentro de paréntesis no se incluyen: ahí sus comas quedan suprimidas.
+    """
+    scanner = SegmentScanner()
+    results: Dict[int, Region] = {}
+    # Contenedores abiertos: [inicio, tipo, separadores, comas, hijos, fuera de paréntesis]
+    stack: List[list] = []
+    paren_depth = 0
+    last = start
+    n = len(text)
+    pos = start
+    block = 256
+
+    while pos < n:
+        chunk = text[pos:pos + block]
+        for event, offset, char in scanner.feed(chunk, stop_at_root=True, parens=True):
+            offset += start
+            if event == PAREN:
+                paren_depth = paren_depth + 1 if char == '(' else max(0, paren_depth - 1)
+                continue
+            if offset - last > max_gap:
+                break
+            last = offset
+            if event == OPEN:
+                if stack:
+                    stack[-1][4] += 1
+                stack.append([offset, char, 0, 0, 0, paren_depth == 0])
+            elif event == CLOSE:
+                frame = stack.pop()
+                if frame[5]:
+                    results[frame[0]] = (offset + 1, True, _looks_like_json(frame[1], True, *frame[2:5]))
+                if not stack:
+                    return results
+            elif event == COMMA:
+                stack[-1][3] += 1
+            else:
+                stack[-1][2] += 1
+        else:
+            pos += len(chunk)
+            block = min(block * 2, 65536)
+            continue
+        break
+
+    # Sin cierre: todos los contenedores aún abiertos terminan donde termina la región
+    if pos >= n and n - last <= max_gap:
+        end = n
+    else:
+        end = text.find("\n", last + 1)
+        end = n if end == -1 else min(end, last + 1 + max_gap)
+    for frame in stack:
+        if frame[5]:
+            results[frame[0]] = (end, False, _looks_like_json(frame[1], False, *frame[2:5]))
+    return results
+
+
+def scan_region(text: str, start: int, max_gap: int = 65536) -> Region:
+    """
+    Recorre el contenedor que abre en `text[start]` hasta su cierre.
+
+    Si pasan más de `max_gap` caracteres sin ningún evento estructural, o se llega al
+    final del texto, la región se da por no cerrada y termina al final de la línea de
+    su último evento (o del texto).
+
+    Returns:
+        (fin, cerrada, candidata): `fin` es exclusivo; `candidata` indica si la
+        estructura de primer nivel tiene densidad de JSON.
+    """
+    return _scan_nested(text, start, max_gap)[start]
+
+
+_REGION_OPEN = re.compile(r'[{\[]')
+
+
+def iter_regions(text: str, max_gap: int = 65536) -> Iterator[Tuple[int, int]]:
+    """
+    Localiza en un solo recorrido las regiones de `text` candidatas a JSON:
+    contenedores '{...}' / '[...]' de primer nivel con densidad de clave:valor o
+    de elementos de JSON. Produce spans `(inicio, fin)` en orden.
+
+    Una región candidata se salta entera. Una que no lo es se descarta: si cerró,
+    también se salta entera (`[INFO]`, `{name}`); si no cerró (un '{' suelto en la
+    prosa), se sigue buscando justo después de su apertura. Para no volver a recorrer
+    el resto del texto desde cada apertura suelta, se reutilizan los resultados de los
+    contenedores anidados que ya calculó ese recorrido.
+    """
+    known: Dict[int, Region] = {}
+    pos = 0
+    while True:
+        match = _REGION_OPEN.search(text, pos)
+        if match is None:
+            return
+        start = match.start()
+        region = known.pop(start, None)
+        if region is None:
+            nested = _scan_nested(text, start, max_gap)
+            region = nested[start]
+            if not region[1] and not region[2]:
+                known.update(nested)
+        end, closed, candidate = region
+        if candidate:
+            yield start, end
+            pos = end
+        elif closed:
+            pos = end
+        else:
+            pos = start + 1
+
+
+_PAIRS = {'}': '{', ']': '['}
+
+
+def split_array(text: str, block_size: int = 1 << 20) -> Optional[Tuple[int, int, List[int]]]:
+    """
+    Localiza en un solo recorrido las fronteras entre elementos de un array raíz.
+
+    Returns:
+        (inicio, fin, comas): el contenido del array es `text[inicio:fin]` y `comas` son
+        los offsets de sus comas de primer nivel. None si las fronteras son ambiguas: la
+        raíz no es un array, no cierra (o cierra con el corchete equivocado), hay texto
+        tras ella, o aparece un ':' / '=' de primer nivel (un objeto sin llaves).
+    """
+    start = len(text) - len(text.lstrip())
+    if start >= len(text) or text[start] != '[':
+        return None
+
+    scanner = SegmentScanner()
+    openers: List[str] = []
+    commas: List[int] = []
+    end = None
+    pos = start
+    while pos < len(text) and end is None:
+        chunk = text[pos:pos + block_size]
+        for event, offset, char in scanner.feed(chunk, stop_at_root=True):
+            offset += start
+            if event == OPEN:
+                openers.append(char)
+            elif event == CLOSE:
+                if openers.pop() != _PAIRS[char]:
+                    return None
+                if not openers:
+                    end = offset
+            elif len(openers) == 1:
+                if event == SEPARATOR:
+                    return None
+                commas.append(offset)
+        pos += len(chunk)
+
+    if end is None or text[end + 1:].strip():
+        return None
+    return start + 1, end, commas
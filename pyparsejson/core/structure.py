@@ -0,0 +1,131 @@
+from collections import Counter
+from typing import List, Tuple
+
+from pyparsejson.core.token import Token, TokenType
+
+_OPENERS = {TokenType.LBRACE: TokenType.RBRACE, TokenType.LBRACKET: TokenType.RBRACKET}
+_CLOSERS = (TokenType.RBRACE, TokenType.RBRACKET)
+_SEPARATORS = (TokenType.COLON, TokenType.ASSIGN)
+_DELIMITERS = (TokenType.COMMA, TokenType.RBRACE, TokenType.RBRACKET)
+_KEY_PARTS = (TokenType.BARE_WORD, TokenType.STRING)
+
+
+class StructuralIndex:
+    """
+    Índice estructural de una lista de tokens, calculado en una sola pasada lineal.
+
+    Reúne los datos que varias reglas necesitaban redescubrir escaneando la lista:
+    profundidad de anidamiento, pareja de cada llave/corchete, siguiente separador
+    (: o =), siguiente delimitador de valor (, } ]) y dónde empieza cada clave.
+    Todas las consultas son O(1).
+
+    El índice es una foto de la lista en el momento de construirse; `Context`
+    lo invalida cuando los tokens cambian (ver `Context.structure`).
+    """
+
+    def __init__(self, tokens: List[Token]):
+        self.tokens = tokens
+        self.size = n = len(tokens)
+
+        self.counts = Counter()
+        self.depth = [0] * n
+        self.match = [-1] * n
+        self.next_separator = [-1] * n
+        self.next_delimiter = [-1] * n
+        self.next_key = [-1] * n
+        self.key_start = [-1] * n
+        self.separators: List[int] = []
+
+        # Pila para el emparejamiento (solo desapila si el tipo coincide),
+        # igual que el cierre automático de BalanceBracketsRule.
+        open_stack: List[int] = []
+        # Pila "estricta" que desapila siempre, para contar errores de balance.
+        strict_stack: List[TokenType] = []
+        balance_errors = 0
+
+        pending_sep = pending_delim = pending_key = 0
+        run_start = -1
+
+        for i, token in enumerate(tokens):
+            ttype = token.type
+            self.counts[ttype] += 1
+
+            if ttype in _OPENERS:
+                self.depth[i] = len(open_stack)
+                open_stack.append(i)
+                strict_stack.append(ttype)
+            elif ttype in _CLOSERS:
+                if open_stack and _OPENERS[tokens[open_stack[-1]].type] == ttype:
+                    opener = open_stack.pop()
+                    self.match[i] = opener
+                    self.match[opener] = i
+                self.depth[i] = len(open_stack)
+
+                if not strict_stack:
+                    balance_errors += 1
+                elif _OPENERS[strict_stack.pop()] != ttype:
+                    balance_errors += 1
+            else:
+                self.depth[i] = len(open_stack)
+
+            if ttype in _SEPARATORS:
+                self.separators.append(i)
+                self.next_separator[pending_sep:i + 1] = [i] * (i + 1 - pending_sep)
+                pending_sep = i + 1
+
+                self.key_start[i] = run_start if run_start != -1 else i
+                if run_start != -1:
+                    key = i - 1
+                    self.next_key[pending_key:key + 1] = [key] * (key + 1 - pending_key)
+                    pending_key = key + 1
+
+            if ttype in _DELIMITERS:
+                self.next_delimiter[pending_delim:i + 1] = [i] * (i + 1 - pending_delim)
+                pending_delim = i + 1
+
+            if ttype in _KEY_PARTS:
+                if run_start == -1:
+                    run_start = i
+            else:
+                run_start = -1
+
+        self.balance_errors = balance_errors + len(strict_stack)
+        self.missing_closers = [_OPENERS[tokens[i].type] for i in open_stack]
+
+    @property
+    def is_balanced(self) -> bool:
+        """True si todas las llaves y corchetes están correctamente emparejados."""
+        return self.balance_errors == 0
+
+    def has_any(self, *types: TokenType) -> bool:
+        """Indica si existe al menos un token de alguno de los tipos dados."""
+        counts = self.counts
+        return any(counts[t] for t in types)
+
+    def key_span(self, sep_idx: int) -> Tuple[int, int]:
+        """
+        Devuelve (inicio, fin) inclusivo de la clave que precede al separador `sep_idx`,
+        entendida como la secuencia máxima de BARE_WORD/STRING. Si no hay clave, fin < inicio.
+        """
+        return self.key_start[sep_idx], sep_idx - 1
+
+    def value_span(self, sep_idx: int) -> Tuple[int, int]:
+        """
+        Devuelve (inicio, fin) inclusivo del valor que sigue al separador `sep_idx`.
+
+        El valor termina antes del siguiente delimitador (, } ]) o justo antes del
+        inicio de una nueva clave (`palabra :`), lo que ocurra primero.
+        """
+        start = sep_idx + 1
+        end = self.size - 1
+        if start >= self.size:
+            return start, sep_idx
+
+        delim = self.next_delimiter[start]
+        if delim != -1:
+            end = delim - 1
+        if start + 1 < self.size:
+            key = self.next_key[start + 1]
+            if key != -1 and key - 1 < end:
+                end = key - 1
+        return start, end
@@ -0,0 +1,111 @@
+# Path: pyparsejson\extract.py
+"""
+Extracción de varios fragmentos JSON embebidos en un texto grande (logs,
+transcripciones de chat, HTML, ...).
+
+`find_all` localiza las regiones candidatas en un solo recorrido del texto
+(`pyparsejson.core.segments.iter_regions`) y repara cada una por separado, de modo
+que un texto de varios MB nunca se tokeniza como una sola unidad.
+"""
+import json
+import os
+from collections import deque
+from concurrent.futures import Future
+from typing import Any, Iterator, List, Optional, Tuple
+
+from pyparsejson.batch import _EXECUTORS, _init_worker, _worker_state
+from pyparsejson.core.flow import Flow
+from pyparsejson.core.segments import iter_regions
+from pyparsejson.report.repair_report import RepairReport
+
+Span = Tuple[int, int]
+
+
+def _parse_region(pipeline, text: str) -> Optional[RepairReport]:
+    """Repara una región; None si no tiene arreglo (el pipeline va en modo estricto)."""
+    try:
+        return pipeline.parse(text)
+    except json.JSONDecodeError:
+        return None
+
+
+def _parse_chunk(texts: List[str]) -> List[Optional[RepairReport]]:
+    pipeline = _worker_state.pipeline
+    return [_parse_region(pipeline, text) for text in texts]
+
+
+def find_all(text: str, *, workers: Optional[int] = None, executor: str = "process", chunksize: int = 64,
+             max_in_flight: Optional[int] = None, max_gap: int = 65536, auto_flows: bool = True,
+             flow: Optional[Flow] = None, salvage: bool = False,
+             **decode_kwargs: Any) -> Iterator[Tuple[Span, Any, RepairReport]]:
+    """
+    Busca y repara todos los fragmentos JSON embebidos en `text`.
+
+    Las regiones se reparan en bloques de `chunksize`. Mientras no se llene el primer
+    bloque todo ocurre en el hilo actual; si hay más regiones (y `workers` > 1), los
+    bloques se reparten en un pool, con como mucho `max_in_flight` pendientes a la vez.
+
+    Args:
+        text: Texto donde buscar.
+        workers: Número de workers. Por defecto `os.cpu_count()`.
+        executor: "process" (default) o "thread".
+        chunksize: Regiones por bloque enviado a un worker.
+        max_in_flight: Bloques pendientes como máximo. Por defecto `2 * workers`.
+        max_gap: Caracteres sin estructura tras los que una región sin cerrar se corta.
+        auto_flows, flow, salvage, **decode_kwargs: Igual que en `pyparsejson.loads`.
+
+    Yields:
+        `((inicio, fin), objeto, RepairReport)` por cada región reparada con éxito, en
+        orden de aparición. `text[inicio:fin]` es el fragmento original. Las regiones
+        que `loads` solo resolvería con el `{}` de respaldo se omiten.
+    """
+    if executor not in _EXECUTORS:
+        raise ValueError(f"Invalid executor '{executor}'. Use 'process' or 'thread'.")
+    if chunksize < 1:
+        raise ValueError("chunksize must be >= 1")
+
+    # Modo estricto: en modo lax una región irreparable devolvería el `{}` del fallback
+    options = dict(decode_kwargs, auto_flows=auto_flows, flow=flow, salvage=salvage, mode="strict")
+    workers = workers or os.cpu_count() or 1
+    max_in_flight = max_in_flight or 2 * workers
+
+    pool = None
+    pipeline = None
+
+    def submit(spans: List[Span]):
+        nonlocal pool, pipeline
+        texts = [text[start:end] for start, end in spans]
+        if workers > 1 and len(spans) >= chunksize:
+            if pool is None:
+                pool = _EXECUTORS[executor](max_workers=workers, initializer=_init_worker, initargs=(options,))
+            return pool.submit(_parse_chunk, texts)
+        if pipeline is None:
+            from pyparsejson import make_pipeline
+            pipeline = make_pipeline(**options)
+        return [_parse_region(pipeline, t) for t in texts]
+
+    def emit(block):
+        spans, job = block
+        reports = job.result() if isinstance(job, Future) else job
+        for span, report in zip(spans, reports):
+            if report is not None and report.success:
+                yield span, report.python_object, report
+
+    pending = deque()
+    try:
+        spans: List[Span] = []
+        for span in iter_regions(text, max_gap):
+            spans.append(span)
+            if len(spans) >= chunksize:
+                pending.append((spans, submit(spans)))
+                spans = []
+                while len(pending) >= max_in_flight:
+                    yield from emit(pending.popleft())
+
+        if spans:
+            pending.append((spans, submit(spans)))
+        while pending:
+            yield from emit(pending.popleft())
+    finally:
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
@@ -19,3 +19,6 @@ class BootstrapRepairFlow(Flow):
         Ejecuta reglas estructurales críticas repetidamente.
         """
         return self.run_with_retries(context, tags=["structure", "pre_repair"])
+
+    def iter_execute(self, context: Context):
+        return (yield from self.iter_run_with_retries(context, tags=["structure", "pre_repair"]))
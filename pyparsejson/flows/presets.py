@@ -13,6 +13,9 @@ class MinimalJSONRepairFlow(Flow):
     def execute(self, context: Context) -> bool:
         return self.run_with_retries(context, tags=["structure", "pre_repair"])
 
+    def iter_execute(self, context: Context):
+        return (yield from self.iter_run_with_retries(context, tags=["structure", "pre_repair"]))
+
 
 class StandardJSONRepairFlow(Flow):
     """
@@ -30,6 +33,9 @@ class StandardJSONRepairFlow(Flow):
     def execute(self, context: Context) -> bool:
         return self.run(context)
 
+    def iter_execute(self, context: Context):
+        return (yield from self.iter_run(context))
+
 
 class AggressiveJSONRepairFlow(Flow):
     """
@@ -40,3 +46,6 @@ class AggressiveJSONRepairFlow(Flow):
 
     def execute(self, context: Context) -> bool:
         return self.run_with_retries(context, tags=["all"])
+
+    def iter_execute(self, context: Context):
+        return (yield from self.iter_run_with_retries(context, tags=["all"]))
@@ -0,0 +1,388 @@
+# Path: pyparsejson\incremental.py
+"""
+Reparación incremental de JSON que llega por fragmentos (p. ej. la salida de un LLM
+en streaming).
+
+Reparar el buffer completo en cada fragmento cuesta O(n²) en total. `IncrementalRepair`
+solo escanea el texto nuevo y repara cada miembro (par clave/valor o elemento) una
+única vez, en cuanto se cierra; lo único que se vuelve a reparar en cada `snapshot`
+es el miembro que todavía se está escribiendo. En un objeto, un miembro se cierra
+cuando empieza la clave siguiente, de modo que los valores sin clave que lo siguen
+(`"ids": 1, 2, 3`) se reparan con él, igual que en `loads`.
+
+`iter_items` aplica la misma idea a archivos enormes: produce cada elemento (o par
+clave/valor) del contenedor raíz en cuanto se cierra y lo olvida, de modo que la
+memoria solo depende del mayor miembro, no del tamaño del archivo.
+"""
+import codecs
+import io
+from dataclasses import dataclass, field
+from typing import IO, Any, Dict, Iterator, List, Optional, Tuple, Union
+
+from pyparsejson.core.flow import Flow
+from pyparsejson.core.repair import Repair
+from pyparsejson.core.segments import CLOSE, COMMA, OPEN, SEPARATOR, SegmentScanner
+
+
+_OPENER = {"}": "{", "]": "["}
+# Marca el lugar del hijo al reparar el texto que lo precede (`"items": ` -> `{"items": HOLE}`)
+_HOLE = "__pyparsejson_hole__"
+_NOT_FOUND = object()
+
+
+@dataclass
+class _Frame:
+    """Contenedor ('{' o '[') abierto y lo que ya se sabe de él."""
+    kind: str
+    start: int                                   # offset donde empieza el miembro en curso
+    members: Union[Dict[str, Any], List[Any]] = None
+    separated: bool = False                      # el miembro en curso ya tiene ':' / '='
+    cut: Optional[Tuple[int, int]] = None        # posible fin del miembro en curso e inicio del siguiente
+    child_at: int = -1                           # offset del último hijo abierto
+    child: Optional[Tuple[int, Any]] = None      # fin y valor del último hijo cerrado
+    _prefix: Tuple[Any, Any] = field(default=(None, None), repr=False)
+    _tail: Tuple[Any, Any] = field(default=(None, None), repr=False)
+
+    def __post_init__(self):
+        if self.members is None:
+            self.members = {} if self.kind == "{" else []
+
+
+def _place(template: Any, value: Any) -> Any:
+    """Copia de `template` con `value` en lugar de `_HOLE`, o `_NOT_FOUND` si la reparación lo perdió."""
+    if template == _HOLE:
+        return value
+    if isinstance(template, dict):
+        for key in reversed(list(template)):
+            placed = _place(template[key], value)
+            if placed is not _NOT_FOUND:
+                return {**template, key: placed}
+    elif isinstance(template, list):
+        for i in range(len(template) - 1, -1, -1):
+            placed = _place(template[i], value)
+            if placed is not _NOT_FOUND:
+                return template[:i] + [placed] + template[i + 1:]
+    return _NOT_FOUND
+
+
+class IncrementalRepair:
+    """
+    Parser incremental: `feed(chunk)` con cada fragmento y `snapshot()` cuando se
+    quiera el objeto parcial.
+
+    El texto previo al primer '{' o '[' (prosa, ```json, ...) se ignora, igual que
+    lo que venga tras cerrar el contenedor raíz. Mientras no haya contenedor raíz,
+    `snapshot` repara el texto acumulado completo.
+
+    El `snapshot` final coincide con `loads(texto, salvage=True)`; los anteriores
+    muestran además los strings a medio escribir.
+
+    Los sub-objetos ya cerrados se comparten entre snapshots sucesivos: no deben
+    mutarse. Los contenedores aún abiertos se copian en cada snapshot.
+    """
+
+    def __init__(self, *, auto_flows: bool = True, flow: Optional[Flow] = None, **decode_kwargs: Any):
+        # Import diferido: pyparsejson/__init__.py importa este módulo
+        from pyparsejson import make_pipeline
+        # Cada miembro se repara de forma aislada; salvage recupera lo posible si el
+        # miembro en curso está a medio escribir.
+        self.pipeline: Repair = make_pipeline(auto_flows=auto_flows, flow=flow, salvage=True, **decode_kwargs)
+        self._scanner = SegmentScanner()
+        self._stack: List[_Frame] = []
+        # Texto desde el inicio del miembro en curso de la raíz. Un StringIO admite
+        # añadir al final y leer cortes sin copiar todo el buffer en cada fragmento.
+        self._buffer = io.StringIO()
+        self._base = 0      # offset absoluto del inicio de `_buffer`
+        self._done = False
+        self._value: Any = None
+        # Un cierre que no corresponde a su apertura (`[ }`) deja fronteras en las que no
+        # se puede confiar: a partir de ahí el miembro en curso de la raíz se repara entero
+        # al cerrarse (los snapshots intermedios pueden ir algo por detrás).
+        self._flat = False
+
+    @property
+    def done(self) -> bool:
+        """True cuando el contenedor raíz ya se cerró."""
+        return self._done
+
+    def feed(self, chunk: str):
+        """Añade un fragmento de texto."""
+        if not chunk or self._done:
+            return
+
+        self._buffer.seek(0, io.SEEK_END)
+        self._buffer.write(chunk)
+        stack = self._stack
+
+        for kind, offset, char in self._scanner.feed(chunk):
+            if kind == OPEN:
+                if stack and not self._flat:
+                    top = stack[-1]
+                    if top.kind == "[" and top.cut is not None:
+                        # Dos valores seguidos sin coma: el anterior queda completo
+                        self._finish(top, *top.cut)
+                    top.child_at = offset
+                    top.child = None
+                stack.append(_Frame(char, offset + 1))
+                continue
+            if not stack:
+                continue
+
+            top = stack[-1]
+            if kind == CLOSE:
+                if len(stack) > 1 and (self._flat or _OPENER[char] != top.kind):
+                    self._flat = True
+                    stack.pop()
+                    stack[0].child = None
+                    continue
+                self._finish(top, offset, offset + 1)
+                stack.pop()
+                if stack:
+                    parent = stack[-1]
+                    parent.cut = (offset + 1, offset + 1)
+                    parent.child = (offset + 1, top.members)
+                else:
+                    self._done = True
+                    self._value = top.members
+                    break
+            elif self._flat:
+                continue
+            elif kind == COMMA:
+                if top.kind == "[":
+                    self._finish(top, offset, offset + 1)
+                else:
+                    # En un objeto la coma solo cierra el miembro si el fragmento siguiente
+                    # trae clave: los que no (`"ids": 1, 2, 3`) siguen siendo parte de él
+                    top.cut = (offset, offset + 1)
+            elif kind == SEPARATOR:
+                if top.kind == "{" and top.cut is not None:
+                    self._finish(top, *top.cut)
+                top.separated = True
+
+        if self._done:
+            self._buffer = io.StringIO()
+        elif stack and stack[0].start > self._base:
+            # Solo se conserva el miembro en curso de la raíz (que incluye a los anidados)
+            rest = self._slice(stack[0].start)
+            self._buffer = io.StringIO(rest)
+            self._base = stack[0].start
+
+    def snapshot(self) -> Any:
+        """
+        Devuelve el mejor objeto parcial posible con el texto recibido hasta ahora,
+        o None si aún no hay nada.
+        """
+        if self._done:
+            return self._value
+        if not self._stack:
+            text = self._slice(self._base)
+            return self._loads(text) if text.strip() else None
+
+        value = None
+        innermost = 0 if self._flat else len(self._stack) - 1
+        for depth in range(innermost, -1, -1):
+            frame = self._stack[depth]
+            container = dict(frame.members) if frame.kind == "{" else list(frame.members)
+            if depth < innermost:
+                placed = _place(self._prefix(frame), value)
+                if placed is not _NOT_FOUND:
+                    self._merge(frame, container, placed)
+            else:
+                self._merge(frame, container, self._tail(frame))
+            value = container
+        return value
+
+    # ------------------------------------------------------------------
+    # Miembros
+    # ------------------------------------------------------------------
+    def _slice(self, start: int, end: Optional[int] = None) -> str:
+        self._buffer.seek(start - self._base)
+        return self._buffer.read(-1 if end is None else end - start)
+
+    def _finish(self, frame: _Frame, end: int, next_start: int):
+        """Cierra el miembro en curso de `frame` en `end` y empieza el siguiente en `next_start`."""
+        # El miembro se repara entero (clave, valores sin clave, hijos) por el pipeline. Si
+        # termina en un hijo ya cerrado, basta reparar el texto previo con un hueco en su lugar.
+        repaired = _NOT_FOUND
+        if frame.child is not None:
+            child_end, child = frame.child
+            if not self._slice(child_end, end).strip():
+                repaired = _place(self._prefix(frame), child)
+        if repaired is _NOT_FOUND and frame._tail[0] == (frame.start, end):
+            repaired = frame._tail[1]
+        if repaired is _NOT_FOUND:
+            member = self._slice(frame.start, end)
+            repaired = self._repair(frame.kind, member) if member.strip() else None
+        self._merge(frame, frame.members, repaired)
+        frame.start = next_start
+        frame.separated = False
+        frame.cut = None
+        frame.child = None
+        frame._tail = (None, None)
+
+    def _prefix(self, frame: _Frame) -> Any:
+        """
+        Miembro en curso de `frame` hasta su último hijo, reparado con `_HOLE` en el
+        lugar del hijo. Se cachea mientras no cambie el hijo.
+        """
+        key = (frame.start, frame.child_at)
+        cached_key, cached = frame._prefix
+        if cached_key != key:
+            prefix = self._slice(frame.start, frame.child_at)
+            if frame.kind == "[" and not prefix.strip():
+                cached = [_HOLE]
+            else:
+                cached = self._repair(frame.kind, prefix + f' "{_HOLE}"')
+            frame._prefix = (key, cached)
+        return cached
+
+    def _tail(self, frame: _Frame) -> Any:
+        """Repara el miembro a medio escribir; el resultado se cachea hasta el próximo `feed`."""
+        if frame.kind == "{" and not frame.separated:
+            return None  # solo hay (parte de) la clave
+        end = self._scanner.offset
+        if frame.kind == "{" and frame.cut is not None:
+            # Tras una coma aún sin ':' lo que sigue suele ser una clave a medio escribir:
+            # entonces el miembro en curso es el anterior a la coma (el que `_finish` reparará)
+            if self._scanner.in_string or not self._slice(frame.cut[1]).strip():
+                end = frame.cut[0]
+        key = (frame.start, end)
+        cached_key, cached = frame._tail
+        if cached_key == key:
+            return cached
+        if self._flat and cached_key is not None and end - frame.start < 2 * (cached_key[1] - frame.start):
+            # Sin fronteras fiables el miembro de la raíz crece sin límite: solo se vuelve a
+            # reparar cuando su texto dobla, para que el coste total siga siendo lineal
+            return cached
+
+        tail = self._slice(frame.start, end)
+        # Un string de valor a medio escribir se cierra para mostrarlo parcial
+        if self._scanner.in_string and end == self._scanner.offset:
+            if self._scanner.escape:
+                tail = tail[:-1]
+            tail += self._scanner.quote
+        cached = self._repair(frame.kind, tail) if tail.strip() else None
+        frame._tail = (key, cached)
+        return cached
+
+    def _repair(self, kind: str, member: str) -> Any:
+        if kind == "{":
+            return self._loads("{" + member + "}")
+        return self._loads("[" + member + "]")
+
+    def _loads(self, text: str) -> Any:
+        # Best-effort: un miembro irreparable se omite en vez de lanzar
+        report = self.pipeline.parse(text)
+        return report.python_object if report.success else None
+
+    @staticmethod
+    def _merge(frame: _Frame, container: Union[dict, list], repaired: Any):
+        if repaired is None:
+            return
+        if frame.kind == "{":
+            if isinstance(repaired, dict):
+                container.update(repaired)
+        elif isinstance(repaired, list):
+            container.extend(repaired)
+        else:
+            container.append(repaired)
+
+
+def _items(root: Optional[str], value: Any) -> Iterator[Any]:
+    """Elementos (array) o pares clave/valor (objeto) de un valor reparado."""
+    if isinstance(value, list) and root != "{":
+        yield from value
+    elif isinstance(value, dict) and root != "[":
+        yield from value.items()
+    elif root is None:
+        yield value
+
+
+def iter_items(fp: IO, *, block_size: int = 1 << 16, auto_flows: bool = True, flow: Optional[Flow] = None,
+               salvage: bool = False, **decode_kwargs: Any) -> Iterator[Any]:
+    """
+    Repara el contenedor raíz de `fp` por ventanas de un miembro y produce cada
+    elemento de primer nivel en cuanto su ventana se cierra.
+
+    El escáner de fronteras lleva la pila de corchetes entre bloques; cada miembro
+    (lo que hay entre dos comas de primer nivel) se repara por separado con los flujos
+    estándar y se descarta. En una raíz objeto el miembro sigue hasta la siguiente clave,
+    así que los valores sin clave (`"ids": 1, 2, 3`) se reparan con el suyo. La memoria pico depende de `block_size` y del mayor
+    miembro, no del tamaño de `fp`.
+
+    Si la raíz es un array se producen sus elementos; si es un objeto, tuplas
+    `(clave, valor)`. El texto previo a la raíz se ignora. Si no hay ningún '{' o '['
+    se repara el texto completo (y entonces sí se carga entero en memoria).
+
+    Args:
+        fp: Archivo (texto o binario UTF-8) abierto para lectura.
+        block_size: Tamaño de cada lectura de `fp`.
+        auto_flows, flow, salvage, **decode_kwargs: Igual que en `pyparsejson.loads`.
+    """
+    from pyparsejson import make_pipeline
+    pipeline = make_pipeline(auto_flows=auto_flows, flow=flow, salvage=salvage, **decode_kwargs)
+    scanner = SegmentScanner()
+    decoder = None
+    root: Optional[str] = None
+    depth = 0
+    pending = ""  # texto desde el inicio del miembro en curso (todo, mientras no haya raíz)
+    base = 0      # offset absoluto de `pending`
+    cut = None    # posible fin del miembro en curso e inicio del siguiente (raíz objeto)
+
+    def member_items(member: str, closed: bool = True) -> Iterator[Any]:
+        if member.strip():
+            # Un miembro truncado se deja sin cerrar para que la reparación cierre lo que falte
+            closer = ("}" if root == "{" else "]") if closed else ""
+            yield from _items(root, pipeline.loads(root + member + closer))
+
+    while depth or root is None:
+        raw = fp.read(block_size)
+        block = raw
+        if isinstance(raw, bytes):
+            decoder = decoder or codecs.getincrementaldecoder("utf-8")("replace")
+            block = decoder.decode(raw, final=not raw)
+        if not block:
+            # El decodificador devuelve "" mientras un carácter multibyte está incompleto:
+            # el fin del archivo lo marca el bloque leído, no el texto decodificado
+            if raw:
+                continue
+            break
+
+        text = pending + block
+        start = base
+        for kind, offset, char in scanner.feed(block, stop_at_root=True):
+            if kind == OPEN:
+                if root is None:
+                    root = char
+                    start = offset + 1
+                depth += 1
+            elif kind == CLOSE:
+                depth -= 1
+                if depth == 0:
+                    yield from member_items(text[start - base:offset - base])
+                    return
+            elif depth != 1:
+                continue
+            elif kind == COMMA:
+                if root == "{":
+                    # El miembro solo termina si el fragmento siguiente trae clave
+                    cut = (offset, offset + 1)
+                else:
+                    yield from member_items(text[start - base:offset - base])
+                    start = offset + 1
+            elif kind == SEPARATOR and cut is not None:
+                yield from member_items(text[start - base:cut[0] - base])
+                start = cut[1]
+                cut = None
+
+        if root is None:
+            pending = text
+        else:
+            pending = text[start - base:]
+            base = start
+
+    # Fin del archivo: raíz sin cerrar (se repara el último miembro) o sin raíz
+    if root is not None:
+        yield from member_items(pending, closed=False)
+    elif pending.strip():
+        yield from _items(None, pipeline.loads(pending))
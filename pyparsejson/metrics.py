@@ -0,0 +1,219 @@
+# Path: pyparsejson\metrics.py
+"""
+Métricas agregadas de todas las reparaciones del proceso (opt-in).
+
+    registry = pyparsejson.metrics.enable()     # todas las instancias de Repair registran
+    ...
+    print(registry.to_prometheus())             # formato de texto de Prometheus
+    registry.snapshot()                         # o un dict para otro scraper
+
+También se puede pasar un registro concreto a un pipeline: `Repair(metrics=registry)`.
+
+Se agregan:
+  - latencia de cada reparación (histograma por `RepairStatus`; "ERROR" si lanzó);
+  - distribución del tamaño de entrada (caracteres);
+  - aplicaciones de cada regla (las que cambiaron los tokens);
+  - aciertos del camino rápido de `iter_load_lines` y de la deduplicación de `loads_many`.
+
+Cada hilo escribe en su propio shard, sin locks; solo la creación del shard y la lectura
+(`snapshot`, `to_prometheus`) toman el lock del registro. Con métricas activas se fuerza
+la evaluación de calidad de cada reporte (el status depende de ella). Con
+`executor="process"`, las métricas por reparación quedan en los procesos worker; las de
+lote (camino rápido, caché) se registran en el proceso que llama.
+"""
+import threading
+from bisect import bisect_left
+from collections import Counter
+from typing import Any, Dict, List, Optional, Sequence
+
+from pyparsejson.report.repair_report import RepairReport
+
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SIZE_BUCKETS = (100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000, 100_000_000)
+
+ERROR_STATUS = "ERROR"
+
+
+class _Histogram:
+    """Conteos por cubo (el último es +Inf), suma y número de observaciones."""
+    __slots__ = ("bounds", "counts", "sum", "count")
+
+    def __init__(self, bounds: Sequence[float]):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def merge(self, other: "_Histogram"):
+        for i, n in enumerate(other.counts):
+            self.counts[i] += n
+        self.sum += other.sum
+        self.count += other.count
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {"counts": list(self.counts), "sum": self.sum, "count": self.count}
+
+
+class _Shard:
+    """Contadores de un hilo. Solo su hilo escribe en él."""
+
+    def __init__(self, latency_buckets: Sequence[float], size_buckets: Sequence[float]):
+        self.latency_buckets = latency_buckets
+        self.latency: Dict[str, _Histogram] = {}
+        self.sizes = _Histogram(size_buckets)
+        self.rules: Counter = Counter()
+        self.counters: Counter = Counter()
+
+    def latency_for(self, status: str) -> _Histogram:
+        histogram = self.latency.get(status)
+        if histogram is None:
+            histogram = self.latency[status] = _Histogram(self.latency_buckets)
+        return histogram
+
+
+class MetricsRegistry:
+    """Registro de métricas con un shard por hilo (ver el docstring del módulo)."""
+
+    def __init__(self, latency_buckets: Sequence[float] = LATENCY_BUCKETS,
+                 size_buckets: Sequence[float] = SIZE_BUCKETS):
+        self.latency_buckets = tuple(latency_buckets)
+        self.size_buckets = tuple(size_buckets)
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._shards: List[_Shard] = []
+
+    def _shard(self) -> _Shard:
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = self._local.shard = _Shard(self.latency_buckets, self.size_buckets)
+            with self._lock:
+                self._shards.append(shard)
+        return shard
+
+    # --- registro ---
+
+    def observe_parse(self, report: RepairReport, seconds: float, size: int):
+        """Una reparación terminada: latencia por status, tamaño y reglas aplicadas."""
+        shard = self._shard()
+        status = report.status.name if report.status is not None else ERROR_STATUS
+        shard.latency_for(status).observe(seconds)
+        shard.sizes.observe(size)
+        for modification in report.modifications:
+            shard.rules[modification.rule_name] += 1
+
+    def observe_error(self, seconds: float, size: int):
+        """Una reparación que lanzó una excepción (p. ej. modo strict)."""
+        shard = self._shard()
+        shard.latency_for(ERROR_STATUS).observe(seconds)
+        shard.sizes.observe(size)
+
+    def record_fast_path(self, hits: int = 0, misses: int = 0):
+        counters = self._shard().counters
+        counters["fast_path_hits"] += hits
+        counters["fast_path_misses"] += misses
+
+    def record_cache(self, hits: int = 0, misses: int = 0):
+        counters = self._shard().counters
+        counters["cache_hits"] += hits
+        counters["cache_misses"] += misses
+
+    def reset(self):
+        with self._lock:
+            self._shards = []
+            self._local = threading.local()
+
+    # --- lectura ---
+
+    def _merged(self) -> _Shard:
+        total = _Shard(self.latency_buckets, self.size_buckets)
+        with self._lock:
+            shards = list(self._shards)
+        for shard in shards:
+            for status, histogram in list(shard.latency.items()):
+                total.latency_for(status).merge(histogram)
+            total.sizes.merge(shard.sizes)
+            total.rules.update(shard.rules)
+            total.counters.update(shard.counters)
+        return total
+
+    @staticmethod
+    def _rate(hits: int, misses: int) -> Dict[str, Any]:
+        total = hits + misses
+        return {"hits": hits, "misses": misses, "hit_rate": hits / total if total else None}
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Estado agregado de todos los hilos como dict serializable a JSON."""
+        total = self._merged()
+        counters = total.counters
+        return {
+            "parse_latency_seconds": {
+                "buckets": list(self.latency_buckets),
+                "by_status": {status: h.as_dict() for status, h in sorted(total.latency.items())},
+            },
+            "input_size_chars": dict(total.sizes.as_dict(), buckets=list(self.size_buckets)),
+            "rule_applications": dict(sorted(total.rules.items())),
+            "fast_path": self._rate(counters["fast_path_hits"], counters["fast_path_misses"]),
+            "cache": self._rate(counters["cache_hits"], counters["cache_misses"]),
+        }
+
+    def to_prometheus(self, prefix: str = "pyparsejson") -> str:
+        """Estado agregado en el formato de texto de exposición de Prometheus."""
+        total = self._merged()
+        lines: List[str] = []
+
+        def histogram(name: str, help_text: str, series: Dict[str, _Histogram], label: Optional[str]):
+            lines.append(f"# HELP {prefix}_{name} {help_text}")
+            lines.append(f"# TYPE {prefix}_{name} histogram")
+            for value, h in series.items():
+                labels = f'{label}="{value}",' if label else ""
+                cumulative = 0
+                for bound, n in zip(list(h.bounds) + ["+Inf"], h.counts):
+                    cumulative += n
+                    lines.append(f'{prefix}_{name}_bucket{{{labels}le="{bound}"}} {cumulative}')
+                suffix = f"{{{labels[:-1]}}}" if labels else ""
+                lines.append(f"{prefix}_{name}_sum{suffix} {h.sum}")
+                lines.append(f"{prefix}_{name}_count{suffix} {h.count}")
+
+        def counter(name: str, help_text: str, label: str, values: Dict[str, int]):
+            lines.append(f"# HELP {prefix}_{name} {help_text}")
+            lines.append(f"# TYPE {prefix}_{name} counter")
+            for value, n in values.items():
+                lines.append(f'{prefix}_{name}{{{label}="{value}"}} {n}')
+
+        counters = total.counters
+        histogram("parse_latency_seconds", "Repair latency by repair status.",
+                  dict(sorted(total.latency.items())), "status")
+        histogram("input_size_chars", "Size of repaired inputs in characters.", {"": total.sizes}, None)
+        counter("rule_applications_total", "Rule applications that changed the tokens.", "rule",
+                dict(sorted(total.rules.items())))
+        counter("fast_path_total", "Lines decoded by the json.loads fast path (hit) or repaired (miss).",
+                "result", {"hit": counters["fast_path_hits"], "miss": counters["fast_path_misses"]})
+        counter("cache_total", "Batch documents served from the duplicate cache (hit) or repaired (miss).",
+                "result", {"hit": counters["cache_hits"], "miss": counters["cache_misses"]})
+        return "\n".join(lines) + "\n"
+
+
+# Registro de todo el proceso; None = métricas desactivadas
+_active: Optional[MetricsRegistry] = None
+
+
+def enable(registry: Optional[MetricsRegistry] = None) -> MetricsRegistry:
+    """Activa las métricas para todas las instancias de Repair del proceso y devuelve el registro."""
+    global _active
+    _active = registry or _active or MetricsRegistry()
+    return _active
+
+
+def disable():
+    global _active
+    _active = None
+
+
+def get_registry() -> Optional[MetricsRegistry]:
+    """El registro activo del proceso, o None si las métricas están desactivadas."""
+    return _active
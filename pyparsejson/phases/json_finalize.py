@@ -10,9 +10,10 @@ CAMBIOS PRINCIPALES:
 3. Añadida validación de tokens vacíos
 """
 import logging
+from typing import Iterator, List
 
 from pyparsejson.core.context import Context
-from pyparsejson.core.token import TokenType
+from pyparsejson.core.token import Token, TokenType
 from pyparsejson.utils.logger import RepairLogger
 
 
@@ -33,48 +34,74 @@ class JSONFinalize:
             self.logger.warning("⚠️ No hay tokens para procesar, devolviendo objeto vacío")
             return "{}"
 
+        # El f-string por token solo se construye con DEBUG activo
+        if self.logger.debug_enabled:
+            for i, token in enumerate(context.tokens):
+                self.logger.debug(f"[FINALIZE] Token {i}: {token.type.name} = '{token.value}'")
+
+        return "".join(map(self.render, context.tokens))
+
+    def iter_chunks(self, tokens: List[Token], chunk_size: int = 65536) -> Iterator[str]:
+        """
+        Genera el mismo JSON que `process` en fragmentos de aproximadamente `chunk_size`
+        caracteres (como máximo `chunk_size` más el último token), sin construir el
+        string completo.
+        """
+        if not tokens:
+            yield "{}"
+            return
+
+        render = self.render
         parts = []
-        for i, token in enumerate(context.tokens):
-            # DEBUG: Descomentar para ver qué está procesando
-            self.logger.debug(f"[FINALIZE] Token {i}: {token.type.name} = '{token.value}'")
-
-            if token.type == TokenType.STRING:
-                val = token.value
-
-                # Caso 1: Ya tiene comillas dobles válidas → usar tal cual
-                if val.startswith('"') and val.endswith('"') and len(val) >= 2:
-                    parts.append(val)
-                    continue
-
-                # Caso 2: Comillas simples → convertir a dobles
-                if val.startswith("'") and val.endswith("'") and len(val) >= 2:
-                    content = val[1:-1].replace('"', '\\"').replace("\\'", "'")
-                    parts.append(f'"{content}"')
-                    continue
-
-                # Caso 3: Sin comillas → añadir
-                # Importante: Escapar comillas internas
-                content = val.replace('\\', '\\\\').replace('"', '\\"')
-                parts.append(f'"{content}"')
-
-            elif token.type == TokenType.BOOLEAN:
-                # Normalizar a lowercase (true/false estándar JSON)
-                parts.append(token.value.lower())
-
-            elif token.type == TokenType.NULL:
-                parts.append("null")
-
-            elif token.type == TokenType.DATE:
-                # Las fechas siempre van como strings
-                parts.append(f'"{token.value}"')
-
-            elif token.type == TokenType.NUMBER:  # CORRECCIÓN: NUMBER -> NUMBER
-                # Números van sin comillas
-                parts.append(token.value)
-
-            else:
-                # Estructuras (llaves, corchetes) y separadores (comas, dos puntos)
-                parts.append(token.value)
-
-        result = "".join(parts)
-        return result
\ No newline at end of file
+        size = 0
+        for token in tokens:
+            part = render(token)
+            parts.append(part)
+            size += len(part)
+            if size >= chunk_size:
+                yield "".join(parts)
+                parts = []
+                size = 0
+
+        if parts:
+            yield "".join(parts)
+
+    @staticmethod
+    def render(token: Token) -> str:
+        """
+        Devuelve el fragmento JSON de un token individual, SIN duplicar comillas.
+        """
+        if token.type == TokenType.STRING:
+            val = token.value
+
+            # Caso 1: Ya tiene comillas dobles válidas → usar tal cual
+            if val.startswith('"') and val.endswith('"') and len(val) >= 2:
+                return val
+
+            # Caso 2: Comillas simples → convertir a dobles
+            if val.startswith("'") and val.endswith("'") and len(val) >= 2:
+                content = val[1:-1].replace('"', '\\"').replace("\\'", "'")
+                return f'"{content}"'
+
+            # Caso 3: Sin comillas → añadir
+            # Importante: Escapar comillas internas
+            content = val.replace('\\', '\\\\').replace('"', '\\"')
+            return f'"{content}"'
+
+        elif token.type == TokenType.BOOLEAN:
+            # Normalizar a lowercase (true/false estándar JSON)
+            return token.value.lower()
+
+        elif token.type == TokenType.NULL:
+            return "null"
+
+        elif token.type == TokenType.DATE:
+            # Las fechas siempre van como strings
+            return f'"{token.value}"'
+
+        elif token.type == TokenType.NUMBER:  # CORRECCIÓN: NUMBER -> NUMBER
+            # Números van sin comillas
+            return token.value
+
+        # Estructuras (llaves, corchetes) y separadores (comas, dos puntos)
+        return token.value
@@ -0,0 +1,197 @@
+# Path: pyparsejson\phases\local_repair.py
+import json
+from typing import List, Optional
+
+from pyparsejson.core.context import Context
+from pyparsejson.core.engine import RuleEngine
+from pyparsejson.core.token import Token, TokenType
+from pyparsejson.phases.object_build import (TokenValidator, _COLON, _COMMA_OR_END, _KEY, _KEY_OR_END,
+                                             _VALUE, _VALUE_OR_END)
+from pyparsejson.rules.registry import RuleRegistry
+
+_CLOSERS = (TokenType.RBRACE, TokenType.RBRACKET)
+_CLOSER_VALUES = {TokenType.RBRACE: "}", TokenType.RBRACKET: "]"}
+
+
+class LocalRepairer:
+    """
+    Bucle de re-reparación guiado por la posición del error.
+
+    Cuando el bucle global ya convergió pero los tokens aún no son JSON estricto, el
+    validador indica el token exacto del fallo y qué esperaba en ese punto. Entonces:
+
+    1. Se ejecutan solo las reglas de valores (`local_tags`) sobre una ventana de
+       tokens alrededor del fallo (una vez por posición).
+    2. Si eso no basta, se aplica la edición mínima que satisface la gramática en ese
+       punto (insertar ',' o ':', quitar un separador sobrante, cambiar un cierre
+       equivocado, entrecomillar un literal inválido, ...).
+
+    Tras cada cambio, la validación se reanuda desde el último punto de control
+    anterior a la ventana, sin re-ejecutar el documento completo.
+    """
+
+    local_tags: List[str] = ["values"]
+
+    def __init__(self, engine: RuleEngine, window: int = 8, max_steps: int = 64):
+        self.engine = engine
+        self.window = window
+        self.max_steps = max_steps
+        self._rules = None
+
+    @property
+    def rules(self):
+        if self._rules is None:
+            classes = {cls for tag in self.local_tags for cls in RuleRegistry.get_rules(tag)}
+            self._rules = sorted((cls() for cls in classes), key=lambda r: (r.priority, r.name))
+        return self._rules
+
+    def repair(self, context: Context) -> bool:
+        """
+        Repara localmente `context.tokens` (in-place).
+
+        Returns:
+            True si los tokens quedan como JSON estricto.
+        """
+        validator = TokenValidator()
+        error = validator.run(context.tokens)
+        rules_tried = set()
+        steps = 0
+
+        while error is not None and steps < self.max_steps:
+            steps += 1
+            index = error.index
+            start = max(0, index - self.window)
+
+            if index not in rules_tried:
+                rules_tried.add(index)
+                if self._run_local_rules(context, start, index + self.window + 1):
+                    error = validator.run(context.tokens, resume_from=start)
+                    continue
+
+            description = self._edit(context.tokens, index, validator)
+            if description is None:
+                break
+
+            context.mark_changed()
+            context.record_rule(self.__class__.__name__)
+            context.record_modification(self.__class__.__name__, description)
+            error = validator.run(context.tokens, resume_from=max(0, index - 1))
+
+        return error is None
+
+    def _run_local_rules(self, context: Context, start: int, end: int) -> bool:
+        window = Context(context.initial_text, tokens=context.tokens[start:end], dry_run=context.dry_run,
+                         collect_rule_stats=context.collect_rule_stats, hooks=context.hooks,
+                         scheduler=context.scheduler)
+        changed = self.engine.run_rules(window, self.rules)
+        for rule_name, stats in window.report.rule_stats.items():
+            context.rule_stats(rule_name).merge(stats)
+        context.report.timings.rule_evaluations += window.report.timings.rule_evaluations
+        if not changed:
+            return False
+
+        context.tokens[start:end] = window.tokens
+        context.mark_changed()
+        for rule_name in window.report.applied_rules:
+            context.record_rule(rule_name)
+        context.report.modifications.extend(window.report.modifications)
+        return True
+
+    def _edit(self, tokens: List[Token], index: int, validator: TokenValidator) -> Optional[str]:
+        """
+        Aplica la edición mínima que la gramática espera en `index`.
+        Devuelve su descripción, o None si no hay ninguna razonable.
+        """
+        state = validator.state
+        previous = tokens[index - 1].type if index > 0 else None
+
+        if index >= len(tokens):
+            # Fin inesperado: completar lo que falta, de uno en uno
+            if state == _COLON:
+                return self._insert(tokens, index, TokenType.COLON, ":")
+            if state == _VALUE:
+                if previous == TokenType.COMMA:
+                    return self._delete(tokens, index - 1)
+                return self._insert(tokens, index, TokenType.NULL, "null")
+            if state == _KEY and previous == TokenType.COMMA:
+                return self._delete(tokens, index - 1)
+            closer = validator.expected_closer
+            if closer is None:
+                return None
+            return self._insert(tokens, index, closer, _CLOSER_VALUES[closer])
+
+        ttype = tokens[index].type
+
+        if state == _COMMA_OR_END:
+            if ttype in _CLOSERS:
+                return self._replace_closer(tokens, index, validator.expected_closer)
+            return self._insert(tokens, index, TokenType.COMMA, ",")
+
+        if state == _COLON:
+            if ttype == TokenType.ASSIGN:
+                return self._replace(tokens, index, TokenType.COLON, ":")
+            return self._insert(tokens, index, TokenType.COLON, ":")
+
+        if state == _VALUE or state == _VALUE_OR_END:
+            if ttype == TokenType.COMMA:
+                # `[1,,2]` → elemento vacío; `"a":,` → valor ausente
+                if validator.stack is not None and validator.stack[0] and previous == TokenType.COLON:
+                    return self._insert(tokens, index, TokenType.NULL, "null")
+                return self._delete(tokens, index)
+            if ttype in _CLOSERS:
+                if previous == TokenType.COMMA:
+                    return self._delete(tokens, index - 1)
+                if previous == TokenType.COLON:
+                    return self._insert(tokens, index, TokenType.NULL, "null")
+                return self._replace_closer(tokens, index, validator.expected_closer)
+            if ttype in (TokenType.COLON, TokenType.ASSIGN, TokenType.LPAREN, TokenType.RPAREN):
+                return self._delete(tokens, index)
+            return self._quote(tokens, index)
+
+        if state == _KEY or state == _KEY_OR_END:
+            if ttype in _CLOSERS:
+                if previous == TokenType.COMMA:
+                    return self._delete(tokens, index - 1)
+                return self._replace_closer(tokens, index, TokenType.RBRACE)
+            if ttype == TokenType.COMMA:
+                return self._delete(tokens, index)
+            if ttype in (TokenType.LBRACE, TokenType.LBRACKET, TokenType.COLON, TokenType.ASSIGN):
+                return None
+            return self._quote(tokens, index)
+
+        # _DONE: solo se descartan cierres o comas sobrantes tras el valor raíz
+        if ttype in _CLOSERS or ttype == TokenType.COMMA:
+            return self._delete(tokens, index)
+        return None
+
+    # ------------------------------------------------------------------
+    # Ediciones elementales
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _insert(tokens: List[Token], index: int, ttype: TokenType, value: str) -> str:
+        neighbour = tokens[min(index, len(tokens) - 1)]
+        tokens.insert(index, Token(ttype, value, value, neighbour.position, neighbour.line, neighbour.column))
+        return f"insert '{value}' at token {index}"
+
+    @staticmethod
+    def _delete(tokens: List[Token], index: int) -> str:
+        removed = tokens.pop(index)
+        return f"delete '{removed.value}' at token {index}"
+
+    @staticmethod
+    def _replace(tokens: List[Token], index: int, ttype: TokenType, value: str) -> str:
+        old = tokens[index]
+        tokens[index] = Token(ttype, value, old.raw_value, old.position, old.line, old.column)
+        return f"replace '{old.value}' with '{value}' at token {index}"
+
+    def _replace_closer(self, tokens: List[Token], index: int, closer: Optional[TokenType]) -> Optional[str]:
+        if closer is None or tokens[index].type == closer:
+            return None
+        return self._replace(tokens, index, closer, _CLOSER_VALUES[closer])
+
+    def _quote(self, tokens: List[Token], index: int) -> str:
+        # Literal inválido en su posición: se conserva como string JSON válido
+        value = tokens[index].value
+        if tokens[index].type == TokenType.STRING and len(value) >= 2 and value[0] == value[-1] and value[0] in "\"'":
+            value = value[1:-1]
+        return self._replace(tokens, index, TokenType.STRING, json.dumps(value, ensure_ascii=False))
@@ -0,0 +1,419 @@
+# Path: pyparsejson\phases\object_build.py
+import bisect
+import json
+from json.decoder import scanstring
+from json.scanner import NUMBER_RE
+from typing import Any, Callable, List, Optional, Tuple
+
+from pyparsejson.core.token import Token, TokenType
+from pyparsejson.phases.json_finalize import JSONFinalize
+
+
+class TokenBuildError(ValueError):
+    """
+    El flujo de tokens no forma un documento JSON estricto.
+    `index` es la posición del token donde se detectó el problema.
+    """
+
+    def __init__(self, msg: str, index: int):
+        super().__init__(f"{msg} (token {index})")
+        self.msg = msg
+        self.index = index
+
+
+# Estados del autómata
+_VALUE = 0             # se espera un valor
+_VALUE_OR_END = 1      # justo después de '[': valor o ']'
+_KEY = 2               # después de ',' en un objeto: clave
+_KEY_OR_END = 3        # justo después de '{': clave o '}'
+_COLON = 4             # después de una clave
+_COMMA_OR_END = 5      # después de un valor dentro de un contenedor
+_DONE = 6              # valor raíz completo
+
+_SCALARS = (TokenType.STRING, TokenType.DATE, TokenType.NUMBER, TokenType.BOOLEAN, TokenType.NULL)
+
+
+class TokenObjectBuilder:
+    """
+    Construye el objeto Python directamente a partir de los tokens reparados,
+    sin pasar por el texto JSON intermedio (`JSONFinalize` + `json.loads`).
+
+    Es iterativo (pila explícita), por lo que el anidamiento profundo no choca con
+    el límite de recursión. Acepta los mismos hooks que `json.loads`.
+
+    Si un token no es un lexema JSON válido en su posición, lanza `TokenBuildError`;
+    el llamador debe recurrir entonces al camino de texto, que es la referencia.
+    """
+
+    def __init__(self, object_hook: Optional[Callable[[dict], Any]] = None,
+                 object_pairs_hook: Optional[Callable[[List[tuple]], Any]] = None,
+                 parse_float: Optional[Callable[[str], Any]] = None,
+                 parse_int: Optional[Callable[[str], Any]] = None):
+        self.object_hook = object_hook
+        self.object_pairs_hook = object_pairs_hook
+        self.parse_float = parse_float or float
+        self.parse_int = parse_int or int
+
+    def build(self, tokens: List[Token]) -> Any:
+        """
+        Convierte la lista de tokens en un objeto Python.
+
+        Raises:
+            TokenBuildError: Si los tokens no forman JSON estricto.
+        """
+        if not tokens:
+            # Mismo comportamiento que el finalizador: documento vacío → {}
+            return self._make_object([])
+
+        # Bucle caliente: todo en variables locales y sin llamadas por token
+        # salvo para los escalares que no son strings con comillas dobles.
+        STRING, NUMBER = TokenType.STRING, TokenType.NUMBER
+        COMMA, COLON = TokenType.COMMA, TokenType.COLON
+        LBRACE, RBRACE = TokenType.LBRACE, TokenType.RBRACE
+        LBRACKET, RBRACKET = TokenType.LBRACKET, TokenType.RBRACKET
+        scalar = self._scalar
+        close = self._close
+        number_match = NUMBER_RE.match
+        parse_float, parse_int = self.parse_float, self.parse_int
+
+        # Pila de contenedores abiertos: (lista, es_objeto). Las claves pendientes
+        # viven en su propia pila paralela para los objetos.
+        stack = []
+        keys = []
+        container = None
+        is_object = False
+        state = _VALUE
+        result = None
+
+        for index, token in enumerate(tokens):
+            ttype = token.type
+
+            if state == _COMMA_OR_END:
+                if ttype is COMMA:
+                    state = _KEY if is_object else _VALUE
+                    continue
+                if ttype is (RBRACE if is_object else RBRACKET):
+                    value = close(container, is_object)
+                    stack.pop()
+                    if is_object:
+                        keys.pop()
+                    # Añadir el contenedor cerrado a su padre (o fijarlo como raíz)
+                    if stack:
+                        container, is_object = stack[-1]
+                        if is_object:
+                            container.append((keys[-1], value))
+                        else:
+                            container.append(value)
+                    else:
+                        result = value
+                        state = _DONE
+                    continue
+                raise TokenBuildError("Expecting ',' delimiter", index)
+
+            if state == _VALUE or state == _VALUE_OR_END:
+                if ttype is STRING:
+                    val = token.value
+                    if len(val) >= 2 and val[0] == '"' and val[-1] == '"':
+                        try:
+                            value, end = scanstring(val, 1)
+                        except json.JSONDecodeError as e:
+                            raise TokenBuildError(f"Invalid string literal: {e.msg}", index) from None
+                        if end != len(val):
+                            raise TokenBuildError("Invalid string literal", index)
+                    else:
+                        value = self._string(token, index)
+                elif ttype is NUMBER:
+                    val = token.value
+                    match = number_match(val)
+                    if match is None:
+                        raise TokenBuildError(f"Invalid number literal {val!r}", index)
+                    if match.end() != len(val):
+                        raise TokenBuildError(f"Invalid number literal {val!r}", index)
+                    integer, frac, exp = match.groups()
+                    value = parse_float(val) if frac or exp else parse_int(val)
+                elif ttype is LBRACE:
+                    container, is_object = [], True
+                    stack.append((container, True))
+                    keys.append(None)
+                    state = _KEY_OR_END
+                    continue
+                elif ttype is LBRACKET:
+                    container, is_object = [], False
+                    stack.append((container, False))
+                    state = _VALUE_OR_END
+                    continue
+                elif ttype is RBRACKET and state == _VALUE_OR_END:
+                    # Array vacío: se cierra como cualquier otro contenedor
+                    state = _COMMA_OR_END
+                    value = close(container, False)
+                    stack.pop()
+                    if stack:
+                        container, is_object = stack[-1]
+                        if is_object:
+                            container.append((keys[-1], value))
+                        else:
+                            container.append(value)
+                    else:
+                        result = value
+                        state = _DONE
+                    continue
+                elif ttype in _SCALARS:
+                    value = scalar(token, index)
+                else:
+                    raise TokenBuildError("Expecting value", index)
+
+                if container is None:
+                    result = value
+                    state = _DONE
+                elif is_object:
+                    container.append((keys[-1], value))
+                    state = _COMMA_OR_END
+                else:
+                    container.append(value)
+                    state = _COMMA_OR_END
+                continue
+
+            if state == _KEY or state == _KEY_OR_END:
+                if ttype is RBRACE and state == _KEY_OR_END:
+                    # Objeto vacío
+                    state = _COMMA_OR_END
+                    value = close(container, True)
+                    stack.pop()
+                    keys.pop()
+                    if stack:
+                        container, is_object = stack[-1]
+                        if is_object:
+                            container.append((keys[-1], value))
+                        else:
+                            container.append(value)
+                    else:
+                        result = value
+                        state = _DONE
+                    continue
+                if ttype is STRING:
+                    val = token.value
+                    if len(val) >= 2 and val[0] == '"' and val[-1] == '"':
+                        try:
+                            key, end = scanstring(val, 1)
+                        except json.JSONDecodeError as e:
+                            raise TokenBuildError(f"Invalid string literal: {e.msg}", index) from None
+                        if end != len(val):
+                            raise TokenBuildError("Invalid string literal", index)
+                    else:
+                        key = self._string(token, index)
+                elif ttype is TokenType.DATE:
+                    key = self._string(token, index)
+                else:
+                    raise TokenBuildError("Expecting property name enclosed in double quotes", index)
+                keys[-1] = key
+                state = _COLON
+                continue
+
+            if state == _COLON:
+                if ttype is not COLON:
+                    raise TokenBuildError("Expecting ':' delimiter", index)
+                state = _VALUE
+                continue
+
+            # _DONE
+            raise TokenBuildError("Extra data after JSON value", index)
+
+        if state != _DONE:
+            raise TokenBuildError("Unexpected end of tokens", len(tokens))
+        return result
+
+    def validate(self, tokens: List[Token]) -> None:
+        """
+        Comprueba que los tokens forman JSON estricto con la misma gramática que `build`,
+        pero sin construir el objeto: la memoria usada es proporcional a la profundidad
+        de anidamiento, no al tamaño del documento.
+
+        Raises:
+            TokenBuildError: Si los tokens no forman JSON estricto.
+        """
+        error = TokenValidator(checkpoint_interval=0).run(tokens)
+        if error is not None:
+            raise error
+
+    # ------------------------------------------------------------------
+    # Auxiliares
+    # ------------------------------------------------------------------
+    def _close(self, items: list, is_object: bool) -> Any:
+        return self._make_object(items) if is_object else items
+
+    def _make_object(self, pairs: List[tuple]) -> Any:
+        if self.object_pairs_hook is not None:
+            return self.object_pairs_hook(pairs)
+        obj = dict(pairs)
+        if self.object_hook is not None:
+            return self.object_hook(obj)
+        return obj
+
+    def _scalar(self, token: Token, index: int) -> Any:
+        ttype = token.type
+        if ttype == TokenType.STRING or ttype == TokenType.DATE:
+            return self._string(token, index)
+
+        if ttype == TokenType.NUMBER:
+            value = token.value
+            match = NUMBER_RE.fullmatch(value)
+            if match is None:
+                raise TokenBuildError(f"Invalid number literal {value!r}", index)
+            integer, frac, exp = match.groups()
+            if frac or exp:
+                return self.parse_float(value)
+            return self.parse_int(value)
+
+        if ttype == TokenType.BOOLEAN:
+            literal = token.value.lower()
+            if literal == "true":
+                return True
+            if literal == "false":
+                return False
+            raise TokenBuildError(f"Invalid boolean literal {token.value!r}", index)
+
+        # NULL: el finalizador siempre lo emite como `null`
+        return None
+
+    @staticmethod
+    def _string(token: Token, index: int) -> str:
+        # Misma representación que produciría JSONFinalize, decodificada con el scanner de json
+        text = JSONFinalize.render(token)
+        try:
+            value, end = scanstring(text, 1)
+        except json.JSONDecodeError as e:
+            raise TokenBuildError(f"Invalid string literal: {e.msg}", index) from None
+        if end != len(text):
+            raise TokenBuildError("Invalid string literal", index)
+        return value
+
+
+# Pila persistente del validador: (es_objeto, padre). Una instantánea es solo la referencia.
+_Stack = Optional[Tuple[bool, Any]]
+
+
+class TokenValidator:
+    """
+    Validador reanudable de la gramática de `TokenObjectBuilder`.
+
+    Cada `checkpoint_interval` tokens guarda un punto de control (índice, estado, pila).
+    Tras editar los tokens a partir de una posición, `run(tokens, resume_from=...)`
+    retoma desde el último punto de control anterior a la edición en lugar de volver
+    a validar el documento entero. Con `checkpoint_interval=0` no guarda ninguno.
+
+    Al fallar, `state` y `stack` describen qué se esperaba en el token del error.
+    """
+
+    def __init__(self, checkpoint_interval: int = 256):
+        self.checkpoint_interval = checkpoint_interval
+        self._checkpoint_indices: List[int] = []
+        self._checkpoints: List[Tuple[int, _Stack]] = []
+        self.state = _VALUE
+        self.stack: _Stack = None
+
+    @property
+    def expected_closer(self) -> Optional[TokenType]:
+        """Cierre que correspondería al contenedor abierto más interno."""
+        if self.stack is None:
+            return None
+        return TokenType.RBRACE if self.stack[0] else TokenType.RBRACKET
+
+    def run(self, tokens: List[Token], resume_from: int = 0) -> Optional[TokenBuildError]:
+        """
+        Valida `tokens` desde el último punto de control con índice <= `resume_from`
+        (o desde el principio). Los puntos de control posteriores se descartan.
+
+        Returns:
+            None si los tokens son JSON estricto; si no, el `TokenBuildError` del primer fallo.
+        """
+        position = bisect.bisect_right(self._checkpoint_indices, resume_from)
+        del self._checkpoint_indices[position:]
+        del self._checkpoints[position:]
+        if self._checkpoint_indices:
+            start = self._checkpoint_indices[-1]
+            state, stack = self._checkpoints[-1]
+        else:
+            start, state, stack = 0, _VALUE, None
+
+        error = None
+        if tokens:
+            state, stack, error = self._scan(tokens, start, state, stack)
+        self.state, self.stack = state, stack
+        return error
+
+    def _scan(self, tokens: List[Token], start: int, state: int, stack: _Stack):
+        COMMA, COLON = TokenType.COMMA, TokenType.COLON
+        LBRACE, RBRACE = TokenType.LBRACE, TokenType.RBRACE
+        LBRACKET, RBRACKET = TokenType.LBRACKET, TokenType.RBRACKET
+        STRING, DATE, NUMBER = TokenType.STRING, TokenType.DATE, TokenType.NUMBER
+        check_string = TokenObjectBuilder._string
+        interval = self.checkpoint_interval
+        indices, checkpoints = self._checkpoint_indices, self._checkpoints
+
+        for index in range(start, len(tokens)):
+            if interval and index % interval == 0 and (not indices or indices[-1] < index):
+                indices.append(index)
+                checkpoints.append((state, stack))
+
+            token = tokens[index]
+            ttype = token.type
+
+            try:
+                if state == _COMMA_OR_END:
+                    if ttype is COMMA:
+                        state = _KEY if stack[0] else _VALUE
+                        continue
+                    if ttype is (RBRACE if stack[0] else RBRACKET):
+                        stack = stack[1]
+                        state = _COMMA_OR_END if stack is not None else _DONE
+                        continue
+                    raise TokenBuildError("Expecting ',' delimiter", index)
+
+                if state == _VALUE or state == _VALUE_OR_END:
+                    if ttype is LBRACE or ttype is LBRACKET:
+                        stack = (ttype is LBRACE, stack)
+                        state = _KEY_OR_END if ttype is LBRACE else _VALUE_OR_END
+                        continue
+                    if ttype is RBRACKET and state == _VALUE_OR_END:
+                        # Array vacío
+                        stack = stack[1]
+                        state = _COMMA_OR_END if stack is not None else _DONE
+                        continue
+                    if ttype is STRING or ttype is DATE:
+                        check_string(token, index)
+                    elif ttype is NUMBER:
+                        if NUMBER_RE.fullmatch(token.value) is None:
+                            raise TokenBuildError(f"Invalid number literal {token.value!r}", index)
+                    elif ttype is TokenType.BOOLEAN:
+                        if token.value.lower() not in ("true", "false"):
+                            raise TokenBuildError(f"Invalid boolean literal {token.value!r}", index)
+                    elif ttype is not TokenType.NULL:
+                        raise TokenBuildError("Expecting value", index)
+                    state = _COMMA_OR_END if stack is not None else _DONE
+                    continue
+
+                if state == _KEY or state == _KEY_OR_END:
+                    if ttype is RBRACE and state == _KEY_OR_END:
+                        # Objeto vacío
+                        stack = stack[1]
+                        state = _COMMA_OR_END if stack is not None else _DONE
+                        continue
+                    if ttype is not STRING and ttype is not DATE:
+                        raise TokenBuildError("Expecting property name enclosed in double quotes", index)
+                    check_string(token, index)
+                    state = _COLON
+                    continue
+
+                if state == _COLON:
+                    if ttype is not COLON:
+                        raise TokenBuildError("Expecting ':' delimiter", index)
+                    state = _VALUE
+                    continue
+
+                raise TokenBuildError("Extra data after JSON value", index)
+            except TokenBuildError as error:
+                return state, stack, error
+
+        if state != _DONE:
+            return state, stack, TokenBuildError("Unexpected end of tokens", len(tokens))
+        return state, stack, None
@@ -0,0 +1,187 @@
+# Path: pyparsejson\phases\salvage.py
+import bisect
+import json
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+# Estados del escáner (mismo autómata que TokenObjectBuilder, pero sobre texto)
+_VALUE = 0
+_VALUE_OR_END = 1
+_KEY = 2
+_KEY_OR_END = 3
+_COLON = 4
+_COMMA_OR_END = 5
+_DONE = 6
+
+# Cuerpo de string completo hasta la comilla de cierre. Los escapes \u incompletos
+# no cuentan como consumidos, para poder cortar justo antes de ellos.
+_STRING_BODY = re.compile(r'(?:[^"\\]|\\u[0-9a-fA-F]{4}|\\[^u])*', re.S)
+# Resto de un string que termina a mitad de un escape (`\` o `\u` incompleto), o nada
+_PARTIAL_ESCAPE = re.compile(r'(?:\\(?:u[0-9a-fA-F]{0,3})?)?')
+_SCALAR = re.compile(r'-?(?:0|[1-9]\d*)(?:\.\d+)?(?:[eE][-+]?\d+)?|true|false|null')
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+_CLOSERS = {'{': '}', '[': ']'}
+_VALUE_END = frozenset(',]} \t\n\r')
+
+# Pila persistente: (cierre, es_objeto, padre). Guardar una instantánea es guardar la referencia.
+_Stack = Optional[Tuple[str, bool, Any]]
+
+
+class TruncationSalvager:
+    """
+    Recupera el mayor prefijo válido de un JSON truncado.
+
+    Una sola pasada sobre el texto sigue la gramática JSON (pila de contenedores y
+    estado dentro de strings) y anota los "puntos de corte": posiciones tras un valor
+    completo (o tras abrir un contenedor) junto con una instantánea de la pila. El sufijo
+    de cierre exacto de cada corte se deriva de su pila, así que el miembro incompleto
+    final se descarta y todo lo anterior se conserva. Un string de valor truncado se
+    cierra en lugar de descartarse.
+
+    El escáner se detiene en el primer error estructural, por lo que el último corte
+    suele ser válido a la primera. Si `json.loads` aún falla (p. ej. un escape inválido
+    anterior), se busca con bisección el último corte anterior a la posición del error.
+    `json.loads` se llama como mucho `max_attempts` veces.
+    """
+
+    def __init__(self, decode_kwargs: Optional[Dict[str, Any]] = None, max_attempts: int = 3):
+        self.decode_kwargs = decode_kwargs or {}
+        self.max_attempts = max_attempts
+
+    def salvage(self, text: str) -> Tuple[bool, Any, str]:
+        """
+        Returns:
+            (éxito, objeto, texto_json). Si no hay nada recuperable: (False, None, "").
+        """
+        positions, stacks, tail = self.scan(text)
+        if not positions and tail is None:
+            return False, None, ""
+
+        # Primer intento: el corte más avanzado. `tail` es el cierre de un string de
+        # valor truncado, que va más allá del último corte estructural.
+        if tail is not None:
+            candidate = tail
+            index = len(positions)
+        else:
+            index = len(positions) - 1
+            candidate = text[:positions[index]] + self._closers(stacks[index])
+
+        for _ in range(self.max_attempts):
+            try:
+                return True, json.loads(candidate, **self.decode_kwargs), candidate
+            except json.JSONDecodeError as e:
+                # El error está antes de e.pos: probar el último corte que no lo incluya,
+                # siempre por detrás del intento anterior.
+                index = min(bisect.bisect_right(positions, e.pos) - 1, index - 1)
+            if index < 0:
+                break
+            candidate = text[:positions[index]] + self._closers(stacks[index])
+
+        return False, None, ""
+
+    def scan(self, text: str) -> Tuple[List[int], List[_Stack], Optional[str]]:
+        """
+        Recorre `text` una vez y devuelve las posiciones de corte, la pila en cada una
+        y, si el texto termina dentro de un string de valor, el candidato que lo cierra.
+        """
+        positions: List[int] = []
+        stacks: List[_Stack] = []
+        tail = None
+
+        n = len(text)
+        stack: _Stack = None
+        state = _VALUE
+        i = _WHITESPACE.match(text, 0).end()
+
+        while i < n:
+            c = text[i]
+
+            if state == _COMMA_OR_END:
+                if c == ',':
+                    state = _KEY if stack[1] else _VALUE
+                    i += 1
+                elif c == stack[0]:
+                    stack = stack[2]
+                    i += 1
+                    state = _COMMA_OR_END if stack is not None else _DONE
+                    positions.append(i)
+                    stacks.append(stack)
+                else:
+                    break
+
+            elif state == _VALUE or state == _VALUE_OR_END:
+                if c == '{' or c == '[':
+                    stack = (_CLOSERS[c], c == '{', stack)
+                    state = _KEY_OR_END if c == '{' else _VALUE_OR_END
+                    i += 1
+                    # Contenedor recién abierto: cerrarlo ya da un valor válido
+                    positions.append(i)
+                    stacks.append(stack)
+                elif c == ']' and state == _VALUE_OR_END:
+                    stack = stack[2]
+                    i += 1
+                    state = _COMMA_OR_END if stack is not None else _DONE
+                    positions.append(i)
+                    stacks.append(stack)
+                elif c == '"':
+                    body = _STRING_BODY.match(text, i + 1)
+                    end = body.end()
+                    if end >= n or text[end] != '"':
+                        if _PARTIAL_ESCAPE.fullmatch(text, end):
+                            # String de valor truncado: se conserva cerrándolo
+                            tail = text[:end] + '"' + self._closers(stack)
+                        break
+                    i = end + 1
+                    state = _COMMA_OR_END if stack is not None else _DONE
+                    positions.append(i)
+                    stacks.append(stack)
+                else:
+                    match = _SCALAR.match(text, i)
+                    if match is None:
+                        break
+                    end = match.end()
+                    if end < n and text[end] not in _VALUE_END:
+                        # Literal cortado o mal formado (p. ej. `12.` o `tru`)
+                        break
+                    i = end
+                    state = _COMMA_OR_END if stack is not None else _DONE
+                    positions.append(i)
+                    stacks.append(stack)
+
+            elif state == _KEY or state == _KEY_OR_END:
+                if c == '}' and state == _KEY_OR_END:
+                    stack = stack[2]
+                    i += 1
+                    state = _COMMA_OR_END if stack is not None else _DONE
+                    positions.append(i)
+                    stacks.append(stack)
+                elif c == '"':
+                    end = _STRING_BODY.match(text, i + 1).end()
+                    if end >= n or text[end] != '"':
+                        break
+                    i = end + 1
+                    state = _COLON
+                else:
+                    break
+
+            elif state == _COLON:
+                if c != ':':
+                    break
+                i += 1
+                state = _VALUE
+
+            else:
+                # _DONE: datos sobrantes tras el valor raíz
+                break
+
+            i = _WHITESPACE.match(text, i).end()
+
+        return positions, stacks, tail
+
+    @staticmethod
+    def _closers(stack: _Stack) -> str:
+        closers = []
+        while stack is not None:
+            closers.append(stack[0])
+            stack = stack[2]
+        return "".join(closers)
@@ -1,6 +1,6 @@
 # Path: pyparsejson\phases\tokenize.py
 import re
-from typing import List
+from typing import Iterator, List
 from pyparsejson.core.token import Token, TokenType
 
 
@@ -59,6 +59,8 @@ class TolerantTokenizer:
         (TokenType.UNKNOWN, r'.'),
     ]
 
+    _WHITESPACE = re.compile(r'\s+')
+
     def __init__(self):
         # Compilar regex una sola vez para eficiencia
         self.compiled_patterns = []
@@ -70,13 +72,20 @@ class TolerantTokenizer:
         """
         Procesa el texto y devuelve una lista de tokens.
         """
-        tokens = []
+        return list(self.iter_tokens(text))
+
+    def iter_tokens(self, text: str) -> Iterator[Token]:
+        """
+        Igual que `tokenize`, pero produce los tokens de uno en uno (permite
+        tokenizar de forma cooperativa entradas grandes).
+        """
         pos = 0
         line = 1
         column = 1
         while pos < len(text):
-            # Saltar espacios en blanco y actualizar posición
-            match_space = re.match(r'\s+', text[pos:])
+            # Saltar espacios en blanco y actualizar posición (sin copiar text[pos:]:
+            # la copia por cada hueco hacía la tokenización cuadrática)
+            match_space = self._WHITESPACE.match(text, pos)
             if match_space:
                 whitespace = match_space.group(0)
                 newlines = whitespace.count('\n')
@@ -98,14 +107,14 @@ class TolerantTokenizer:
                     if token_type == TokenType.BARE_WORD and value == ".":
                         continue
 
-                    tokens.append(Token(
+                    yield Token(
                         type=token_type,
                         value=value,
                         raw_value=value,
                         position=pos,
                         line=line,
                         column=column
-                    ))
+                    )
 
                     pos += len(value)
                     column += len(value)
@@ -115,6 +124,4 @@ class TolerantTokenizer:
             # Si no se encuentra ninguna coincidencia, avanzar para evitar bucle infinito
             if not match_found:
                 pos += 1
-                column += 1
-
-        return tokens
\ No newline at end of file
+                column += 1
\ No newline at end of file
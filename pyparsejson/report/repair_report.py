@@ -1,6 +1,6 @@
 from dataclasses import dataclass, field
 from enum import Enum, auto
-from typing import List, Optional, Any
+from typing import Dict, List, Optional, Any, Callable
 
 class RepairStatus(Enum):
     SUCCESS_STRICT_JSON = auto()
@@ -16,16 +16,194 @@ class RepairModification:
     rule_name: str
     diff: str
 
+
+@dataclass
+class RuleStats:
+    """
+    Contadores de una regla durante una reparación (ver `Repair(collect_rule_stats=True)`).
+
+    `tokens_scanned` suma el número de tokens presentes en cada llamada a `applies()` y
+    `apply()`: es una cota superior de lo que la regla pudo recorrer. `changes` cuenta
+    las llamadas a `apply()` que modificaron los tokens.
+    """
+    applies_calls: int = 0
+    applies_seconds: float = 0.0
+    apply_calls: int = 0
+    apply_seconds: float = 0.0
+    tokens_scanned: int = 0
+    changes: int = 0
+
+    @property
+    def total_seconds(self) -> float:
+        return self.applies_seconds + self.apply_seconds
+
+    def merge(self, other: "RuleStats"):
+        self.applies_calls += other.applies_calls
+        self.applies_seconds += other.applies_seconds
+        self.apply_calls += other.apply_calls
+        self.apply_seconds += other.apply_seconds
+        self.tokens_scanned += other.tokens_scanned
+        self.changes += other.changes
+
+
+@dataclass
+class PhaseTimings:
+    """
+    Duraciones (en segundos, reloj monotónico `time.perf_counter`) de cada fase del
+    pipeline, más el tamaño del flujo de tokens y las evaluaciones de reglas.
+
+    Se recogen siempre: son unas pocas lecturas del reloj por reparación. `quality`
+    solo se rellena cuando se resuelve la evaluación diferida del reporte. En `aparse`
+    cooperativo, las fases que ceden el control incluyen el tiempo cedido al event loop.
+    """
+    pre_normalize: float = 0.0
+    tokenize: float = 0.0
+    repair_loop: float = 0.0
+    local_repair: float = 0.0
+    build: float = 0.0
+    finalize: float = 0.0
+    json_loads: float = 0.0
+    fallback: float = 0.0
+    quality: float = 0.0
+    tokens_before: int = 0
+    tokens_after: int = 0
+    rule_evaluations: int = 0
+
+    PHASES = ("pre_normalize", "tokenize", "repair_loop", "local_repair", "build",
+              "finalize", "json_loads", "fallback", "quality")
+
+    @property
+    def total(self) -> float:
+        return sum(getattr(self, phase) for phase in self.PHASES)
+
+    def as_dict(self) -> Dict[str, float]:
+        """Duración por fase, en el orden en que se ejecutan."""
+        return {phase: getattr(self, phase) for phase in self.PHASES}
+
+
+@dataclass
+class MemoryUsage:
+    """Bytes asignados por una fase según `tracemalloc`."""
+    peak: int = 0       # pico por encima de la memoria viva al empezar la fase
+    retained: int = 0   # diferencia de memoria viva entre el final y el inicio (negativa si libera)
+
+
+@dataclass
+class PhaseMemory:
+    """
+    Memoria de una reparación por fase (ver `Repair(profile_memory=True)`), medida con
+    `tracemalloc`. Las fases son las de `PhaseTimings`; las que no se ejecutaron no
+    aparecen. Lectura de los casos habituales:
+
+      - tokenize.peak / tokenize.retained: trabajo del tokenizador / lista de tokens;
+      - repair_loop (y local_repair): reescrituras de las reglas y sus diffs;
+      - finalize.retained: el texto JSON final; json_loads.retained y build.retained:
+        el objeto Python decodificado;
+      - report_diffs / report_issues: lo que ocupan en el reporte los diffs de las
+        modificaciones y los problemas detectados (`sys.getsizeof`).
+
+    `peak` y `retained` cubren la reparación completa. `tracemalloc` es global al proceso:
+    con varios hilos reparando a la vez, cada medida incluye lo que asignen los demás.
+    """
+    phases: Dict[str, MemoryUsage] = field(default_factory=dict)
+    peak: int = 0
+    retained: int = 0
+    report_diffs: int = 0
+    report_issues: int = 0
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Dict serializable a JSON, con las fases en el orden en que se ejecutan."""
+        phases = {phase: {"peak": self.phases[phase].peak, "retained": self.phases[phase].retained}
+                  for phase in PhaseTimings.PHASES if phase in self.phases}
+        return {"peak": self.peak, "retained": self.retained, "phases": phases,
+                "report_diffs": self.report_diffs, "report_issues": self.report_issues}
+
+
+@dataclass
+class RepairSummary:
+    """
+    Resumen ligero de un RepairReport (sin textos ni objetos), pensado para las APIs
+    por lotes donde viaja entre procesos por cada documento.
+    """
+    status: Optional[RepairStatus] = None
+    quality_score: float = 0.0
+    applied_rules: List[str] = field(default_factory=list)
+    errors: List[str] = field(default_factory=list)
+    fast_path: bool = False
+    salvaged: bool = False
+    line: Optional[int] = None
+
+
+class _DeferredField:
+    """
+    Descriptor para campos del reporte que pueden calcularse bajo demanda.
+
+    Antes de leer o escribir el campo se resuelve la evaluación pendiente del
+    reporte (si la hay), de modo que el valor observado siempre es el final.
+    """
+
+    def __init__(self, default: Any = None, default_factory: Optional[Callable[[], Any]] = None):
+        self.default = default
+        self.default_factory = default_factory
+
+    def __set_name__(self, owner, name: str):
+        self.attr = f"_{name}"
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            # Acceso desde la clase: dataclass lo usa como valor por defecto del campo
+            return self.default
+        if "_pending" in obj.__dict__:
+            obj.evaluate_quality()
+        return obj.__dict__[self.attr]
+
+    def __set__(self, obj, value):
+        if "_pending" in obj.__dict__:
+            obj.evaluate_quality()
+        if value is None and self.default_factory is not None:
+            value = self.default_factory()
+        obj.__dict__[self.attr] = value
+
+
 @dataclass
 class RepairReport:
     success: bool = False
-    status: Optional[RepairStatus] = None
+    status: Optional[RepairStatus] = _DeferredField()
     json_text: str = ""
     python_object: Optional[Any] = None
-    quality_score: float = 0.0
+    quality_score: float = _DeferredField(default=0.0)
     iterations: int = 0
     applied_rules: List[str] = field(default_factory=list)
     modifications: List[RepairModification] = field(default_factory=list)
-    detected_issues: List[str] = field(default_factory=list)
+    detected_issues: List[str] = _DeferredField(default_factory=list)
     errors: List[str] = field(default_factory=list)
     was_dry_run: bool = False
+    salvaged: bool = False
+    rule_stats: Dict[str, RuleStats] = field(default_factory=dict)
+    timings: PhaseTimings = field(default_factory=PhaseTimings)
+    memory: Optional[PhaseMemory] = None
+
+    def defer(self, evaluator: Callable[["RepairReport"], None]):
+        """
+        Registra una evaluación diferida que completará `status`, `quality_score`
+        y `detected_issues` la primera vez que alguno de ellos se lea.
+        """
+        self.__dict__["_pending"] = evaluator
+
+    def evaluate_quality(self) -> "RepairReport":
+        """Fuerza la evaluación diferida (si existe) y devuelve el propio reporte."""
+        pending = self.__dict__.pop("_pending", None)
+        if pending is not None:
+            pending(self)
+        return self
+
+    def summary(self) -> RepairSummary:
+        """Resumen ligero del reporte (fuerza la evaluación de calidad pendiente)."""
+        return RepairSummary(status=self.status, quality_score=self.quality_score,
+                             applied_rules=list(self.applied_rules), errors=list(self.errors),
+                             salvaged=self.salvaged)
+
+    def __getstate__(self):
+        # La evaluación pendiente guarda los tokens y los hooks: se resuelve antes de serializar
+        self.evaluate_quality()
+        return self.__dict__
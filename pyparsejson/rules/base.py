@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import List, Tuple
 from pyparsejson.core.context import Context
+from pyparsejson.core.token import TokenType
 
 
 class Rule(ABC):
@@ -12,6 +13,10 @@ class Rule(ABC):
     priority: int = 100
     tags: List[str] = []
     name: str = "BaseRule"
+    # Tipos de token sin los que `applies()` nunca devuelve True (basta con uno presente).
+    # Es una promesa exacta: el modo adaptativo (`Repair(adaptive_rules=True)`) salta la
+    # regla si no hay ninguno. Vacío = sin precondición declarada.
+    requires: Tuple[TokenType, ...] = ()
 
     def __init__(self):
         # El nombre por defecto es el nombre de la clase
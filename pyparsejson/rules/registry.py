@@ -1,4 +1,4 @@
-from typing import Dict, Type, List
+from typing import Dict, Iterable, Type, List
 from collections import defaultdict
 from typing import TYPE_CHECKING
 
@@ -43,3 +43,13 @@ class RuleRegistry:
         """
         rules = cls._registry.get(tag, [])
         return sorted(rules, key=lambda r: r.priority)
+
+    @classmethod
+    def ordered(cls, rules: Iterable[Type['Rule']]) -> List[Type['Rule']]:
+        """
+        Elimina duplicados y ordena por prioridad; a igual prioridad, por orden de registro
+        (las reglas no registradas van detrás, en el orden recibido). Así el orden no
+        depende de cómo se combinaron los tags.
+        """
+        position = {rule_cls: i for i, rule_cls in enumerate(cls._registry.get('all', []))}
+        return sorted(dict.fromkeys(rules), key=lambda r: (r.priority, position.get(r, len(position))))
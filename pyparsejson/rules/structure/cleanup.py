@@ -7,6 +7,7 @@ from pyparsejson.rules.registry import RuleRegistry
 
 @RuleRegistry.register(tags=["structure", "cleanup"], priority=0)
 class RemoveTrailingCommasRule(Rule):
+    requires = (TokenType.COMMA,)
 
     def applies(self, context: Context) -> bool:
         tokens = context.tokens
@@ -150,6 +151,8 @@ class StripCommentsRule(Rule):
     Ej: "user: admin // comment" → "user: admin"
     """
 
+    requires = (TokenType.UNKNOWN, TokenType.BARE_WORD)
+
     def applies(self, context: Context) -> bool:
         tokens = context.tokens
 
@@ -14,6 +14,8 @@ class MergeCompoundKeysRule(Rule):
     3. Fusiona los tokens en uno solo (ej: "deposito" "fecha" -> "deposito_fecha").
     """
 
+    requires = (TokenType.BARE_WORD,)
+
     def applies(self, context: Context) -> bool:
         tokens = context.tokens
         # Optimización: Buscar al menos dos BARE_WORD seguidos
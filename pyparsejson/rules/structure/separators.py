@@ -7,6 +7,8 @@ from pyparsejson.rules.registry import RuleRegistry
 
 @RuleRegistry.register(tags=["structure", "pre_repair"], priority=10)
 class EqualToColonRule(Rule):
+    requires = (TokenType.ASSIGN,)
+
     def applies(self, context: Context) -> bool:
         return any(t.type == TokenType.ASSIGN for t in context.tokens)
 
@@ -29,14 +31,21 @@ class AddMissingCommasRule(Rule):
     Inserta comas faltantes entre pares clave:valor.
 
     VERSIÓN MEJORADA: Soporta claves compuestas por múltiples tokens (multi-word keys).
-    Escanea hacia adelante para encontrar el separador definitivo (: o =).
+    Consulta el índice estructural del contexto para localizar en O(1) el separador
+    definitivo (: o =) y el inicio de la clave que lo precede.
     """
 
+    requires = (TokenType.COLON, TokenType.ASSIGN)
+
     def applies(self, context: Context) -> bool:
         tokens = context.tokens
         if len(tokens) < 2:
             return False
 
+        structure = context.structure
+        if not structure.separators:
+            return False
+
         for i in range(len(tokens) - 1):
             current = tokens[i]
 
@@ -49,15 +58,8 @@ class AddMissingCommasRule(Rule):
             if not is_value_end:
                 continue
 
-            # 2. Buscar el siguiente separador (COLON o ASSIGN) para determinar dónde termina la próxima clave
-            #    Buscamos en el rango i+1 hasta len(tokens)
-            next_sep_idx = -1
-            j = i + 1
-            while j < len(tokens):
-                if tokens[j].type in (TokenType.COLON, TokenType.ASSIGN):
-                    next_sep_idx = j
-                    break
-                j += 1
+            # 2. Siguiente separador (COLON o ASSIGN) según el índice estructural
+            next_sep_idx = structure.next_separator[i + 1]
 
             # Si no encontramos separador, no hay par clave:valor siguiente
             if next_sep_idx == -1:
@@ -67,32 +69,19 @@ class AddMissingCommasRule(Rule):
             if i + 1 >= next_sep_idx:
                 continue  # No hay espacio para una clave
 
-            # 4. El candidato a clave es el token en i+1
-            next_token = tokens[i + 1]
-
-            # Si el candidato ya es una COMMA, todo está bien
-            if next_token.type == TokenType.COMMA:
+            # 4. Todos los tokens entre i+1 y el separador deben ser partes de clave (palabras o strings).
+            #    El índice guarda dónde empieza esa secuencia para cada separador.
+            if tokens[i + 1].type == TokenType.COMMA:
                 continue
 
-            # Si el candidato es parte de una clave (BARE_WORD o STRING) y eventualmente le sigue un separador,
-            # entonces necesitamos insertar una coma antes de él.
-            is_potential_key = next_token.type in (TokenType.BARE_WORD, TokenType.STRING)
-
-            if is_potential_key:
-                # Verificamos que entre i+1 y next_sep_idx solo haya elementos válidos de clave (palabras o strings)
-                valid_key_parts = True
-                for k in range(i + 1, next_sep_idx):
-                    if tokens[k].type not in (TokenType.BARE_WORD, TokenType.STRING):
-                        valid_key_parts = False
-                        break
-
-                if valid_key_parts:
-                    return True
+            if structure.key_start[next_sep_idx] <= i + 1:
+                return True
 
         return False
 
     def apply(self, context: Context):
         tokens = context.tokens
+        structure = context.structure
         new_tokens = []
         i = 0
         changed = False
@@ -120,14 +109,8 @@ class AddMissingCommasRule(Rule):
                 i += 1
                 continue
 
-            # Buscar índice del siguiente separador
-            next_sep_idx = -1
-            j = i + 1
-            while j < len(tokens):
-                if tokens[j].type in (TokenType.COLON, TokenType.ASSIGN):
-                    next_sep_idx = j
-                    break
-                j += 1
+            # Índice del siguiente separador
+            next_sep_idx = structure.next_separator[i + 1]
 
             # Si no hay estructura clave:valor siguiente, continuar
             if next_sep_idx == -1:
@@ -147,11 +130,7 @@ class AddMissingCommasRule(Rule):
                 continue
 
             # Validar que los tokens entre aquí y el separador sean válidos para una clave
-            valid_key_sequence = True
-            for k in range(i + 1, next_sep_idx):
-                if tokens[k].type not in (TokenType.BARE_WORD, TokenType.STRING):
-                    valid_key_sequence = False
-                    break
+            valid_key_sequence = structure.key_start[next_sep_idx] <= i + 1
 
             if valid_key_sequence:
                 # INSERTAR COMMA
@@ -176,6 +155,8 @@ class AddMissingCommasRule(Rule):
 
 @RuleRegistry.register(tags=["structure", "values"], priority=20)
 class TupleToListRule(Rule):
+    requires = (TokenType.LPAREN, TokenType.RPAREN)
+
     def applies(self, context: Context) -> bool:
         return any(t.type in (TokenType.LPAREN, TokenType.RPAREN) for t in context.tokens)
 
@@ -201,17 +182,17 @@ class TupleToListRule(Rule):
 class QuoteKeysRule(Rule):
     """Envuelve TODAS las claves en comillas dobles"""
 
+    requires = (TokenType.COLON,)
+
     def applies(self, context: Context) -> bool:
         tokens = context.tokens
-        for i in range(len(tokens) - 1):
-            token = tokens[i]
-            next_token = tokens[i + 1]
-
-            # Es clave si está seguida de : o =
-            is_key = token.type in (TokenType.BARE_WORD, TokenType.STRING)
-            is_separator = next_token.type == TokenType.COLON
+        for sep_idx in context.structure.separators:
+            # Es clave si está seguida de :
+            if sep_idx == 0 or tokens[sep_idx].type != TokenType.COLON:
+                continue
 
-            if is_key and is_separator:
+            token = tokens[sep_idx - 1]
+            if token.type in (TokenType.BARE_WORD, TokenType.STRING):
                 # Verificar si ya tiene comillas dobles correctas
                 if token.type == TokenType.STRING:
                     if token.value.startswith('"') and token.value.endswith('"'):
@@ -220,35 +201,32 @@ class QuoteKeysRule(Rule):
         return False
 
     def apply(self, context: Context):
-        new_tokens = []
+        tokens = context.tokens
+        new_tokens = list(tokens)
         changed = False
 
-        for i, token in enumerate(context.tokens):
-            # Mirar hacia adelante para ver si es clave
-            # Nota: QuoteKeysRule debe ejecutarse después de AddMissingCommasRule
-            is_key = (
-                    i + 1 < len(context.tokens) and
-                    context.tokens[i + 1].type == TokenType.COLON and
-                    token.type in (TokenType.BARE_WORD, TokenType.STRING)
-            )
+        # Nota: QuoteKeysRule debe ejecutarse después de AddMissingCommasRule
+        for sep_idx in context.structure.separators:
+            if sep_idx == 0 or tokens[sep_idx].type != TokenType.COLON:
+                continue
 
-            if is_key:
-                # Limpiar valor (quitar comillas simples o existentes)
-                clean_val = token.value.strip('"\'')
-
-                # Crear nuevo token con comillas dobles
-                new_token = Token(
-                    type=TokenType.STRING,
-                    value=f'"{clean_val}"',
-                    raw_value=f'"{clean_val}"',
-                    position=token.position,
-                    line=token.line,
-                    column=token.column
-                )
-                new_tokens.append(new_token)
-                changed = True
-            else:
-                new_tokens.append(token)
+            token = tokens[sep_idx - 1]
+            if token.type not in (TokenType.BARE_WORD, TokenType.STRING):
+                continue
+
+            # Limpiar valor (quitar comillas simples o existentes)
+            clean_val = token.value.strip('"\'')
+
+            # Crear nuevo token con comillas dobles
+            new_tokens[sep_idx - 1] = Token(
+                type=TokenType.STRING,
+                value=f'"{clean_val}"',
+                raw_value=f'"{clean_val}"',
+                position=token.position,
+                line=token.line,
+                column=token.column
+            )
+            changed = True
 
         if changed:
             context.tokens = new_tokens
@@ -266,49 +244,32 @@ class BalanceBracketsRule(Rule):
 
     def applies(self, context: Context) -> bool:
         """Detecta si hay desbalance de llaves o corchetes"""
-        tokens = context.tokens
-        if not tokens:
+        if not context.tokens:
             return False
 
-        stack = []
-        errors = 0
-
-        for token in tokens:
-            if token.type in (TokenType.LBRACE, TokenType.LBRACKET):
-                stack.append(token.type)
-            elif token.type in (TokenType.RBRACE, TokenType.RBRACKET):
-                if not stack:
-                    errors += 1  # Cierre sin apertura
-                else:
-                    last = stack.pop()
-                    # Verificar que coincidan (no mezclar { con ])
-                    if (token.type == TokenType.RBRACE and last != TokenType.LBRACE) or \
-                            (token.type == TokenType.RBRACKET and last != TokenType.LBRACKET):
-                        errors += 1  # Tipo incorrecto
-
-        # Si quedaron elementos en stack, hay llaves/corchetes sin cerrar
-        # O si hubo errores de tipo
-        return len(stack) > 0 or errors > 0
+        # Cierres sin apertura, tipos cruzados ({ con ]) o aperturas sin cerrar
+        return not context.structure.is_balanced
 
     def apply(self, context: Context):
-        """Añade cierres faltantes al final del documento"""
+        """Descarta cierres finales sin apertura y añade los cierres faltantes al final del documento"""
+        structure = context.structure
         tokens = context.tokens
-        stack = []
-
-        # Detectar qué cierres faltan
-        for token in tokens:
-            if token.type == TokenType.LBRACE:
-                stack.append(TokenType.RBRACE)
-            elif token.type == TokenType.LBRACKET:
-                stack.append(TokenType.RBRACKET)
-            elif token.type in (TokenType.RBRACE, TokenType.RBRACKET):
-                # Solo hacer pop si coincide el tipo
-                if stack and stack[-1] == token.type:
-                    stack.pop()
+        # Cierres pendientes en el orden en que se abrieron (un cierre sin pareja no desapila)
+        missing = structure.missing_closers
+
+        # Cierres sobrantes al final (p. ej. `a: b }` tras envolver en {}): el índice sigue
+        # valiendo para los tokens anteriores porque el emparejamiento es hacia delante
+        end = len(tokens)
+        while end and tokens[end - 1].type in (TokenType.RBRACE, TokenType.RBRACKET) and structure.match[end - 1] == -1:
+            end -= 1
+        if end < len(tokens):
+            del tokens[end:]
+            context.mark_changed()
+            context.record_rule(self.name)
 
         # Añadir cierres faltantes en orden LIFO
-        if stack:
-            for close_type in reversed(stack):
+        if missing:
+            for close_type in reversed(missing):
                 char = "}" if close_type == TokenType.RBRACE else "]"
                 context.tokens.append(Token(
                     type=close_type,
@@ -320,4 +281,4 @@ class BalanceBracketsRule(Rule):
                 ))
 
             context.mark_changed()
-            context.record_rule(self.name)
\ No newline at end of file
+            context.record_rule(self.name)
@@ -14,6 +14,8 @@ class RootObjectRule(Rule):
     Esto soluciona los casos "key: val, key: val" que se quedan colgando al final porque el parser espera una estructura de objeto completa.
     """
 
+    requires = (TokenType.COLON, TokenType.ASSIGN)
+
     def applies(self, context: Context) -> bool:
         tokens = context.tokens
         if len(tokens) < 2:
@@ -103,11 +105,9 @@ class ImplicitArrayRule(Rule):
     """
 
     def applies(self, context: Context) -> bool:
-        # Optimización rápida: debe haber comas y dos puntos
-        tokens = context.tokens
-        has_comma = any(t.type == TokenType.COMMA for t in tokens)
-        has_colon = any(t.type == TokenType.COLON for t in tokens)
-        return has_comma and has_colon
+        # Optimización rápida: debe haber comas y dos puntos (conteo O(1) del índice estructural)
+        counts = context.structure.counts
+        return counts[TokenType.COMMA] > 0 and counts[TokenType.COLON] > 0
 
     def apply(self, context: Context):
         tokens = context.tokens
@@ -179,34 +179,37 @@ class ImplicitArrayRule(Rule):
             else:
                 i += 1
 
-        # Aplicar cambios en orden inverso para no afectar los índices
+        # Reconstruir la lista en una sola pasada (insertar con list.insert es cuadrático)
         if changes:
-            for start, end in reversed(changes):
-                # Insertar ]
-                ref_token_end = tokens[end]
-                r_bracket = Token(
-                    type=TokenType.RBRACKET,
-                    value="]",
-                    raw_value="]",
-                    position=ref_token_end.position,
-                    line=ref_token_end.line,
-                    column=ref_token_end.column
-                )
-                tokens.insert(end + 1, r_bracket)
+            new_tokens = []
+            prev_end = 0
+            for start, end in changes:
+                new_tokens.extend(tokens[prev_end:start])
 
-                # Insertar [
                 ref_token_start = tokens[start]
-                l_bracket = Token(
+                new_tokens.append(Token(
                     type=TokenType.LBRACKET,
                     value="[",
                     raw_value="[",
                     position=ref_token_start.position,
                     line=ref_token_start.line,
                     column=ref_token_start.column
-                )
-                tokens.insert(start, l_bracket)
+                ))
+                new_tokens.extend(tokens[start:end + 1])
 
-            context.tokens = tokens
+                ref_token_end = tokens[end]
+                new_tokens.append(Token(
+                    type=TokenType.RBRACKET,
+                    value="]",
+                    raw_value="]",
+                    position=ref_token_end.position,
+                    line=ref_token_end.line,
+                    column=ref_token_end.column
+                ))
+                prev_end = end + 1
+            new_tokens.extend(tokens[prev_end:])
+
+            context.tokens = new_tokens
             context.mark_changed()
             context.record_rule(self.name)
 
@@ -221,6 +224,8 @@ class EnsureTrailingCommasBeforeEndRule(Rule):
     El objetivo es convertir {key1: val1, key2: val2} en {key1: val1, key2: val2, } (coma final).
     """
 
+    requires = (TokenType.NUMBER, TokenType.STRING, TokenType.BOOLEAN, TokenType.NULL)
+
     def applies(self, context: Context) -> bool:
         tokens = context.tokens
         if len(tokens) < 2:
@@ -11,6 +11,8 @@ DATE_PATTERN = re.compile(r"\d{4}-\d{2}-\d{2}")
 @RuleRegistry.register(tags=["values", "dates"], priority=45)
 class DateLiteralToStringRule(Rule):
 
+    requires = (TokenType.NUMBER,)
+
     def applies(self, context: Context) -> bool:
         return any(
             t.type == TokenType.NUMBER and DATE_PATTERN.fullmatch(t.value)
@@ -14,6 +14,8 @@ class LeadingZeroIdentifierRule(Rule):
     Ejemplo: 0123 -> "0123"
     """
 
+    requires = (TokenType.NUMBER,)
+
     def applies(self, context: Context) -> bool:
         for token in context.tokens:
             if token.type == TokenType.NUMBER:
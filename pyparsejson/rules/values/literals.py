@@ -7,6 +7,8 @@ from pyparsejson.rules.registry import RuleRegistry
 
 @RuleRegistry.register(tags=["values", "normalization"], priority=50)
 class NormalizeBooleansRule(Rule):
+    requires = (TokenType.BOOLEAN,)
+
     def applies(self, context: Context) -> bool:
         return any(t.type == TokenType.BOOLEAN for t in context.tokens)
 
@@ -43,10 +45,12 @@ class MergeFreeTextValueRule(Rule):
     Ejemplo: `user: admin // superuser` se convierte en `"user": "admin // superuser"`
     """
 
+    requires = (TokenType.COLON, TokenType.ASSIGN)
+
     def applies(self, context: Context) -> bool:
         tokens = context.tokens
-        for i in range(len(tokens) - 2):
-            if tokens[i].type in (TokenType.COLON, TokenType.ASSIGN):
+        for i in context.structure.separators:
+            if i + 2 < len(tokens):
                 # Potencial inicio de un valor multi-token.
                 val_token1 = tokens[i + 1]
                 val_token2 = tokens[i + 2]
@@ -74,6 +78,7 @@ class MergeFreeTextValueRule(Rule):
         new_tokens = []
         i = 0
         changed = False
+        structure = context.structure
 
         while i < len(context.tokens):
             token = context.tokens[i]
@@ -81,32 +86,9 @@ class MergeFreeTextValueRule(Rule):
             if token.type in (TokenType.COLON, TokenType.ASSIGN) and i + 1 < len(context.tokens):
                 new_tokens.append(token)  # Conservar el separador
 
-                val_start_idx = i + 1
-                val_end_idx = -1
-
-                # Buscar el final del valor.
-                for j in range(val_start_idx, len(context.tokens)):
-                    current_val_token = context.tokens[j]
-
-                    # El valor termina con un delimitador.
-                    if current_val_token.type in (TokenType.COMMA, TokenType.RBRACE, TokenType.RBRACKET):
-                        val_end_idx = j - 1
-                        break
-
-                    # Verificaciones de lookahead para detectar nuevas claves
-                    if j + 1 < len(context.tokens):
-                        next_token = context.tokens[j + 1]
-                        
-                        # 2. Detectar inicio de clave simple: NEXT + COLON
-                        # Ejemplo: ... valor clave : ...
-                        if next_token.type in (TokenType.BARE_WORD, TokenType.STRING) and \
-                           j + 2 < len(context.tokens) and \
-                           context.tokens[j + 2].type in (TokenType.COLON, TokenType.ASSIGN):
-                            val_end_idx = j
-                            break
-                    
-                    # Si no hay delimitador, el valor se extiende hasta el final.
-                    val_end_idx = j
+                # El valor termina con un delimitador (, } ]) o justo antes de una nueva
+                # clave (`clave :`); si no hay ninguno, se extiende hasta el final.
+                val_start_idx, val_end_idx = structure.value_span(i)
 
                 if val_end_idx < val_start_idx:
                     i += 1
@@ -171,6 +153,8 @@ class QuoteBareWordsRule(Rule):
     Las claves ya deben haber sido procesadas por QuoteKeysRule (priority 30).
     """
 
+    requires = (TokenType.BARE_WORD,)
+
     def applies(self, context: Context) -> bool:
         tokens = context.tokens
         for i, token in enumerate(tokens):
@@ -208,6 +192,8 @@ class MergeAdjacentStringsRule(Rule):
     VERSIÓN CORREGIDA: No une strings que son claves (seguidas de :)
     """
 
+    requires = (TokenType.STRING,)
+
     def applies(self, context: Context) -> bool:
         tokens = context.tokens
         for i in range(len(tokens) - 1):
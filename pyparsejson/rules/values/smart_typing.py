@@ -32,20 +32,21 @@ class SmartTypingRule(Rule):
     # Regex para validar números JSON estrictos
     VALID_NUMBER = re.compile(r'^-?(?:0|[1-9]\d*)(?:\.\d+)?(?:[eE][+-]?\d+)?$')
 
+    requires = (TokenType.COLON, TokenType.ASSIGN)
+
     def applies(self, context: Context) -> bool:
         tokens = context.tokens
         if len(tokens) < 3:
             return False
 
-        for i in range(len(tokens) - 2):
-            key_token = tokens[i]
-            sep_token = tokens[i + 1]
-
-            is_key = key_token.type in (TokenType.STRING, TokenType.BARE_WORD)
-            is_separator = sep_token.type in (TokenType.COLON, TokenType.ASSIGN)
+        # Solo interesan los pares `clave SEP valor`: recorremos los separadores del índice
+        for sep_idx in context.structure.separators:
+            if sep_idx == 0 or sep_idx + 1 >= len(tokens):
+                continue
+            key_token = tokens[sep_idx - 1]
 
-            if is_key and is_separator:
-                val_token = tokens[i + 2]
+            if key_token.type in (TokenType.STRING, TokenType.BARE_WORD):
+                val_token = tokens[sep_idx + 1]
                 # Ignorar si ya es un String o Date procesado
                 if val_token.type in (TokenType.BARE_WORD, TokenType.NUMBER):
                     key_name = key_token.value.strip('"').lower()
@@ -56,23 +57,19 @@ class SmartTypingRule(Rule):
     def apply(self, context: Context):
         changed = False
         tokens = context.tokens
-        new_tokens = []
 
-        i = 0
-        while i < len(tokens):
-            current = tokens[i]
-            new_tokens.append(current)
+        # Mutación in-place de los valores; el tipo de la clave se lee en vivo
+        # porque un valor convertido puede ser a su vez la "clave" del siguiente separador.
+        for sep_idx in context.structure.separators:
+            if sep_idx == 0 or sep_idx + 1 >= len(tokens):
+                continue
 
-            if i + 2 >= len(tokens):
-                break
-
-            next_sep = tokens[i + 1]
-            next_val = tokens[i + 2]
+            current = tokens[sep_idx - 1]
+            next_val = tokens[sep_idx + 1]
 
             is_key = current.type in (TokenType.STRING, TokenType.BARE_WORD)
-            is_separator = next_sep.type in (TokenType.COLON, TokenType.ASSIGN)
 
-            if is_key and is_separator:
+            if is_key:
                 key_name = current.value.strip('"').lower()
 
                 # 1. Si la clave sugiere STRING y el valor es BareWord o Number
@@ -99,9 +96,6 @@ class SmartTypingRule(Rule):
                             next_val.raw_value = next_val.value
                             changed = True
 
-            i += 1
-
         if changed:
-            context.tokens = new_tokens
             context.mark_changed()
             context.record_rule(self.name)
@@ -0,0 +1,56 @@
+# pyparsejson/utils/aio.py
+import asyncio
+import os
+import weakref
+from typing import TypeVar
+
+from pyparsejson.core.engine import Steps
+
+T = TypeVar("T")
+
+# Entradas de hasta este tamaño (en caracteres) se reparan inline: el coste de
+# mandarlas a un executor o de trocearlas supera al de bloquear el loop un instante.
+ASYNC_INLINE_LIMIT = 16 * 1024
+
+# Reparaciones grandes simultáneas por event loop con el limitador por defecto
+DEFAULT_MAX_CONCURRENCY = os.cpu_count() or 1
+
+_limiters: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = weakref.WeakKeyDictionary()
+
+
+def default_limiter() -> asyncio.Semaphore:
+    """
+    Semáforo compartido por todas las reparaciones grandes del event loop actual,
+    con `DEFAULT_MAX_CONCURRENCY` plazas. Las entradas pequeñas no lo usan.
+    """
+    loop = asyncio.get_running_loop()
+    limiter = _limiters.get(loop)
+    if limiter is None:
+        limiter = _limiters[loop] = asyncio.Semaphore(DEFAULT_MAX_CONCURRENCY)
+    return limiter
+
+
+def set_default_concurrency(limit: int):
+    """Cambia las plazas del limitador por defecto (afecta a los loops que aún no lo usaron)."""
+    global DEFAULT_MAX_CONCURRENCY
+    if limit < 1:
+        raise ValueError("limit must be >= 1")
+    DEFAULT_MAX_CONCURRENCY = limit
+    _limiters.clear()
+
+
+async def drive(steps: Steps[T], yield_every: int = 1) -> T:
+    """
+    Ejecuta un generador de pasos en el event loop, cediendo el control
+    (`await asyncio.sleep(0)`) cada `yield_every` pasos.
+    """
+    pending = 0
+    try:
+        while True:
+            next(steps)
+            pending += 1
+            if pending >= yield_every:
+                pending = 0
+                await asyncio.sleep(0)
+    except StopIteration as stop:
+        return stop.value
@@ -1,11 +1,33 @@
 # pyparsejson/utils/logger.py
 import logging
+from typing import Any, Callable, Dict, Optional
+
+# Firma de un consumidor de eventos estructurados: (nombre, campos)
+EventSink = Callable[[str, Dict[str, Any]], None]
 
 
 class RepairLogger:
-    def __init__(self, name: str = "pyparsejson", level: int = logging.INFO):
+    """
+    Envoltorio ligero sobre `logging` pensado para rutas calientes.
+
+    Los puntos de log/traza desactivados deben costar una sola comprobación barata:
+
+        if logger.debug_enabled:
+            logger.debug(f"... {costoso} ...")
+
+        if logger.events_enabled:
+            logger.event("parse_failed", pos=e.pos)
+
+    `debug_enabled` y `events_enabled` consultan el nivel en cada llamada: los loggers se
+    comparten por nombre y otro `RepairLogger` (o la aplicación) puede cambiarlo después.
+    `Logger.isEnabledFor` guarda el resultado en caché hasta el siguiente cambio de nivel.
+    """
+
+    def __init__(self, name: str = "pyparsejson", level: int = logging.INFO,
+                 event_sink: Optional[EventSink] = None):
         self.logger = logging.getLogger(name)
         self.logger.setLevel(level)
+        self.event_sink = event_sink
 
         if not self.logger.handlers:
             handler = logging.StreamHandler()
@@ -15,11 +37,38 @@ class RepairLogger:
             handler.setFormatter(formatter)
             self.logger.addHandler(handler)
 
+    @property
+    def debug_enabled(self) -> bool:
+        return self.logger.isEnabledFor(logging.DEBUG)
+
+    @property
+    def events_enabled(self) -> bool:
+        return self.event_sink is not None or self.logger.isEnabledFor(logging.DEBUG)
+
+    def set_level(self, level: int):
+        self.logger.setLevel(level)
+
+    def set_event_sink(self, sink: Optional[EventSink]):
+        self.event_sink = sink
+
+    def event(self, name: str, **fields: Any):
+        """
+        Emite un evento estructurado. Se entrega al `event_sink` (si hay) y, con nivel
+        DEBUG, también como registro de log con los campos en `record.event_fields`.
+        """
+        if self.event_sink is not None:
+            self.event_sink(name, fields)
+        if self.debug_enabled:
+            self.logger.debug("%s %s", name, fields,
+                              extra={"event": name, "event_fields": fields})
+
     def debug(self, msg: str):
         self.logger.debug(msg)
 
     def debug_tokens(self, stage: str, tokens: list):
         """Log tokens en formato legible"""
+        if not self.debug_enabled:
+            return
         token_str = " ".join(f"{t.type.name}:{t.value}" for t in tokens[:10])
         self.logger.debug(f"{stage} ({len(tokens)} tokens): {token_str}...")
 
@@ -0,0 +1,129 @@
+# pyparsejson/utils/memory.py
+"""
+Perfil de memoria por fase con `tracemalloc`, como hook del pipeline.
+
+    pipeline = Repair(profile_memory=True)
+    report = pipeline.parse(texto)
+    report.memory.phases["tokenize"].retained     # bytes de la lista de tokens
+
+Si `tracemalloc` no estaba activo, se activa durante cada reparación y se desactiva al
+terminar; si ya lo estaba (p. ej. `python -X tracemalloc`), se reutiliza sin tocarlo.
+Trazar asignaciones hace la reparación varias veces más lenta: es un modo de perfilado.
+"""
+import sys
+import threading
+import tracemalloc
+from typing import List, Optional
+
+from pyparsejson.core.hooks import RepairHooks
+from pyparsejson.report.repair_report import MemoryUsage, PhaseMemory, RepairReport
+
+# tracemalloc es global al proceso: las reparaciones concurrentes comparten una activación
+_tracing_lock = threading.Lock()
+_tracing_users = 0
+
+
+def _start_tracing() -> bool:
+    """Activa tracemalloc si hace falta; False si ya lo había activado otro (no se toca)."""
+    global _tracing_users
+    with _tracing_lock:
+        if _tracing_users == 0:
+            if tracemalloc.is_tracing():
+                return False
+            tracemalloc.start()
+        _tracing_users += 1
+        return True
+
+
+def _stop_tracing():
+    global _tracing_users
+    with _tracing_lock:
+        _tracing_users -= 1
+        if _tracing_users == 0:
+            tracemalloc.stop()
+
+
+class _Frame:
+    __slots__ = ("phase", "base", "peak")
+
+    def __init__(self, phase: str, base: int):
+        self.phase = phase
+        self.base = base
+        self.peak = base
+
+
+class MemoryProfileHook(RepairHooks):
+    """
+    Mide pico y memoria retenida de cada fase (ver `PhaseMemory`).
+
+    Las fases pueden anidarse (json_loads dentro de fallback, todas dentro de parse):
+    como `tracemalloc.reset_peak()` es global, antes de cada reinicio se acumula el pico
+    visto hasta entonces en todas las fases abiertas. El estado es por hilo.
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+
+    def _state(self):
+        local = self._local
+        if not hasattr(local, "stack"):
+            local.stack: List[_Frame] = []
+            local.memory = None
+            local.owns_tracing = False
+        return local
+
+    def _release(self, state):
+        state.stack.clear()
+        if state.owns_tracing:
+            state.owns_tracing = False
+            _stop_tracing()
+
+    @staticmethod
+    def _fold_peak(stack: List[_Frame]) -> int:
+        current, peak = tracemalloc.get_traced_memory()
+        for frame in stack:
+            if peak > frame.peak:
+                frame.peak = peak
+        return current
+
+    def on_phase_start(self, phase: str, tokens: int):
+        state = self._state()
+        if phase == "parse":
+            # Descarta una reparación anterior que terminó con excepción
+            self._release(state)
+            state.owns_tracing = _start_tracing()
+            state.memory = PhaseMemory()
+        elif state.memory is None:
+            return
+        current = self._fold_peak(state.stack)
+        tracemalloc.reset_peak()
+        state.stack.append(_Frame(phase, current))
+
+    def on_phase_end(self, phase: str, seconds: float, tokens: int):
+        state = self._state()
+        if not state.stack or state.stack[-1].phase != phase:
+            return
+        current = self._fold_peak(state.stack)
+        frame = state.stack.pop()
+        peak, retained = frame.peak - frame.base, current - frame.base
+        if phase == "parse":
+            state.memory.peak, state.memory.retained = peak, retained
+            self._release(state)
+            return
+        usage = state.memory.phases.get(phase)
+        if usage is None:
+            state.memory.phases[phase] = MemoryUsage(peak, retained)
+        else:
+            # Fases repetidas (p. ej. varios json_loads en el fallback)
+            usage.peak = max(usage.peak, peak)
+            usage.retained += retained
+
+    def collect(self, report: RepairReport) -> Optional[PhaseMemory]:
+        """Perfil de la última reparación del hilo, con el tamaño de diffs e issues del reporte."""
+        state = self._state()
+        memory, state.memory = state.memory, None
+        self._release(state)
+        if memory is not None:
+            memory.report_diffs = sum(sys.getsizeof(m) + sys.getsizeof(m.diff) for m in report.modifications)
+            memory.report_issues = sum(sys.getsizeof(issue) for issue in report.detected_issues)
+        return memory
@@ -0,0 +1,145 @@
+# pyparsejson/utils/tracing.py
+"""
+Hook de referencia que emite registros JSON con forma de span (estilo OpenTelemetry).
+
+Cada reparación es una traza: la fase "parse" es el span raíz y el resto de fases
+(tokenize, repair_loop, ...) son spans hijos. Las pasadas del bucle de reparación son
+spans hijos de "repair_loop"; las reglas aplicadas y el fallback se emiten como
+eventos (spans de duración conocida) colgados del span abierto en ese momento.
+
+Fuera de una reparación no hay traza abierta y no se emite nada: la evaluación de
+calidad diferida (al leer `report.status` más tarde) no genera span. Para trazarla,
+`Repair(eager_quality=True)` la evalúa dentro del span "parse".
+
+    hook = JSONSpanHook(sys.stderr)          # una línea JSON por span
+    Repair(hooks=[hook]).parse(texto)
+
+    records = []
+    Repair(hooks=[JSONSpanHook(sink=records.append)])   # dicts, sin serializar
+"""
+import json
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, TextIO
+
+from pyparsejson.core.hooks import RepairHooks, RuleEdits
+
+SpanSink = Callable[[Dict[str, Any]], None]
+
+
+class _Span:
+    __slots__ = ("name", "span_id", "parent_id", "start_ns")
+
+    def __init__(self, name: str, span_id: str, parent_id: Optional[str], start_ns: int):
+        self.name = name
+        self.span_id = span_id
+        self.parent_id = parent_id
+        self.start_ns = start_ns
+
+
+class JSONSpanHook(RepairHooks):
+    """
+    Emite un registro por span al cerrarse:
+
+        {"trace_id", "span_id", "parent_id", "name", "kind", "start_ns", "duration_ns",
+         "attributes": {...}}
+
+    `kind` es "phase", "iteration", "rule" o "fallback". `start_ns` es tiempo de pared
+    (`time.time_ns`); las duraciones salen del reloj monotónico del pipeline.
+
+    Los registros van a `sink` (un callable que recibe el dict) o, si no se indica, se
+    escriben como una línea JSON en `stream`. El estado de las trazas es por hilo, así que
+    una misma instancia sirve para un pipeline compartido entre hilos.
+    """
+
+    def __init__(self, stream: Optional[TextIO] = None, sink: Optional[SpanSink] = None):
+        if stream is None and sink is None:
+            raise ValueError("JSONSpanHook needs a stream or a sink")
+        self.stream = stream
+        self.sink = sink
+        self._local = threading.local()
+
+    # --- estado por hilo ---
+
+    def _state(self):
+        local = self._local
+        if not hasattr(local, "stack"):
+            local.stack: List[_Span] = []
+            local.attributes: Dict[str, Dict[str, Any]] = {}
+            local.trace_id = None
+        return local
+
+    @staticmethod
+    def _new_id(size: int) -> str:
+        return os.urandom(size).hex()
+
+    def _emit(self, record: Dict[str, Any]):
+        if self.sink is not None:
+            self.sink(record)
+        else:
+            self.stream.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+    @staticmethod
+    def _record(state, name: str, kind: str, span_id: str, parent_id: Optional[str], start_ns: int,
+                duration_ns: int, attributes: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "trace_id": state.trace_id,
+            "span_id": span_id,
+            "parent_id": parent_id,
+            "name": name,
+            "kind": kind,
+            "start_ns": start_ns,
+            "duration_ns": duration_ns,
+            "attributes": attributes,
+        }
+
+    def _event(self, name: str, kind: str, seconds: float, attributes: Dict[str, Any]):
+        state = self._state()
+        if not state.stack:
+            return
+        duration_ns = int(seconds * 1e9)
+        self._emit(self._record(state, name, kind, self._new_id(8), state.stack[-1].span_id,
+                                time.time_ns() - duration_ns, duration_ns, attributes))
+
+    # --- RepairHooks ---
+
+    def on_phase_start(self, phase: str, tokens: int):
+        state = self._state()
+        if phase == "parse":
+            # Nueva traza; descarta spans de una reparación anterior que terminó con excepción
+            state.stack.clear()
+            state.attributes.clear()
+            state.trace_id = self._new_id(16)
+            span = _Span(phase, self._new_id(8), None, time.time_ns())
+        elif not state.stack:
+            # Sin traza abierta (p. ej. calidad diferida): colgarlo de la última raíz
+            # lo atribuiría a otro documento
+            return
+        else:
+            span = _Span(phase, self._new_id(8), state.stack[-1].span_id, time.time_ns())
+        state.stack.append(span)
+        state.attributes[span.span_id] = {"tokens_before": tokens}
+
+    def on_phase_end(self, phase: str, seconds: float, tokens: int):
+        state = self._state()
+        if not state.stack or state.stack[-1].name != phase:
+            return
+        span = state.stack.pop()
+        attributes = state.attributes.pop(span.span_id)
+        attributes["tokens_after"] = tokens
+        self._emit(self._record(state, phase, "phase", span.span_id, span.parent_id, span.start_ns,
+                                int(seconds * 1e9), attributes))
+
+    def on_iteration(self, iteration: int, changed: bool, seconds: float, tokens: int):
+        self._event(f"iteration {iteration}", "iteration", seconds,
+                    {"iteration": iteration, "changed": changed, "tokens_after": tokens})
+
+    def on_rule_applied(self, rule, edits: RuleEdits):
+        self._event(rule.name, "rule", edits.seconds,
+                    {"iteration": edits.iteration, "tokens_before": edits.tokens_before,
+                     "tokens_after": edits.tokens_after, "diff": edits.diff})
+
+    def on_fallback(self, error: Optional[str], recovered: bool, salvaged: bool, seconds: float):
+        self._event("fallback", "fallback", seconds,
+                    {"error": error, "recovered": recovered, "salvaged": salvaged})
@@ -0,0 +1,109 @@
+# tests/test_adaptive_rules.py
+import pytest
+
+from benchmarks.corpus import DAMAGE_CLASSES, generate, load_pathological
+from benchmarks.rules import registered_rules
+from pyparsejson.core.context import Context
+from pyparsejson.core.repair import Repair
+from pyparsejson.core.rule_selector import RuleSelector
+from pyparsejson.core.scheduler import AdaptiveRuleScheduler
+from pyparsejson.flows.presets import AggressiveJSONRepairFlow, MinimalJSONRepairFlow
+from pyparsejson.rules.registry import RuleRegistry
+from pyparsejson.rules.structure.separators import EqualToColonRule
+
+INPUTS = [
+    "{name: 'x', tags: [a, b,], n: 1 m: 2}",
+    "x = 1\ny = 2\nz: [a, b]",
+    "user: admin // superuser",
+    "SELECT * FROM t {a: 1}",
+    "ids: 1, 2, 3 name: foo",
+    "count: 5, zip: 00123, user_id: 44",
+    'a: "x" "y", b: true',
+    '{"a": [1, {"b": (1,2)}]}',
+    '{"k": [1, 2,, 3]}',
+    '{"name": "Ana", "items": [{"id": 1}, {"id": 2, "n',
+    '{"a": 1, "b": [1,2,3], "c": {"d": null}}',
+] + [generate(damage, size, seed) for damage in DAMAGE_CLASSES if damage != "pathological"
+      for size in (200, 1500) for seed in (0, 1)]
+# Entradas adversarias de `tools.perf_fuzz`: llevan el bucle de reparación a sus límites
+INPUTS += [entry["text"] for entry in load_pathological()]
+
+
+def _outcome(report):
+    return (report.json_text, repr(report.python_object), report.applied_rules,
+            [(m.rule_name, m.diff) for m in report.modifications], report.iterations, report.status)
+
+
+def _configure(pipeline, flow_cls):
+    if flow_cls is not None:
+        pipeline.user_flows = [flow_cls(pipeline.engine)]
+    return pipeline
+
+
+@pytest.mark.parametrize("flow_cls", [None, MinimalJSONRepairFlow, AggressiveJSONRepairFlow])
+def test_adaptive_output_is_identical_to_static(flow_cls):
+    static = _configure(Repair(local_repair=True), flow_cls)
+    adaptive = _configure(Repair(local_repair=True, adaptive_rules=True), flow_cls)
+    # Varias rondas: tras el calentamiento la política empieza a saltar reglas
+    for _ in range(2):
+        for text in INPUTS:
+            assert _outcome(adaptive.parse(text)) == _outcome(static.parse(text)), text
+
+    stats = adaptive.scheduler.stats.values()
+    assert sum(s.gated + s.memoized for s in stats) > 0
+
+
+def test_forced_gating_keeps_output_identical():
+    static = Repair()
+    adaptive = Repair(adaptive_rules=True)
+    # Sin calentamiento y con cualquier tasa de acierto: se comprueba `requires` siempre
+    adaptive.scheduler = AdaptiveRuleScheduler(warmup=0, gate_below=1.1)
+    for text in INPUTS:
+        assert _outcome(adaptive.parse(text)) == _outcome(static.parse(text)), text
+    assert adaptive.scheduler.index_tokens > 0
+
+
+def test_disabled_by_default():
+    assert Repair().scheduler is None
+
+
+def test_requires_is_exact():
+    # Si una regla declara `requires`, applies() nunca es True sin esos tipos de token
+    pipeline = Repair()
+    for text in INPUTS:
+        tokens = pipeline.tokenizer.tokenize(pipeline.pre_normalize.process(text))
+        for window in (tokens, tokens[:5], tokens[1:], tokens[-4:]):
+            context = Context(text, tokens=list(window))
+            for rule_cls in registered_rules():
+                if rule_cls.requires and rule_cls().applies(context):
+                    assert context.structure.has_any(*rule_cls.requires), rule_cls.__name__
+
+
+def test_scheduler_snapshot_and_memo():
+    pipeline = Repair(adaptive_rules=True)
+    pipeline.parse("{a: 1, b: [1, 2,]}")
+    snapshot = pipeline.scheduler.snapshot()
+    assert list(snapshot) == sorted(snapshot)
+    for entry in snapshot.values():
+        assert entry["evaluations"] >= entry["hits"] >= 0
+        assert 0.0 <= entry["hit_rate"] <= 1.0
+
+    scheduler = AdaptiveRuleScheduler()
+    rule = EqualToColonRule()
+    context = Context("{a = 1}", tokens=Repair().tokenizer.tokenize("{a: 1}"))
+    assert not scheduler.applies(rule, context)
+    assert not scheduler.applies(rule, context)
+    assert scheduler.stats_for(rule).memoized == 1
+    # Tokens modificados: el rechazo anterior deja de valer
+    context.tokens = Repair().tokenizer.tokenize("{a = 1}")
+    context.invalidate_structure()
+    assert scheduler.applies(rule, context)
+
+
+def test_equal_priority_rules_keep_registration_order():
+    order = list(dict.fromkeys(RuleRegistry.get_rules("all")))
+    resolved = RuleSelector().add_tags("cleanup", "structure", "values", "normalization").resolve()
+    ties = [cls for cls in resolved if cls.priority == 20]
+    assert len(ties) > 1
+    assert ties == sorted(ties, key=order.index)
+    assert resolved == RuleSelector().add_tags("values", "normalization", "structure", "cleanup").resolve()
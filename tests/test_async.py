@@ -0,0 +1,62 @@
+# tests/test_async.py
+import asyncio
+import json
+
+import pytest
+
+from pyparsejson import aloads, loads
+from pyparsejson.core.repair import Repair
+
+BIG = "{" + ", ".join(f"k{i}: 'v {i}'" for i in range(300)) + "}"
+
+
+@pytest.mark.parametrize("options", [
+    {},
+    {"inline_limit": 0},
+    {"inline_limit": 0, "cooperative": True},
+])
+def test_aloads_matches_loads(options):
+    assert asyncio.run(aloads(BIG, **options)) == loads(BIG)
+
+
+def test_cooperative_repair_yields_to_the_loop():
+    async def main():
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0)
+
+        task = asyncio.create_task(ticker())
+        await asyncio.sleep(0)
+        report = await Repair().aparse(BIG, cooperative=True, inline_limit=0)
+        task.cancel()
+        return report, ticks
+
+    report, ticks = asyncio.run(main())
+    assert len(report.python_object) == 300
+    assert ticks > 10
+
+
+def test_limiter_bounds_large_repairs():
+    async def main():
+        limiter = asyncio.Semaphore(1)
+        await limiter.acquire()
+        pending = asyncio.create_task(aloads(BIG, inline_limit=0, limiter=limiter))
+        small = await aloads("a: 1", inline_limit=100, limiter=limiter)
+        await asyncio.sleep(0.01)
+        blocked = not pending.done()
+        limiter.release()
+        return small, blocked, await pending
+
+    small, blocked, big = asyncio.run(main())
+    assert small == {"a": 1}
+    assert blocked
+    assert len(big) == 300
+
+
+def test_aloads_strict_failure_raises():
+    with pytest.raises(json.JSONDecodeError):
+        asyncio.run(aloads("hola", mode="strict"))
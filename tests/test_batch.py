@@ -0,0 +1,57 @@
+# tests/test_batch.py
+import io
+import json
+
+import pytest
+
+from pyparsejson import iter_load_lines, loads, loads_many
+
+DOCS = ["user: admin, active: si", "{'a': [1, 2,]}", "user: admin, active: si", "[1 2 3]", "name = x"]
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_loads_many_matches_loads_in_order(executor):
+    results = loads_many(DOCS, workers=2, executor=executor, chunksize=2)
+    assert results == [loads(doc) for doc in DOCS]
+
+
+def test_duplicates_get_independent_copies():
+    first, _, third, *_ = loads_many(DOCS, workers=1)
+    assert first == third and first is not third
+
+
+def test_per_item_errors():
+    docs = ['{"a": 1}', "hola", '{"b": 2}']
+    results = loads_many(docs, workers=2, executor="thread", chunksize=1, mode="strict")
+
+    assert results[0] == {"a": 1}
+    assert isinstance(results[1], json.JSONDecodeError)
+    assert results[2] == {"b": 2}
+
+    with pytest.raises(json.JSONDecodeError):
+        loads_many(docs, workers=1, mode="strict", return_exceptions=False)
+
+
+def test_invalid_executor():
+    with pytest.raises(ValueError):
+        loads_many(DOCS, executor="fiber")
+
+
+LINES = ['{"ok": 1}', "user: admin, active: si", "", '{"ok": 2}', "[1 2 3]", '{"ok": 3}'] * 5
+
+
+@pytest.mark.parametrize("workers, executor", [(1, "thread"), (2, "thread"), (2, "process")])
+def test_iter_load_lines_in_order(workers, executor):
+    fp = io.StringIO("\n".join(LINES))
+    results = list(iter_load_lines(fp, workers=workers, executor=executor, chunksize=4,
+                                   max_in_flight=2, block_size=7))
+    assert results == [loads(line) for line in LINES if line]
+
+
+def test_iter_load_lines_reports_and_binary_input():
+    fp = io.BytesIO("\n".join(LINES[:6]).encode("utf-8"))
+    results = list(iter_load_lines(fp, workers=1, with_reports=True))
+
+    assert [summary.line for _, summary in results] == [1, 2, 4, 5, 6]
+    assert [summary.fast_path for _, summary in results] == [True, False, True, False, True]
+    assert results[1] == ({"user": "admin", "active": True}, results[1][1])
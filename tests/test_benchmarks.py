@@ -0,0 +1,76 @@
+# tests/test_benchmarks.py
+import pytest
+
+from benchmarks import rules as rules_bench
+from benchmarks.compare import compare
+from benchmarks.corpus import DAMAGE_CLASSES, generate
+from benchmarks.rules import MIXES, synthetic_tokens
+from benchmarks.suite import format_memory, percentile, run_case
+from pyparsejson import loads
+from pyparsejson.core.token import TokenType
+from pyparsejson.report.repair_report import PhaseTimings
+from pyparsejson.rules.base import Rule
+from pyparsejson.rules.structure.separators import EqualToColonRule
+
+
+@pytest.mark.parametrize("damage", DAMAGE_CLASSES)
+def test_corpus_is_seeded_and_sized(damage):
+    text = generate(damage, 2000, seed=1)
+    assert text == generate(damage, 2000, seed=1)
+    assert text != generate(damage, 2000, seed=2)
+    assert 1500 <= len(text) <= 2600
+
+
+def test_percentile_nearest_rank():
+    samples = list(range(1, 101))
+    assert percentile(samples, 50) == 50
+    assert percentile(samples, 99) == 99
+    assert percentile([3.0], 90) == 3.0
+
+
+def test_run_case_reports_phases_and_baseline():
+    result = run_case("valid", "100B", repeat=2, max_seconds=1)
+    assert result["latency"]["runs"] == 2
+    assert set(result["phases"]) == set(PhaseTimings.PHASES)
+    assert result["json_loads"]["p50_ms"] > 0
+    assert "memory" not in result
+
+
+def test_run_case_memory_mode():
+    result = run_case("bare_keys", "1KB", repeat=1, max_seconds=1, memory=True)
+    assert result["memory"]["phases"]["tokenize"]["retained"] > 0
+    assert result["memory"]["peak_per_byte"] > 0
+    assert "bare_keys/1KB" in format_memory([result])
+
+
+def test_compare_flags_regressions():
+    base = {"a/1KB": {"latency": {"p50_ms": 10.0}}, "b/1KB": {"latency": {"p50_ms": 10.0}}}
+    new = {"a/1KB": {"latency": {"p50_ms": 12.0}}, "b/1KB": {"latency": {"p50_ms": 10.5}}}
+    rows = {case: regression for case, _, _, _, regression in compare(base, new, threshold=0.10)}
+    assert rows == {"a/1KB": True, "b/1KB": False}
+
+
+def test_synthetic_tokens_are_seeded_and_sized():
+    tokens = synthetic_tokens(500, MIXES["mixed"], seed=1)
+    assert [t.value for t in tokens] == [t.value for t in synthetic_tokens(500, MIXES["mixed"], seed=1)]
+    assert 500 <= len(tokens) <= 530
+    assert (tokens[0].type, tokens[-1].type) == (TokenType.LBRACKET, TokenType.RBRACKET)
+    assert loads(" ".join(t.value for t in synthetic_tokens(200, MIXES["clean"]))) != []
+
+
+class CountStrings(Rule):
+    def applies(self, context):
+        return True
+
+    def apply(self, context):
+        sum(t.type == TokenType.STRING for t in context.tokens)
+
+
+def test_rule_harness_measures_registered_and_custom_rules():
+    results = rules_bench.run([EqualToColonRule, CountStrings], sizes=(100, 400), mix="separators",
+                              repeat=1, sort="name")
+    assert [r["name"] for r in results] == ["CountStrings", "EqualToColonRule"]
+    assert all(r["fires"] and len(r["apply"]) == 2 and r["ns_per_token"] > 0 for r in results)
+    assert rules_bench.load_rule("pyparsejson.rules.structure.separators:EqualToColonRule") is EqualToColonRule
+    with pytest.raises(TypeError):
+        rules_bench.load_rule("pyparsejson.core.token:Token")
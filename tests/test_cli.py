@@ -0,0 +1,90 @@
+# tests/test_cli.py
+import io
+import json
+import os
+import stat
+
+import pytest
+
+from pyparsejson.cli import main
+
+
+@pytest.fixture
+def tree(tmp_path):
+    source = tmp_path / "in"
+    (source / "sub").mkdir(parents=True)
+    (source / "one.json").write_text("{a: 1, b: 'x',}", encoding="utf-8")
+    (source / "sub" / "two.json").write_text("[1, 2, 3,]", encoding="utf-8")
+    (source / "notes.txt").write_text("not selected", encoding="utf-8")
+    return tmp_path
+
+
+def _run(*argv):
+    stdout, stderr = io.StringIO(), io.StringIO()
+    code = main([str(a) for a in argv], stdout=stdout, stderr=stderr)
+    return code, stdout.getvalue(), stderr.getvalue()
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_out_dir_mirrors_input_tree(tree, jobs):
+    code, _, summary = _run(tree / "in", "--out-dir", tree / "out", "--jobs", jobs)
+    assert code == 0
+    assert json.loads((tree / "out" / "one.json").read_text()) == {"a": 1, "b": "x"}
+    assert json.loads((tree / "out" / "sub" / "two.json").read_text()) == [1, 2, 3]
+    assert not (tree / "out" / "notes.txt").exists()
+    assert "2 reparados" in summary
+
+
+def test_in_place_and_resumable_manifest(tree):
+    manifest = tree / "run.jsonl"
+    code, _, _ = _run(tree / "in", "--in-place", "--manifest", manifest, "--jobs", 1)
+    assert code == 0
+    assert json.loads((tree / "in" / "one.json").read_text()) == {"a": 1, "b": "x"}
+    assert len(manifest.read_text().splitlines()) == 2
+
+    # Segunda ejecución: nada cambió, todo se omite
+    (tree / "in" / "new.json").write_text("{c: 3}", encoding="utf-8")
+    code, _, summary = _run(tree / "in", "--in-place", "--manifest", manifest, "--jobs", 1)
+    assert code == 0
+    assert "1 reparados, 2 omitidos" in summary
+    assert json.loads((tree / "in" / "new.json").read_text()) == {"c": 3}
+
+
+@pytest.mark.skipif(os.name != "posix", reason="permisos POSIX")
+def test_outputs_keep_permission_bits(tree):
+    source = tree / "in" / "one.json"
+    source.chmod(0o640)
+    umask = os.umask(0o022)
+    try:
+        assert _run(source, "--out-dir", tree / "out", "--jobs", 1)[0] == 0
+        assert _run(source, "--in-place", "--jobs", 1)[0] == 0
+    finally:
+        os.umask(umask)
+    assert stat.S_IMODE(source.stat().st_mode) == 0o640
+    assert stat.S_IMODE((tree / "out" / "one.json").stat().st_mode) == 0o644
+
+
+def test_single_file_to_stdout(tree):
+    code, out, _ = _run(tree / "in" / "one.json", "--quiet")
+    assert code == 0
+    assert json.loads(out) == {"a": 1, "b": "x"}
+
+
+def test_strict_failure_sets_exit_code_and_writes_nothing(tree):
+    (tree / "in" / "bad.json").write_text("no json here", encoding="utf-8")
+    code, _, summary = _run(tree / "in" / "bad.json", "--mode", "strict", "--out-dir", tree / "out")
+    assert code == 1
+    assert not (tree / "out" / "bad.json").exists()
+    assert "FAILED_UNRECOVERABLE: 1" in summary or "FAILURE_NO_STRUCTURE: 1" in summary
+
+    code, _, _ = _run(tree / "in" / "bad.json", "--mode", "strict", "--in-place")
+    assert code == 1
+    assert (tree / "in" / "bad.json").read_text() == "no json here"
+    assert [p.name for p in (tree / "in").iterdir() if p.name.startswith(".pyparsejson-")] == []
+
+
+def test_stdin(monkeypatch):
+    monkeypatch.setattr("sys.stdin", io.StringIO("{x: True}"))
+    code, out, _ = _run("-q")
+    assert code == 0
+    assert json.loads(out) == {"x": True}
@@ -0,0 +1,137 @@
+# tests/test_complexity.py
+"""
+Regresiones de complejidad algorítmica.
+
+Cada fase del pipeline y cada regla registrada se ejecuta sobre entradas de tamaño
+1×, 4× y 16×; se ajusta el exponente de crecimiento (pendiente de log(tiempo) frente a
+log(tamaño)) y el test falla si supera el presupuesto declarado del componente. El
+pipeline completo se mide además sobre el corpus patológico de `tools.perf_fuzz`.
+"""
+import copy
+
+import pytest
+
+from benchmarks.corpus import generate
+from benchmarks.rules import best_time, fit_exponent, registered_rules
+from pyparsejson import find_all
+from pyparsejson.core.context import Context
+from pyparsejson.core.repair import Repair
+from pyparsejson.core.segments import iter_regions
+
+SCALES = (1, 4, 16)
+BASE_SIZE = 1000   # caracteres a escala 1×
+REPEAT = 3
+
+# Exponente máximo permitido (tiempo ∝ tamaño^k). Lineal por defecto, con margen para
+# el ruido de medida; una ruta cuadrática da k≈2. Solo se declaran las excepciones.
+DEFAULT_BUDGET = 1.35
+BUDGETS = {}
+
+# Por debajo de este tiempo (s) a escala 16× el componente es prácticamente constante
+# y el ajuste solo mediría ruido.
+MIN_SECONDS = 2e-4
+
+_DAMAGE = ("bare_keys", "missing_commas", "equals_separators", "tuples", "implicit_arrays", "comments")
+_PIPELINE = Repair()
+
+
+def _check(name, fn, make_arg):
+    seconds = [best_time(fn, lambda scale=scale: make_arg(scale), REPEAT) for scale in SCALES]
+    if seconds[-1] < MIN_SECONDS:
+        return
+    exponent = fit_exponent(SCALES, seconds)
+    budget = BUDGETS.get(name, DEFAULT_BUDGET)
+    assert exponent <= budget, (
+        f"{name}: growth exponent {exponent:.2f} exceeds budget {budget} "
+        f"(times: {', '.join(f'{t * 1000:.2f} ms' for t in seconds)})"
+    )
+
+
+class _Inputs:
+    """Textos y tokens por escala, generados una vez para todo el módulo."""
+
+    def __init__(self):
+        self.text, self.clean, self.tokens, self.repaired = {}, {}, {}, {}
+        for scale in SCALES:
+            size = BASE_SIZE * scale // len(_DAMAGE)
+            text = "[" + ",\n".join(generate(damage, size) for damage in _DAMAGE) + "]"
+            clean = _PIPELINE.pre_normalize.process(text)
+            self.text[scale], self.clean[scale] = text, clean
+            self.tokens[scale] = _PIPELINE.tokenizer.tokenize(clean)
+            context = self.context(scale)
+            _PIPELINE.engine.drain(_PIPELINE._iter_repair_loop(context))
+            self.repaired[scale] = context.tokens
+
+    def context(self, scale, repaired=False):
+        """Contexto nuevo con copias de los tokens (las reglas los mutan in-place)."""
+        context = Context(self.clean[scale])
+        source = self.repaired[scale] if repaired else self.tokens[scale]
+        context.tokens = [copy.copy(token) for token in source]
+        return context
+
+
+@pytest.fixture(scope="module")
+def inputs():
+    return _Inputs()
+
+
+def test_fit_exponent():
+    assert fit_exponent(SCALES, [3e-3 * s for s in SCALES]) == pytest.approx(1.0)
+    assert fit_exponent(SCALES, [1e-4 * s * s for s in SCALES]) == pytest.approx(2.0)
+    assert fit_exponent(SCALES, [5e-3, 5e-3, 5e-3]) == pytest.approx(0.0)
+
+
+_PHASES = {
+    "pre_normalize": (lambda text: _PIPELINE.pre_normalize.process(text), lambda inp, s: inp.text[s]),
+    "tokenize": (lambda clean: _PIPELINE.tokenizer.tokenize(clean), lambda inp, s: inp.clean[s]),
+    "repair_loop": (lambda ctx: _PIPELINE.engine.drain(_PIPELINE._iter_repair_loop(ctx)),
+                    lambda inp, s: inp.context(s)),
+    "build": (lambda ctx: _PIPELINE._build_object(ctx), lambda inp, s: inp.context(s, repaired=True)),
+    "finalize": (lambda ctx: _PIPELINE.finalizer.process(ctx), lambda inp, s: inp.context(s, repaired=True)),
+    "quality": (lambda ctx: _PIPELINE.quality_evaluator.evaluate(ctx),
+                lambda inp, s: inp.context(s, repaired=True)),
+}
+
+
+@pytest.mark.parametrize("phase", list(_PHASES))
+def test_phase_complexity(inputs, phase):
+    fn, make_arg = _PHASES[phase]
+    _check(phase, fn, lambda scale: make_arg(inputs, scale))
+
+
+def _prepared_context(inputs, scale):
+    context = inputs.context(scale)
+    context.structure  # el índice se construye fuera de la medición
+    return context
+
+
+@pytest.mark.parametrize("rule_cls", registered_rules(), ids=lambda cls: cls.__name__)
+@pytest.mark.parametrize("method", ["applies", "apply"])
+def test_rule_complexity(inputs, rule_cls, method):
+    rule = rule_cls()
+    _check(f"{rule_cls.__name__}.{method}", getattr(rule, method),
+           lambda scale: _prepared_context(inputs, scale))
+
+
+# El corpus patológico (`tools.perf_fuzz`) cuesta ~100 veces más por byte que el resto:
+# se mide el pipeline completo sobre documentos más pequeños.
+PATHOLOGICAL_BASE_SIZE = 60
+
+
+def test_pathological_corpus_complexity():
+    texts = {scale: generate("pathological", PATHOLOGICAL_BASE_SIZE * scale) for scale in SCALES}
+    _check("pathological", _PIPELINE.parse, lambda scale: texts[scale])
+
+
+# Prosa con aperturas sueltas que nunca cierran: cada una recorría el resto del texto
+_NOISY_LINE = 'log line: use { to start, or [ for lists; got {"a": 1} ok\n'
+
+
+@pytest.mark.parametrize("name", ["iter_regions", "find_all"])
+def test_noisy_text_region_scan_complexity(name):
+    texts = {scale: _NOISY_LINE * (40 * scale) for scale in SCALES}
+    if name == "iter_regions":
+        fn = lambda text: list(iter_regions(text))
+    else:
+        fn = lambda text: list(find_all(text, workers=1))
+    _check(name, fn, lambda scale: texts[scale])
@@ -0,0 +1,57 @@
+# tests/test_extract.py
+import pytest
+
+from pyparsejson import find_all, loads
+from pyparsejson.core.segments import iter_regions
+
+LOG = (
+    '[INFO] 12:00 got {"a": 1, "b": [1,2]} and [12:30:01] {name} then\n'
+    '<div class="x">use { to start; log {x: {\'y\': 2},} and arr [{"k":1},{"k":2}]</div>\n'
+)
+
+
+def test_regions_skip_non_json_brackets():
+    spans = list(iter_regions(LOG))
+    assert [LOG[s:e] for s, e in spans] == ['{"a": 1, "b": [1,2]}', "{x: {'y': 2},}", '[{"k":1},{"k":2}]']
+
+
+def test_unclosed_region_at_end_of_text_is_kept():
+    text = 'prefix {"a": 1} suffix {"b": [1, 2'
+    assert [text[s:e] for s, e in iter_regions(text)][-1] == '{"b": [1, 2'
+
+
+def test_find_all_repairs_each_region():
+    results = list(find_all(LOG, workers=1))
+    assert [obj for _, obj, _ in results] == [{"a": 1, "b": [1, 2]}, {"x": {"y": 2}}, [{"k": 1}, {"k": 2}]]
+    for (start, end), obj, report in results:
+        assert loads(LOG[start:end]) == obj
+        assert report.success
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_find_all_skips_regions_that_fall_back_to_empty_object(workers):
+    text = 'text {a: [1, 2} : } more {x: [y: 1} : ]} end ' + '{"ok": 1} '
+    results = list(find_all(text, workers=workers, executor="thread", chunksize=1))
+    assert [obj for _, obj, _ in results] == [{"ok": 1}]
+
+
+def test_find_all_is_lazy():
+    text = LOG * 50
+    results = find_all(text, workers=1, chunksize=2)
+    first = next(results)
+    assert first[1] == {"a": 1, "b": [1, 2]}
+    results.close()
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_find_all_parallel_matches_sequential(executor):
+    text = "".join(f'line {i}: {{"id": {i}, ok: True, \'tags\': [\'a\',]}} trailing\n' for i in range(40))
+    sequential = list(find_all(text, workers=1))
+    parallel = list(find_all(text, workers=2, executor=executor, chunksize=8))
+    assert [(span, obj) for span, obj, _ in parallel] == [(span, obj) for span, obj, _ in sequential]
+    assert [obj["id"] for _, obj, _ in parallel] == list(range(40))
+
+
+def test_find_all_rejects_invalid_executor():
+    with pytest.raises(ValueError):
+        list(find_all("{}", executor="gpu"))
@@ -0,0 +1,123 @@
+# tests/test_hooks.py
+import io
+import json
+
+import pytest
+
+from pyparsejson.core.hooks import HookChain, RepairHooks, combine_hooks
+from pyparsejson.core.repair import Repair
+from pyparsejson.utils.tracing import JSONSpanHook
+
+TRUNCATED = '{"name": "Ana", "items": [{"id": 1}, {"id": 2, "n'
+
+
+class Recorder(RepairHooks):
+    def __init__(self):
+        self.calls = []
+
+    def on_phase_start(self, phase, tokens):
+        self.calls.append(("start", phase, tokens))
+
+    def on_phase_end(self, phase, seconds, tokens):
+        assert seconds >= 0
+        self.calls.append(("end", phase, tokens))
+
+    def on_rule_applied(self, rule, edits):
+        self.calls.append(("rule", rule.name, edits.iteration, edits.tokens_before, edits.tokens_after))
+
+    def on_iteration(self, iteration, changed, seconds, tokens):
+        self.calls.append(("iteration", iteration, changed))
+
+    def on_fallback(self, error, recovered, salvaged, seconds):
+        self.calls.append(("fallback", recovered, salvaged))
+
+
+def _phases(calls):
+    return [(kind, phase) for kind, phase, *_ in calls if kind in ("start", "end")]
+
+
+def test_no_hooks_by_default():
+    assert Repair().hooks is None
+    assert combine_hooks([]) is None
+
+
+def test_phases_rules_and_iterations():
+    hook = Recorder()
+    report = Repair(hooks=[hook]).parse("{a: 1, b: [1, 2,]}")
+
+    assert _phases(hook.calls) == [
+        ("start", "parse"),
+        ("start", "pre_normalize"), ("end", "pre_normalize"),
+        ("start", "tokenize"), ("end", "tokenize"),
+        ("start", "repair_loop"), ("end", "repair_loop"),
+        ("start", "build"), ("end", "build"),
+        ("start", "finalize"), ("end", "finalize"),
+        ("end", "parse"),
+    ]
+    rules = [call[1] for call in hook.calls if call[0] == "rule"]
+    assert rules == report.applied_rules
+    iterations = [call for call in hook.calls if call[0] == "iteration"]
+    assert [call[1] for call in iterations] == list(range(1, report.iterations + 1))
+    assert iterations[-1][2] is False
+
+    report.evaluate_quality()
+    assert _phases(hook.calls)[-2:] == [("start", "quality"), ("end", "quality")]
+
+
+def test_fallback_hook():
+    hook = Recorder()
+    Repair(hooks=[hook], salvage=True).parse(TRUNCATED)
+    assert ("fallback", True, True) in hook.calls
+    assert ("start", "json_loads") in _phases(hook.calls)
+
+    hook = Recorder()
+    Repair(hooks=[hook], local_repair=True).parse('{"k": [1, 2,, 3]}')
+    assert ("end", "local_repair") in _phases(hook.calls)
+
+
+def test_hook_chain_calls_every_hook():
+    first, second = Recorder(), Recorder()
+    pipeline = Repair(hooks=[first, second])
+    assert isinstance(pipeline.hooks, HookChain)
+    pipeline.parse("{a: 1}")
+    assert first.calls == second.calls and first.calls
+
+
+def test_json_span_hook_emits_one_trace_per_parse():
+    stream = io.StringIO()
+    pipeline = Repair(hooks=[JSONSpanHook(stream)], salvage=True)
+    pipeline.parse(TRUNCATED)
+    pipeline.parse("{a: 1}")
+
+    records = [json.loads(line) for line in stream.getvalue().splitlines()]
+    roots = [r for r in records if r["parent_id"] is None]
+    assert [r["name"] for r in roots] == ["parse", "parse"]
+    assert {r["kind"] for r in records} == {"phase", "iteration", "rule", "fallback"}
+
+    first_trace = [r for r in records if r["trace_id"] == roots[0]["trace_id"]]
+    span_ids = {r["span_id"] for r in first_trace}
+    assert all(r["parent_id"] in span_ids for r in first_trace if r["parent_id"])
+    loop = next(r for r in first_trace if r["name"] == "repair_loop")
+    assert loop["attributes"]["tokens_after"] >= loop["attributes"]["tokens_before"] > 0
+    assert all(r["parent_id"] == loop["span_id"] for r in first_trace if r["kind"] in ("rule", "iteration"))
+
+
+def test_deferred_quality_is_not_attached_to_another_trace():
+    records = []
+    pipeline = Repair(hooks=[JSONSpanHook(sink=records.append)])
+    first = pipeline.parse("{a: 1}")
+    pipeline.parse("{b: 2}")
+    emitted = len(records)
+    assert first.status is not None
+    assert len(records) == emitted
+
+    records.clear()
+    Repair(hooks=[JSONSpanHook(sink=records.append)], eager_quality=True).parse("{a: 1}")
+    root = next(r for r in records if r["name"] == "parse")
+    quality = next(r for r in records if r["name"] == "quality")
+    assert (quality["trace_id"], quality["parent_id"]) == (root["trace_id"], root["span_id"])
+
+
+def test_json_span_hook_needs_a_destination():
+    with pytest.raises(ValueError):
+        JSONSpanHook()
@@ -0,0 +1,177 @@
+# tests/test_incremental.py
+import io
+import json
+import tracemalloc
+
+import pytest
+
+from benchmarks.corpus import DAMAGE_CLASSES, generate
+from pyparsejson import IncrementalRepair, iter_items, loads
+from pyparsejson.core.segments import CLOSE, COMMA, OPEN, SEPARATOR, SegmentScanner
+
+
+def _stream(text, size):
+    inc = IncrementalRepair()
+    snapshots = []
+    for i in range(0, len(text), size):
+        inc.feed(text[i:i + size])
+        snapshots.append(inc.snapshot())
+    return inc, snapshots
+
+
+def test_scanner_events_are_independent_of_chunking():
+    text = '{"a": "x,}\\"y", \'b\': [1, (2, 3)], it\'s: {"c"= 1}}'
+    whole = SegmentScanner().feed(text)
+
+    scanner = SegmentScanner()
+    pieces = [event for ch in text for event in scanner.feed(ch)]
+
+    assert pieces == whole
+    # Ni la coma del string ni la del paréntesis son fronteras
+    assert [kind for kind, _, _ in whole].count(COMMA) == 3
+    assert whole[0] == (OPEN, 0, "{") and whole[-1] == (CLOSE, len(text) - 1, "}")
+    assert (SEPARATOR, text.index("= 1"), "=") in whole
+
+
+@pytest.mark.parametrize("size", [1, 3, 17])
+def test_final_snapshot_matches_loads(size):
+    doc = json.dumps({"name": "Ana", "tags": ["a", "b,c"], "meta": {"age": 30, "s": "x\"y"},
+                      "rows": [[1, 2], {"z": None}], "empty": {}})
+    inc, snapshots = _stream(doc, size)
+    assert inc.done
+    assert snapshots[-1] == json.loads(doc)
+
+
+@pytest.mark.parametrize("damage", DAMAGE_CLASSES)
+def test_final_snapshot_matches_loads_on_corpus(damage):
+    for seed in range(3):
+        text = generate(damage, 200, seed)
+        expected = loads(text, salvage=True)
+        inc = IncrementalRepair()
+        inc.feed(text)
+        assert inc.snapshot() == expected
+        inc, _ = _stream(text, 1)
+        assert inc.snapshot() == expected
+
+
+@pytest.mark.parametrize("text, expected", [
+    ('{a: 1 b: {c: 2}}', {"a": 1, "b": {"c": 2}}),
+    ('{"ids": 1, 2, 3, "name": "x"}', {"ids": [1, 2, 3], "name": "x"}),
+    ('{"k0": {"id": 0 "name": "gamma" "tags": ["gamma" "x0"]}}',
+     {"k0": {"id": 0, "name": "gamma", "tags": ["gamma x0"]}}),
+])
+def test_members_are_repaired_whole(text, expected):
+    # Ni el texto previo a un valor anidado es solo su clave ni una coma cierra siempre el miembro
+    for size in (len(text), 1):
+        inc, _ = _stream(text, size)
+        assert inc.snapshot() == loads(text) == expected
+
+
+def test_snapshots_grow_with_partial_values():
+    inc, snapshots = _stream('{"answer": "The quick brown fox", "n": [1, 2, 3]}', 8)
+    assert snapshots[0] == {}
+    assert {"answer": "The quick br"} in snapshots
+    assert {"answer": "The quick brown fox", "n": []} in snapshots
+    assert all("The quick brown fox".startswith(s.get("answer", "")) for s in snapshots)
+    assert snapshots[-1] == {"answer": "The quick brown fox", "n": [1, 2, 3]}
+
+
+def test_partial_key_is_not_reported():
+    inc = IncrementalRepair()
+    inc.feed('{"a": 1, "lon')
+    assert inc.snapshot() == {"a": 1}
+
+
+def test_broken_members_are_repaired():
+    doc = "Here you go:\n```json\n{name: 'Ana', active: True, tags: ['x',], extra: None,}\n```"
+    inc, snapshots = _stream(doc, 5)
+    assert snapshots[-1] == loads(doc[doc.index("{"):doc.rindex("}") + 1])
+    assert snapshots[-1] == {"name": "Ana", "active": True, "tags": ["x"], "extra": None}
+
+
+def test_completed_members_are_repaired_once(monkeypatch):
+    inc = IncrementalRepair()
+    calls = []
+    real_parse = inc.pipeline.parse
+    monkeypatch.setattr(inc.pipeline, "parse", lambda text: calls.append(text) or real_parse(text))
+
+    doc = json.dumps({f"k{i}": i for i in range(50)})
+    for i in range(0, len(doc), 4):
+        inc.feed(doc[i:i + 4])
+        inc.snapshot()
+
+    # Cada miembro cerrado se repara una vez; el resto son reparaciones del miembro en curso,
+    # que nunca incluyen miembros anteriores.
+    assert len(calls) <= 2 * (len(doc) // 4 + 1)
+    assert all(text.count(":") <= 1 for text in calls)
+    assert inc.snapshot() == json.loads(doc)
+
+
+def test_no_root_container_falls_back_to_whole_text():
+    inc = IncrementalRepair()
+    assert inc.snapshot() is None
+    inc.feed("name: Ana, age: 3")
+    assert inc.snapshot() == {"name": "Ana", "age": 3}
+
+
+class _LazyArray(io.RawIOBase):
+    """Archivo que genera un array de `n` objetos rotos bajo demanda, sin tenerlo entero en memoria."""
+
+    def __init__(self, n):
+        self.i, self.n, self.buffer = 0, n, ""
+
+    def read(self, size=-1):
+        while len(self.buffer) < size and self.i <= self.n:
+            if self.i < self.n:
+                self.buffer += ("[" if self.i == 0 else ",") + "{id: %d, 'tags': [a, b,], note: 'x'}" % self.i
+            else:
+                self.buffer += "]"
+            self.i += 1
+        out, self.buffer = self.buffer[:size], self.buffer[size:]
+        return out
+
+
+@pytest.mark.parametrize("block_size", [1, 7, 4096])
+def test_iter_items_yields_repaired_members(block_size):
+    text = "Result: [1, {a: 2,}, 'x,y', [3, 4],] done"
+    assert list(iter_items(io.StringIO(text), block_size=block_size)) == [1, {"a": 2}, "x,y", [3, 4]]
+
+
+def test_iter_items_object_root_and_binary_input():
+    fp = io.BytesIO('{"a": 1, b: "á", c: [1,2'.encode("utf-8"))
+    assert list(iter_items(fp, block_size=3)) == [("a", 1), ("b", "á"), ("c", [1, 2])]
+
+
+@pytest.mark.parametrize("block_size", [1, 2, 3])
+def test_iter_items_binary_multibyte_split_across_blocks(block_size):
+    fp = io.BytesIO('[{"name": "José"}, {"name": "Ñandú"}]'.encode("utf-8"))
+    assert list(iter_items(fp, block_size=block_size)) == [{"name": "José"}, {"name": "Ñandú"}]
+
+
+@pytest.mark.parametrize("text", [
+    '{"ids": 1, 2, 3, "name": "x"}',
+    '{"k0": {"ids": 7, 8}, "ids": 1, 2, "name": "x", "k1": [1, 2]}',
+    '{ids: 1, 2, 3, name: x, tags: a, b}',
+])
+def test_iter_items_keeps_keyless_values_with_their_member(text):
+    for block_size in (1, 7, 4096):
+        assert dict(iter_items(io.StringIO(text), block_size=block_size)) == loads(text)
+
+
+def test_iter_items_without_container_repairs_whole_text():
+    assert list(iter_items(io.StringIO("name: Ana, age: 3"))) == [("name", "Ana"), ("age", 3)]
+
+
+def test_iter_items_is_lazy_and_memory_is_bounded():
+    items = iter_items(_LazyArray(10 ** 9), block_size=256)
+    assert next(items) == {"id": 0, "tags": ["a", "b"], "note": "x"}
+
+    tracemalloc.start()
+    try:
+        for _ in range(200):
+            next(items)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert next(items)["id"] == 201
+    assert peak < 1_000_000
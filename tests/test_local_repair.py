@@ -0,0 +1,39 @@
+# tests/test_local_repair.py
+import pytest
+
+from pyparsejson.core.repair import Repair
+from pyparsejson.core.token import Token, TokenType
+from pyparsejson.phases.object_build import TokenValidator
+from pyparsejson.phases.tokenize import TolerantTokenizer
+
+
+@pytest.mark.parametrize("text, expected", [
+    ('{"k": [1, 2,, 3]}', {"k": [1, 2, 3]}),
+    ('{"a": 1, "b": }', {"a": 1, "b": None}),
+    ('{"a": [1, 2}, "c": 3}', {"a": [1, 2], "c": 3}),
+    ('{"a": {"b": 1}, "c" 2, "d": [1,,2]}', {"a": {"b": 1}, "c": 2, "d": [1, 2]}),
+    ('{"a": [1, 2]]}', {"a": [1, 2]}),
+    ('{"a":: 1}', {"a": 1}),
+])
+def test_local_repair_converges_where_fallback_gives_up(text, expected):
+    assert Repair().parse(text).python_object == {}
+
+    report = Repair(local_repair=True).parse(text)
+    assert report.python_object == expected
+    assert "LocalRepairer" in report.applied_rules
+
+
+def test_validator_resumes_from_checkpoint(monkeypatch):
+    tokens = TolerantTokenizer().tokenize("[" + ", ".join(["1"] * 600) + " 2]")
+    validator = TokenValidator(checkpoint_interval=100)
+
+    error = validator.run(tokens)
+    assert error is not None and error.msg == "Expecting ',' delimiter"
+
+    starts = []
+    scan = validator._scan
+    monkeypatch.setattr(validator, "_scan", lambda toks, start, *args: starts.append(start) or scan(toks, start, *args))
+
+    tokens.insert(error.index, Token(TokenType.COMMA, ",", ",", 0))
+    assert validator.run(tokens, resume_from=error.index) is None
+    assert starts == [error.index // 100 * 100]
@@ -0,0 +1,56 @@
+# tests/test_logging.py
+import logging
+
+from pyparsejson.core.repair import Repair
+from pyparsejson.utils.logger import RepairLogger
+
+
+def test_parse_failure_emits_event_instead_of_printing(capsys):
+    events = []
+    repair = Repair(event_sink=lambda name, fields: events.append((name, fields)))
+
+    report = repair.parse('{"a": }')
+
+    assert report.python_object == {}
+    assert capsys.readouterr().out == ""
+    names = [name for name, _ in events]
+    assert names == ["parse_failed", "fallback"]
+    assert events[0][1]["error"] == "Expecting value"
+    assert events[0][1]["pos"] == 5
+
+
+def test_flags_follow_level_changes():
+    logger = RepairLogger("pyparsejson.test_flags", level=logging.WARNING)
+    assert not logger.debug_enabled
+    assert not logger.events_enabled
+
+    logger.set_level(logging.DEBUG)
+    assert logger.debug_enabled and logger.events_enabled
+
+    logger.set_level(logging.WARNING)
+    logger.set_event_sink(lambda name, fields: None)
+    assert not logger.debug_enabled
+    assert logger.events_enabled
+
+
+def test_flags_follow_level_set_by_another_instance():
+    quiet = Repair(log_level=logging.WARNING)
+    assert not quiet.logger.debug_enabled
+    try:
+        # Mismo logger por nombre: el nivel lo cambia la última instancia (o la aplicación)
+        Repair(log_level=logging.DEBUG)
+        assert quiet.logger.debug_enabled and quiet.logger.events_enabled
+        logging.getLogger(quiet.logger.logger.name).setLevel(logging.ERROR)
+        assert not quiet.logger.debug_enabled
+    finally:
+        quiet.logger.set_level(logging.WARNING)
+
+
+def test_events_are_logged_as_records_at_debug(caplog):
+    logger = RepairLogger("pyparsejson.test_records", level=logging.DEBUG)
+    with caplog.at_level(logging.DEBUG, logger="pyparsejson.test_records"):
+        logger.event("fallback", mode="lax")
+
+    record = caplog.records[-1]
+    assert record.event == "fallback"
+    assert record.event_fields == {"mode": "lax"}
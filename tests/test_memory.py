@@ -0,0 +1,81 @@
+# tests/test_memory.py
+import io
+import json
+import tracemalloc
+
+from benchmarks.corpus import generate
+from pyparsejson.core.hooks import RepairHooks
+from pyparsejson.core.repair import Repair
+from pyparsejson.utils.memory import MemoryProfileHook
+
+TRUNCATED = '{"name": "Ana", "items": [{"id": 1}, {"id": 2, "n'
+
+
+class PhaseRecorder(RepairHooks):
+    def __init__(self):
+        self.phases = []
+
+    def on_phase_start(self, phase, tokens):
+        self.phases.append(phase)
+
+
+def test_disabled_by_default():
+    assert Repair().memory_profiler is None
+    assert Repair().parse("{a: 1}").memory is None
+
+
+def test_phases_peak_and_retained():
+    report = Repair(profile_memory=True).parse(generate("bare_keys", 20_000, 0))
+    memory = report.memory
+    assert {"pre_normalize", "tokenize", "repair_loop", "build", "finalize", "quality"} <= set(memory.phases)
+    # La lista de tokens sigue viva al terminar la tokenización
+    assert memory.phases["tokenize"].retained > 0
+    for usage in memory.phases.values():
+        assert usage.peak >= usage.retained
+    assert memory.peak >= max(usage.peak for usage in memory.phases.values())
+    assert memory.report_diffs > 0 and memory.report_issues > 0
+
+    payload = memory.as_dict()
+    json.dumps(payload)
+    assert list(payload["phases"])[:2] == ["pre_normalize", "tokenize"]
+
+
+def test_salvage_and_early_exits():
+    memory = Repair(profile_memory=True, salvage=True).parse(TRUNCATED).memory
+    assert "json_loads" in memory.phases and "fallback" in memory.phases
+
+    assert set(Repair(profile_memory=True).parse("").memory.phases) == {"pre_normalize"}
+    assert "build" not in Repair(profile_memory=True).parse("hello").memory.phases
+
+
+def test_repair_to_and_user_hooks():
+    hook = PhaseRecorder()
+    pipeline = Repair(profile_memory=True, hooks=[hook])
+    report = pipeline.repair_to(io.StringIO(), "{a: 1, b: [1, 2,]}")
+    assert report.memory.phases["tokenize"].peak > 0
+    assert hook.phases[0] == "parse" and "tokenize" in hook.phases
+
+
+def test_tracing_is_released_or_left_alone():
+    assert not tracemalloc.is_tracing()
+    pipeline = Repair(profile_memory=True)
+    pipeline.parse("{a: 1}")
+    assert not tracemalloc.is_tracing()
+
+    tracemalloc.start()
+    try:
+        assert pipeline.parse("{a: 1}").memory.phases["tokenize"].peak > 0
+        assert tracemalloc.is_tracing()
+    finally:
+        tracemalloc.stop()
+
+
+def test_interrupted_parse_does_not_leak_tracing():
+    hook = MemoryProfileHook()
+    hook.on_phase_start("parse", 0)
+    hook.on_phase_start("tokenize", 0)
+    assert tracemalloc.is_tracing()
+    # Una excepción dejó la reparación a medias: la siguiente la descarta
+    hook.on_phase_start("parse", 0)
+    hook.on_phase_end("parse", 0.0, 0)
+    assert not tracemalloc.is_tracing()
@@ -0,0 +1,104 @@
+# tests/test_metrics.py
+import io
+import json
+import threading
+
+import pytest
+
+import pyparsejson
+from pyparsejson import metrics
+from pyparsejson.core.repair import Repair
+from pyparsejson.metrics import MetricsRegistry
+
+
+@pytest.fixture
+def active_registry():
+    registry = metrics.enable(MetricsRegistry())
+    try:
+        yield registry
+    finally:
+        metrics.disable()
+
+
+def test_disabled_by_default():
+    assert metrics.get_registry() is None
+    assert Repair().metrics is None
+
+
+def test_latency_by_status_sizes_and_rules():
+    registry = MetricsRegistry()
+    pipeline = Repair(metrics=registry)
+    pipeline.parse('{"a": 1}')
+    pipeline.parse("{a: 1, b: [1, 2,]}")
+    pipeline.parse("")
+
+    snapshot = registry.snapshot()
+    by_status = snapshot["parse_latency_seconds"]["by_status"]
+    assert by_status["SUCCESS_STRICT_JSON"]["count"] == 2
+    assert by_status["SUCCESS_EMPTY_INPUT"]["count"] == 1
+    assert sum(h["count"] for h in by_status.values()) == 3
+    assert snapshot["input_size_chars"]["count"] == 3
+    assert snapshot["input_size_chars"]["counts"][0] == 3   # todas < 100 caracteres
+    assert snapshot["rule_applications"]["QuoteKeysRule"] >= 1
+    json.dumps(snapshot)
+
+
+def test_strict_failures_are_recorded_as_errors():
+    registry = MetricsRegistry()
+    with pytest.raises(ValueError):
+        Repair(mode="strict", metrics=registry).parse('{"a":: 1}')
+    assert registry.snapshot()["parse_latency_seconds"]["by_status"]["ERROR"]["count"] == 1
+
+
+def test_process_wide_registry(active_registry):
+    pyparsejson.loads("{a: 1}")
+    Repair().repair_to(io.StringIO(), "{b: 2}")
+    assert active_registry.snapshot()["input_size_chars"]["count"] == 2
+
+
+def test_thread_shards_are_merged():
+    registry = MetricsRegistry()
+    pipeline = Repair(metrics=registry)
+
+    def work():
+        for _ in range(20):
+            pipeline.parse("[1, 2,]")
+
+    threads = [threading.Thread(target=work) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(registry._shards) == 4
+    assert registry.snapshot()["input_size_chars"]["count"] == 80
+    registry.reset()
+    assert registry.snapshot()["input_size_chars"]["count"] == 0
+
+
+def test_batch_cache_and_fast_path(active_registry):
+    pyparsejson.loads_many(["{a: 1}", "{a: 1}", "{b: 2}"], workers=1)
+    lines = io.StringIO('{"ok": 1}\n{bad: 2}\n[1, 2]\n')
+    list(pyparsejson.iter_load_lines(lines, workers=1))
+
+    snapshot = active_registry.snapshot()
+    assert snapshot["cache"] == {"hits": 1, "misses": 2, "hit_rate": 1 / 3}
+    assert snapshot["fast_path"] == {"hits": 2, "misses": 1, "hit_rate": 2 / 3}
+
+
+def test_prometheus_export():
+    registry = MetricsRegistry(latency_buckets=(0.5, 100.0))
+    pipeline = Repair(metrics=registry)
+    pipeline.parse('{"a": 1}')
+    pipeline.parse('{"b": 2}')
+
+    text = registry.to_prometheus()
+    assert "# TYPE pyparsejson_parse_latency_seconds histogram" in text
+    assert 'pyparsejson_parse_latency_seconds_bucket{status="SUCCESS_STRICT_JSON",le="100.0"} 2' in text
+    assert 'pyparsejson_parse_latency_seconds_bucket{status="SUCCESS_STRICT_JSON",le="+Inf"} 2' in text
+    assert 'pyparsejson_parse_latency_seconds_count{status="SUCCESS_STRICT_JSON"} 2' in text
+    assert 'pyparsejson_input_size_chars_bucket{le="+Inf"} 2' in text
+    assert "pyparsejson_input_size_chars_count 2" in text
+    assert 'pyparsejson_cache_total{result="hit"} 0' in text
+    for line in text.splitlines():
+        assert line.startswith("#") or len(line.rsplit(" ", 1)) == 2
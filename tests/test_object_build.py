@@ -0,0 +1,47 @@
+# tests/test_object_build.py
+import json
+from decimal import Decimal
+
+import pytest
+
+from pyparsejson import loads
+from pyparsejson.core.context import Context
+from pyparsejson.core.token import Token, TokenType
+from pyparsejson.phases.json_finalize import JSONFinalize
+from pyparsejson.phases.object_build import TokenObjectBuilder, TokenBuildError
+from pyparsejson.phases.tokenize import TolerantTokenizer
+
+
+@pytest.mark.parametrize("text", [
+    '{"a": 1, "b": [1.5, -2e3, true, false, null], "c": {}}',
+    '[[], {}, "x\\ny", "\\u00e9"]',
+    '{"a": {"a": 1}, "a": 2}',
+    '"solo"',
+    '{}',
+])
+def test_builder_matches_json_loads(text):
+    context = Context(text)
+    context.tokens = TolerantTokenizer().tokenize(text)
+    expected = json.loads(JSONFinalize().process(context))
+    assert TokenObjectBuilder().build(context.tokens) == expected
+
+
+@pytest.mark.parametrize("text", ['{"a" 1}', '[1 2]', '{"a": 0123}', '{"a": si}', '[1,]'])
+def test_builder_rejects_non_strict_tokens(text):
+    with pytest.raises(TokenBuildError):
+        TokenObjectBuilder().build(TolerantTokenizer().tokenize(text))
+
+
+def test_builder_handles_deep_nesting_without_recursion():
+    depth = 50000
+    tokens = ([Token(TokenType.LBRACKET, "[", "[", 0)] * depth +
+              [Token(TokenType.RBRACKET, "]", "]", 0)] * depth)
+    result = TokenObjectBuilder().build(tokens)
+    for _ in range(depth - 1):
+        result = result[0]
+    assert result == []
+
+
+def test_loads_supports_stdlib_hooks():
+    pairs = loads('a: 1, b: 2.5', object_pairs_hook=list, parse_float=Decimal)
+    assert pairs == [("a", 1), ("b", Decimal("2.5"))]
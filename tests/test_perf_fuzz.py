@@ -0,0 +1,53 @@
+# tests/test_perf_fuzz.py
+import json
+import random
+
+from benchmarks.corpus import generate, load_pathological
+from tools import perf_fuzz
+from tools.perf_fuzz import OPERATORS, Candidate, CostModel, collect_seeds, fuzz, minimize, mutate
+
+
+def test_seeds_come_from_main_and_tests():
+    seeds = collect_seeds()
+    assert 'user=admin, active=no' in seeds        # main.py
+    assert "{a: 1, b: [1, 2,]}" in seeds           # tests/
+    assert all(len(seed) >= 4 for seed in seeds)
+
+
+def test_operators_and_mutation_are_deterministic():
+    text = '{"user": "admin", "ids": [1, 2, 3], "ok": true, "n": null}'
+    tokens = perf_fuzz._TOKENIZER.tokenize(text)
+    for name, operator in OPERATORS.items():
+        result = operator(random.Random(1), text, tokens)
+        assert result is None or isinstance(result, str), name
+    assert mutate(random.Random(7), text) == mutate(random.Random(7), text)
+
+
+def test_fuzz_and_minimize():
+    model = CostModel(repeat=1)
+    pool = fuzz(["{a: 1, b: [1, 2,]}", "x = 1\ny = 2"], model, iterations=20, seconds=10, population=4)
+    assert 0 < len(pool) <= 4
+    assert [c.score for c in pool] == sorted((c.score for c in pool), reverse=True)
+
+    worst = pool[0]
+    minimized = minimize(worst, model, max_checks=10)
+    assert len(minimized.text) <= len(worst.text)
+    entry = perf_fuzz.corpus_entry(model.describe(minimized), model)
+    assert entry["name"].startswith("patho_") and entry["text"] == minimized.text
+
+
+def test_save_corpus_merges(tmp_path):
+    path = str(tmp_path / "corpus.json")
+    perf_fuzz.save_corpus([{"name": "a", "text": "{a"}], path)
+    perf_fuzz.save_corpus([{"name": "b", "text": "[b"}], path, merge=True)
+    assert [e["name"] for e in load_pathological(path)] == ["a", "b"]
+    with open(path, encoding="utf-8") as fp:
+        assert json.load(fp)["inputs"][1]["text"] == "[b"
+
+
+def test_shipped_pathological_corpus():
+    entries = load_pathological()
+    assert entries and len({e["name"] for e in entries}) == len(entries)
+    texts = {e["text"] for e in entries}
+    document = generate("pathological", 2000, seed=3)
+    assert any(text in document for text in texts)
@@ -0,0 +1,79 @@
+# tests/test_quality.py
+import gc
+import pickle
+import weakref
+
+from pyparsejson.core.context import Context
+from pyparsejson.core.quality import RepairQualityEvaluator
+from pyparsejson.core.repair import Repair
+from pyparsejson.phases.tokenize import TolerantTokenizer
+from pyparsejson.report.repair_report import RepairStatus
+
+
+class CountingEvaluator(RepairQualityEvaluator):
+    calls = 0
+
+    def evaluate(self, context):
+        CountingEvaluator.calls += 1
+        return super().evaluate(context)
+
+
+def test_quality_is_evaluated_lazily():
+    CountingEvaluator.calls = 0
+    repair = Repair()
+    repair.quality_evaluator = CountingEvaluator()
+
+    report = repair.parse('user: admin, active: si')
+    assert report.python_object == {'user': 'admin', 'active': True}
+    assert CountingEvaluator.calls == 0
+
+    assert report.status == RepairStatus.SUCCESS_STRICT_JSON
+    assert report.quality_score == 1.0
+    assert CountingEvaluator.calls == 1
+
+
+def test_eager_quality_evaluates_immediately():
+    CountingEvaluator.calls = 0
+    repair = Repair(eager_quality=True)
+    repair.quality_evaluator = CountingEvaluator()
+
+    repair.parse('{"a": 1}')
+    assert CountingEvaluator.calls == 1
+
+
+def test_pending_quality_does_not_keep_context_alive():
+    contexts = []
+
+    class TrackingRepair(Repair):
+        def _finalize_report(self, context, *args):
+            contexts.append(weakref.ref(context))
+            super()._finalize_report(context, *args)
+
+    pipeline = TrackingRepair()
+    report = pipeline.parse('{a: 1, b: [1, 2,]}')
+    pipeline_ref = weakref.ref(pipeline)
+    del pipeline
+    gc.collect()
+
+    assert contexts[0]() is None
+    assert pipeline_ref() is None
+    assert report.status == RepairStatus.SUCCESS_STRICT_JSON
+
+
+def test_report_with_pending_quality_can_be_pickled():
+    report = Repair().parse('{"a": 1}')
+    restored = pickle.loads(pickle.dumps(report))
+    assert restored.status == RepairStatus.SUCCESS_STRICT_JSON
+
+
+def test_issue_text_is_capped():
+    text = " ".join("'x'" for _ in range(100))
+    context = Context(text)
+    context.tokens = TolerantTokenizer().tokenize(text)
+
+    score, issues = RepairQualityEvaluator().evaluate(context)
+    unclosed = [i for i in issues if i.startswith("Unclosed string")]
+
+    assert len(unclosed) == RepairQualityEvaluator.MAX_ISSUES
+    assert "... 80 more suspicious tokens omitted" in issues
+    assert score < 1.0
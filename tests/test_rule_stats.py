@@ -0,0 +1,61 @@
+# tests/test_rule_stats.py
+import pickle
+from collections import defaultdict
+
+from pyparsejson.core.flow import Flow
+from pyparsejson.core.repair import Repair
+from pyparsejson.core.token import TokenType
+from pyparsejson.report.repair_report import RuleStats
+from pyparsejson.rules.base import Rule
+from pyparsejson.rules.registry import RuleRegistry
+
+TEXT = "{name: 'x', tags: [a, b,], n: 1 m: 2}"
+
+
+def test_disabled_by_default():
+    report = Repair().parse(TEXT)
+    assert report.success
+    assert report.rule_stats == {}
+
+
+def test_counts_calls_time_and_changes():
+    report = Repair(collect_rule_stats=True).parse(TEXT)
+    assert report.python_object == Repair().parse(TEXT).python_object
+
+    stats = report.rule_stats
+    assert stats and all(isinstance(s, RuleStats) for s in stats.values())
+    for s in stats.values():
+        assert s.applies_calls >= s.apply_calls >= s.changes
+        assert s.tokens_scanned > 0
+        assert s.applies_seconds >= 0 and s.apply_seconds >= 0
+    # Cada regla que cambió los tokens aparece como aplicada en el reporte
+    changed = {name for name, s in stats.items() if s.changes}
+    assert changed and changed <= set(report.applied_rules)
+    assert pickle.loads(pickle.dumps(report)).rule_stats == stats
+
+
+def test_custom_registered_rule_is_counted(monkeypatch):
+    registry = defaultdict(list, {tag: list(rules) for tag, rules in RuleRegistry._registry.items()})
+    monkeypatch.setattr(RuleRegistry, "_registry", registry)
+
+    @RuleRegistry.register(tags=["test_upper"], priority=1)
+    class UpperStrings(Rule):
+        def applies(self, context):
+            return any(t.type == TokenType.STRING and t.value != t.value.upper() for t in context.tokens)
+
+        def apply(self, context):
+            for token in context.tokens:
+                if token.type == TokenType.STRING:
+                    token.value = token.value.upper()
+
+    class UpperFlow(Flow):
+        def execute(self, context):
+            return self.run_with_retries(context, tags=["test_upper"])
+
+    pipeline = Repair(auto_flows=False, collect_rule_stats=True)
+    pipeline.add_flow(UpperFlow(pipeline.engine))
+    report = pipeline.parse('{"a": "x"}')
+
+    stats = report.rule_stats["UpperStrings"]
+    assert (stats.apply_calls, stats.changes) == (1, 1)
+    assert stats.applies_calls >= 2
@@ -0,0 +1,57 @@
+# tests/test_salvage.py
+import json
+
+import pytest
+
+from pyparsejson import loads
+from pyparsejson.core.repair import Repair
+from pyparsejson.phases import salvage as salvage_module
+from pyparsejson.phases.salvage import TruncationSalvager
+from pyparsejson.report.repair_report import RepairStatus
+
+
+@pytest.mark.parametrize("text, expected", [
+    ('{"a":1,"b":[1,2,{"c":', {"a": 1, "b": [1, 2, {}]}),
+    ('{"a":1,"bb', {"a": 1}),
+    ('{"a":1,"b":"hola mun', {"a": 1, "b": "hola mun"}),
+    ('{"a":"x\\u00', {"a": "x"}),
+    ('[1,2,tr', [1, 2]),
+    ('[1,2.', [1]),
+    ('{"a":[', {"a": []}),
+])
+def test_salvager_keeps_largest_valid_prefix(text, expected):
+    ok, obj, _ = TruncationSalvager().salvage(text)
+    assert ok
+    assert obj == expected
+
+
+def test_salvager_bisects_past_invalid_content_with_bounded_decodes(monkeypatch):
+    calls = []
+    real_loads = json.loads
+
+    def counting_loads(s, **kwargs):
+        calls.append(s)
+        return real_loads(s, **kwargs)
+
+    monkeypatch.setattr(salvage_module.json, "loads", counting_loads)
+    # Escape inválido en medio: el escáner lo acepta, json.loads no
+    text = '{"a":1,"b":"\\x","c":2,"d":'
+    ok, obj, _ = TruncationSalvager().salvage(text)
+
+    assert ok and obj == {"a": 1}
+    assert len(calls) <= 3
+
+
+def test_salvager_reports_nothing_recoverable():
+    assert TruncationSalvager().salvage('x') == (False, None, "")
+
+
+def test_salvage_mode_in_pipeline():
+    text = '{"name": "Ana", "items": [{"id": 1}, {"id": 2, "n'
+
+    assert loads(text) == {}
+    assert loads(text, salvage=True) == {"name": "Ana", "items": [{"id": 1}, {"id": 2}]}
+
+    report = Repair(salvage=True).parse(text)
+    assert report.salvaged
+    assert report.status == RepairStatus.PARTIAL_REPAIR
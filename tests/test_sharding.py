@@ -0,0 +1,47 @@
+# tests/test_sharding.py
+import pytest
+
+from pyparsejson import loads, loads_sharded
+from pyparsejson.batch import _shard_texts
+from pyparsejson.core.segments import split_array
+
+DOC = "[" + ",\n".join("{id: %d, 'name': 'u%d', tags: [a, b,],}" % (i, i) for i in range(30)) + "]"
+
+
+@pytest.mark.parametrize("text, expected", [
+    ('[1, {"a": [1,2]}, "x,y"]', (1, 23, [2, 16])),
+    ("  [ ]  ", (3, 4, [])),
+    ("[1, 2", None),          # sin cerrar
+    ('[1, "a": 2]', None),    # ':' de primer nivel
+    ('[{"a":1]]', None),      # cierre equivocado
+    ("[1] trailing", None),   # texto tras la raíz
+    ('{"a": 1}', None),       # la raíz no es un array
+])
+def test_split_array(text, expected):
+    assert split_array(text) == expected
+
+
+def test_shards_group_whole_elements():
+    bounds = split_array(DOC)
+    shards = _shard_texts(DOC, bounds, 200)
+    assert len(shards) > 2
+    assert [item for shard in shards for item in loads(shard)] == loads(DOC)
+
+
+@pytest.mark.parametrize("workers, executor", [(1, "process"), (2, "thread"), (2, "process")])
+def test_loads_sharded_matches_loads(workers, executor):
+    assert loads_sharded(DOC, workers=workers, executor=executor, shard_size=200) == loads(DOC)
+
+
+@pytest.mark.parametrize("text", [
+    '{"a": [1, 2,]}',              # no es un array
+    "[{a: 1}, {b: 2}, [3, 4",      # truncado
+    '[{"a":1} {"b":2}, 3]',        # un shard no se repara como array
+])
+def test_ambiguous_input_falls_back_to_whole_document(text):
+    assert loads_sharded(text, workers=1, shard_size=1) == loads(text)
+
+
+def test_loads_sharded_strict_raises_like_loads():
+    with pytest.raises(ValueError):
+        loads_sharded("not json at all", mode="strict")
@@ -0,0 +1,67 @@
+# tests/test_streaming.py
+import io
+import json
+
+import pytest
+
+from pyparsejson import repair_to
+from pyparsejson.core.repair import Repair
+from pyparsejson.report.repair_report import RepairStatus
+
+
+@pytest.mark.parametrize("text", [
+    'user: admin, active: si, tags: [a, b, c]',
+    '{"a": [1, 2}',
+    '',
+    "{'nombre': 'ñandú'}",
+])
+def test_repair_to_matches_parse(text):
+    expected = Repair().parse(text).python_object
+
+    out = io.StringIO()
+    Repair().repair_to(out, text, chunk_size=4)
+    assert json.loads(out.getvalue()) == expected
+
+    raw = io.BytesIO()
+    Repair().repair_to(raw, text, chunk_size=4)
+    assert raw.getvalue() == out.getvalue().encode("utf-8")
+
+
+class RecordingStream:
+    def __init__(self):
+        self.writes = []
+
+    def write(self, chunk):
+        self.writes.append(chunk)
+
+
+def test_repair_to_writes_bounded_chunks_without_materializing():
+    text = "{" + ", ".join(f"k{i}: {i}" for i in range(500)) + "}"
+    stream = RecordingStream()
+
+    report = Repair().repair_to(stream, text, chunk_size=64)
+
+    assert report.json_text == ""
+    assert report.python_object is None
+    assert len(stream.writes) > 10
+    # Cada fragmento se corta en cuanto supera chunk_size, a lo sumo un token después
+    assert all(len(chunk) < 64 + 16 for chunk in stream.writes)
+    assert json.loads("".join(stream.writes)) == {f"k{i}": i for i in range(500)}
+
+
+def test_repair_to_strict_failure_writes_nothing():
+    stream = RecordingStream()
+    with pytest.raises(json.JSONDecodeError):
+        repair_to(stream, '{"a": }', mode="strict")
+    assert stream.writes == []
+
+
+def test_repair_to_strict_no_structure_raises_and_writes_nothing():
+    stream = RecordingStream()
+    with pytest.raises(json.JSONDecodeError):
+        Repair(mode="strict").repair_to(stream, "no json here")
+    assert stream.writes == []
+
+    # En modo lax se escribe el `{}` de respaldo
+    assert Repair().repair_to(stream, "no json here").status == RepairStatus.FAILURE_NO_STRUCTURE
+    assert "".join(stream.writes) == "{}"
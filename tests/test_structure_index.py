@@ -0,0 +1,75 @@
+# tests/test_structure_index.py
+import pyparsejson
+from pyparsejson.core.context import Context
+from pyparsejson.core.token import TokenType
+from pyparsejson.phases.tokenize import TolerantTokenizer
+from pyparsejson.rules.structure.separators import BalanceBracketsRule
+
+
+def _context(text: str) -> Context:
+    context = Context(text)
+    context.tokens = TolerantTokenizer().tokenize(text)
+    return context
+
+
+def test_depth_and_matching_brackets():
+    context = _context('{"a": [1, {"b": 2}]}')
+    index = context.structure
+    tokens = context.tokens
+
+    assert index.match[0] == len(tokens) - 1
+    inner = next(i for i, t in enumerate(tokens) if t.type == TokenType.LBRACKET)
+    assert tokens[index.match[inner]].type == TokenType.RBRACKET
+    assert index.depth[inner + 1] == 2
+    assert index.is_balanced
+
+
+def test_separators_and_key_value_spans():
+    context = _context('user admin: foo bar, role: x')
+    index = context.structure
+    first_sep = index.separators[0]
+
+    assert index.next_separator[0] == first_sep
+    assert index.key_span(first_sep) == (0, first_sep - 1)
+    start, end = index.value_span(first_sep)
+    assert [t.value for t in context.tokens[start:end + 1]] == ["foo", "bar"]
+
+
+def test_missing_closers_and_balance_errors():
+    index = _context('{"a": [1, 2').structure
+    assert index.missing_closers == [TokenType.RBRACE, TokenType.RBRACKET]
+    assert index.balance_errors == 2
+
+
+def test_index_is_invalidated_on_change():
+    context = _context('a: 1')
+    first = context.structure
+    assert context.structure is first
+
+    context.tokens = context.tokens[:1]
+    assert context.structure is not first
+
+    second = context.structure
+    context.mark_changed()
+    assert context.structure is not second
+
+
+def test_balance_brackets_drops_stray_trailing_closers():
+    context = _context('{"a": [1, 2]} ]}')
+    assert BalanceBracketsRule().applies(context)
+    BalanceBracketsRule().apply(context)
+    assert "".join(t.value for t in context.tokens) == '{"a":[1,2]}'
+    assert context.report.applied_rules == ["BalanceBracketsRule"]
+
+    # Cierre de otro tipo: se descarta y se cierran las aperturas pendientes
+    context = _context('{"a": [1}')
+    BalanceBracketsRule().apply(context)
+    assert "".join(t.value for t in context.tokens) == '{"a":[1]}'
+
+
+def test_stray_trailing_closer_is_repaired():
+    # Mismo resultado que antes del índice estructural
+    assert pyparsejson.loads(':  user  :  admin  ,  active  :  si  }') == {"user": "admin", "active": True}
+    assert pyparsejson.loads('{user: admin}}') == {"user": "admin"}
+    assert pyparsejson.loads('{a: {user: admin}') == {"a": {"user": "admin"}}
+    assert pyparsejson.loads('active: si }') == {"active": True}
@@ -0,0 +1,41 @@
+# tests/test_timings.py
+import io
+
+from pyparsejson.core.repair import Repair
+from pyparsejson.report.repair_report import PhaseTimings
+
+
+def test_token_path_timings():
+    report = Repair().parse("{a: 1, b: [1, 2,]}")
+    timings = report.timings
+    assert timings.pre_normalize > 0 and timings.tokenize > 0
+    assert timings.repair_loop > 0 and timings.build > 0
+    assert timings.json_loads == timings.fallback == 0.0
+    assert timings.tokens_before > timings.tokens_after > 0   # la coma final se elimina
+    assert timings.rule_evaluations > 0
+
+    assert timings.quality == 0.0   # evaluación diferida
+    report.evaluate_quality()
+    assert timings.quality > 0
+    assert list(timings.as_dict()) == list(PhaseTimings.PHASES)
+    assert timings.total == sum(timings.as_dict().values())
+
+
+def test_text_fallback_timings():
+    report = Repair(salvage=True).parse('{"name": "Ana", "items": [{"id": 1}, {"id": 2, "n')
+    timings = report.timings
+    assert report.salvaged
+    assert timings.finalize > 0 and timings.json_loads > 0 and timings.fallback > 0
+
+
+def test_early_reports_carry_timings():
+    assert Repair().parse("   ").timings.pre_normalize > 0
+    assert Repair().parse("just words").timings.tokenize > 0
+
+
+def test_local_repair_and_repair_to():
+    report = Repair(local_repair=True).parse('{"k": [1, 2,, 3]}')
+    assert report.timings.local_repair > 0
+
+    report = Repair().repair_to(io.StringIO(), "{a: 1}")
+    assert report.timings.build > 0 and report.timings.tokens_after == 5
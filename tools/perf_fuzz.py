@@ -0,0 +1,419 @@
+"""
+Fuzzer de rendimiento: busca entradas que maximizan el coste de reparación por byte.
+
+Parte de las entradas de `main.py` y de `tests/` (literales de texto con aspecto de
+JSON), las muta con operadores de daño que conocen la gramática (trabajan sobre los
+tokens de `TolerantTokenizer`: quitar comas, cambiar : por =, desbalancear llaves,
+anidar, duplicar tramos...) y conserva una población de las más caras. El coste es:
+
+  - time:   (latencia de `Repair.parse` - latencia de `{}`) / bytes
+  - memory: pico de `tracemalloc` durante `Repair.parse` / bytes
+
+con un denominador mínimo de `--min-size` bytes para que las entradas diminutas no
+ganen solo por el coste fijo. Al terminar, minimiza los peores casos (quita tramos de
+tokens mientras el coste por byte se mantenga) y los guarda como corpus patológico
+(`benchmarks/pathological.json`), que consumen `benchmarks.corpus` (clase de daño
+"pathological"), la suite de benchmarks y los tests de complejidad.
+
+Uso:
+    python -m tools.perf_fuzz [--iterations 2000] [--seconds 120] [--objective time|memory]
+                              [--keep 8] [--seed 0] [--out benchmarks/pathological.json] [--merge]
+"""
+import argparse
+import ast
+import gc
+import hashlib
+import json
+import os
+import random
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from benchmarks.corpus import PATHOLOGICAL_PATH, generate
+from pyparsejson.core.repair import Repair
+from pyparsejson.core.token import Token, TokenType
+from pyparsejson.phases.tokenize import TolerantTokenizer
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+OBJECTIVES = ("time", "memory")
+
+_TOKENIZER = TolerantTokenizer()
+_STRUCTURAL = set("{}[]():=")
+_WORDS = ["alpha", "beta", "note", "yes", "None", "True", "id", "user name", "x"]
+_PREFIXES = ["SELECT * FROM t WHERE ", "INFO payload => ", "Respuesta: ", "<pre>"]
+
+
+# --- semillas ---
+
+def _string_args(path: str, functions: Optional[Sequence[str]] = None) -> List[str]:
+    """Literales de texto pasados como argumento posicional en las llamadas de un archivo."""
+    with open(path, encoding="utf-8") as fp:
+        tree = ast.parse(fp.read())
+    found = []
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.Call):
+            continue
+        name = getattr(node.func, "id", None) or getattr(node.func, "attr", None)
+        if functions is not None and name not in functions:
+            continue
+        for arg in node.args:
+            if isinstance(arg, ast.Constant) and isinstance(arg.value, str):
+                found.append(arg.value)
+    return found
+
+
+def collect_seeds(root: str = ROOT) -> List[str]:
+    """Entradas de `main.py` (casos `run_case`) y de `tests/` con algún carácter estructural."""
+    texts = _string_args(os.path.join(root, "main.py"), functions=("run_case",))
+    tests_dir = os.path.join(root, "tests")
+    for name in sorted(os.listdir(tests_dir)):
+        if name.endswith(".py"):
+            texts.extend(_string_args(os.path.join(tests_dir, name)))
+    seeds = [t for t in dict.fromkeys(texts) if 4 <= len(t) <= 4096 and _STRUCTURAL & set(t)]
+    return seeds
+
+
+# --- operadores de daño ---
+
+Operator = Callable[[random.Random, str, List[Token]], Optional[str]]
+
+
+def _pick(rng: random.Random, tokens: List[Token], *types: TokenType) -> Optional[Token]:
+    candidates = [t for t in tokens if t.type in types]
+    return rng.choice(candidates) if candidates else None
+
+
+def _replace(text: str, token: Token, new: str) -> str:
+    return text[:token.position] + new + text[token.position + len(token.raw_value):]
+
+
+def _insert_after(text: str, token: Token, new: str) -> str:
+    end = token.position + len(token.raw_value)
+    return text[:end] + new + text[end:]
+
+
+def _drop(types: Sequence[TokenType]) -> Operator:
+    def operator(rng, text, tokens):
+        token = _pick(rng, tokens, *types)
+        return _replace(text, token, "") if token else None
+    return operator
+
+
+def _swap(types: Sequence[TokenType], values: Dict[str, str]) -> Operator:
+    def operator(rng, text, tokens):
+        token = _pick(rng, tokens, *types)
+        return _replace(text, token, values.get(token.value, token.value)) if token else None
+    return operator
+
+
+def _double_comma(rng, text, tokens):
+    token = _pick(rng, tokens, TokenType.COMMA)
+    return _insert_after(text, token, ",") if token else None
+
+
+def _unquote(rng, text, tokens):
+    token = _pick(rng, tokens, TokenType.STRING)
+    return _replace(text, token, token.value[1:-1]) if token and len(token.value) >= 2 else None
+
+
+def _single_quotes(rng, text, tokens):
+    token = _pick(rng, tokens, TokenType.STRING)
+    if not token or not token.value.startswith('"'):
+        return None
+    return _replace(text, token, "'" + token.value[1:-1] + "'")
+
+
+def _split_string(rng, text, tokens):
+    token = _pick(rng, tokens, TokenType.STRING)
+    if not token or len(token.value) < 4:
+        return None
+    cut = rng.randint(2, len(token.value) - 2)
+    quote = token.value[0]
+    return _replace(text, token, f"{token.value[:cut]}{quote} {quote}{token.value[cut:]}")
+
+
+def _leading_zero(rng, text, tokens):
+    token = _pick(rng, tokens, TokenType.NUMBER)
+    return _replace(text, token, "00" + token.value.lstrip("-")) if token else None
+
+
+def _free_text(rng, text, tokens):
+    token = _pick(rng, tokens, TokenType.COLON, TokenType.ASSIGN)
+    words = " ".join(rng.choice(_WORDS) for _ in range(rng.randint(2, 6)))
+    return _insert_after(text, token, f" {words}") if token else None
+
+
+def _comment(rng, text, tokens):
+    token = _pick(rng, tokens, TokenType.COMMA, TokenType.LBRACE, TokenType.LBRACKET)
+    comment = rng.choice(["// nota\n", "/* bloque */ ", "// a // b\n"])
+    return _insert_after(text, token, f" {comment}") if token else None
+
+
+def _nest(rng, text, tokens):
+    """Envuelve en [ ] el valor que sigue a un separador (a veces sin cerrar el corchete)."""
+    token = _pick(rng, tokens, TokenType.COLON, TokenType.ASSIGN)
+    if not token:
+        return None
+    closer = rng.choice(["]", ""])
+    wrapped = _insert_after(text, token, " [")
+    index = tokens.index(token)
+    if index + 2 < len(tokens):
+        after = tokens[index + 2]
+        position = after.position + 2
+        wrapped = wrapped[:position] + closer + wrapped[position:]
+    return wrapped
+
+
+def _duplicate_span(rng, text, tokens):
+    """Duplica un tramo de tokens completo (hace crecer la entrada con su misma estructura)."""
+    if len(tokens) < 2:
+        return None
+    start = rng.randrange(len(tokens))
+    end = min(len(tokens) - 1, start + rng.randint(1, 12))
+    first, last = tokens[start], tokens[end]
+    span = text[first.position:last.position + len(last.raw_value)]
+    copies = rng.choice([1, 2, 4, 8])
+    return _insert_after(text, last, (" " + span) * copies)
+
+
+def _truncate(rng, text, tokens):
+    return text[:rng.randint(len(text) // 2, len(text) - 1)] if len(text) > 8 else None
+
+
+def _prefix(rng, text, tokens):
+    return rng.choice(_PREFIXES) + text
+
+
+OPERATORS: Dict[str, Operator] = {
+    "drop_comma": _drop((TokenType.COMMA,)),
+    "double_comma": _double_comma,
+    "drop_colon": _drop((TokenType.COLON,)),
+    "drop_closer": _drop((TokenType.RBRACE, TokenType.RBRACKET)),
+    "drop_opener": _drop((TokenType.LBRACE, TokenType.LBRACKET)),
+    "colon_to_equals": _swap((TokenType.COLON,), {":": "="}),
+    "brackets_to_parens": _swap((TokenType.LBRACKET, TokenType.RBRACKET), {"[": "(", "]": ")"}),
+    "crossed_closer": _swap((TokenType.RBRACE, TokenType.RBRACKET), {"}": "]", "]": "}"}),
+    "python_literal": _swap((TokenType.BOOLEAN, TokenType.NULL),
+                            {"true": "True", "false": "no", "null": "None"}),
+    "unquote": _unquote,
+    "single_quotes": _single_quotes,
+    "split_string": _split_string,
+    "leading_zero": _leading_zero,
+    "free_text": _free_text,
+    "comment": _comment,
+    "nest": _nest,
+    "duplicate_span": _duplicate_span,
+    "truncate": _truncate,
+    "prefix_garbage": _prefix,
+}
+
+
+def mutate(rng: random.Random, text: str, max_ops: int = 3) -> Tuple[str, List[str]]:
+    """Aplica de 1 a `max_ops` operadores al azar; devuelve el texto y sus nombres."""
+    applied = []
+    for _ in range(rng.randint(1, max_ops)):
+        name = rng.choice(list(OPERATORS))
+        mutated = OPERATORS[name](rng, text, _TOKENIZER.tokenize(text))
+        if mutated is not None and mutated != text:
+            text = mutated
+            applied.append(name)
+    return text, applied
+
+
+# --- medición ---
+
+@dataclass
+class Candidate:
+    text: str
+    score: float
+    operators: List[str] = field(default_factory=list)
+    seconds: float = 0.0
+    peak_bytes: int = 0
+
+
+class CostModel:
+    """Mide el coste por byte de reparar un texto según el objetivo elegido."""
+
+    def __init__(self, objective: str = "time", repeat: int = 3, min_size: int = 64):
+        if objective not in OBJECTIVES:
+            raise ValueError(f"Unknown objective '{objective}'. Use one of: {', '.join(OBJECTIVES)}")
+        self.objective = objective
+        self.repeat = repeat
+        self.min_size = min_size
+        self.pipeline = Repair()
+        self.overhead = min(self.seconds("{}") for _ in range(5))
+        # Coste de referencia por byte: JSON válido del corpus sintético
+        self.reference = self.score(generate("valid", 2000))
+
+    def seconds(self, text: str) -> float:
+        best = float("inf")
+        for _ in range(self.repeat):
+            start = time.perf_counter()
+            self.pipeline.parse(text)
+            best = min(best, time.perf_counter() - start)
+        return best
+
+    def peak_bytes(self, text: str) -> int:
+        gc.collect()
+        tracemalloc.start()
+        try:
+            self.pipeline.parse(text)
+            return tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    def score(self, text: str) -> float:
+        size = max(len(text.encode("utf-8")), self.min_size)
+        if self.objective == "memory":
+            return self.peak_bytes(text) / size
+        return max(0.0, self.seconds(text) - self.overhead) / size
+
+    def measure(self, text: str, operators: List[str]) -> Candidate:
+        return Candidate(text, self.score(text), operators)
+
+    def describe(self, candidate: Candidate) -> Candidate:
+        """Completa latencia y pico de memoria (para el corpus) sea cual sea el objetivo."""
+        candidate.seconds = self.seconds(candidate.text)
+        candidate.peak_bytes = self.peak_bytes(candidate.text)
+        return candidate
+
+
+# --- búsqueda y minimización ---
+
+def fuzz(seeds: Sequence[str], model: CostModel, iterations: int = 2000, seconds: float = 120.0,
+         population: int = 32, max_size: int = 4096, seed: int = 0,
+         progress: Optional[Callable[[int, Candidate], None]] = None) -> List[Candidate]:
+    """Búsqueda evolutiva: muta las entradas más caras y conserva las `population` mejores."""
+    rng = random.Random(seed)
+    pool = sorted((model.measure(text, []) for text in seeds), key=lambda c: c.score, reverse=True)
+    pool = pool[:population]
+    seen = {c.text for c in pool}
+    deadline = time.perf_counter() + seconds
+
+    for iteration in range(iterations):
+        if time.perf_counter() > deadline:
+            break
+        parent = max(rng.sample(pool, min(3, len(pool))), key=lambda c: c.score)
+        text, applied = mutate(rng, parent.text)
+        if not applied or text in seen or len(text) > max_size:
+            continue
+        seen.add(text)
+        child = model.measure(text, parent.operators + applied)
+        if len(pool) < population or child.score > pool[-1].score:
+            pool.append(child)
+            pool.sort(key=lambda c: c.score, reverse=True)
+            del pool[population:]
+            if progress is not None and child is pool[0]:
+                progress(iteration, child)
+    return pool
+
+
+def minimize(candidate: Candidate, model: CostModel, keep: float = 0.9, max_checks: int = 200) -> Candidate:
+    """
+    Quita tramos de tokens (mitades, cuartos, ... hasta tokens sueltos) mientras el coste
+    por byte siga siendo al menos `keep` veces el original.
+    """
+    target = candidate.score * keep
+    text = candidate.text
+    checks = 0
+    chunk = max(1, len(_TOKENIZER.tokenize(text)) // 2)
+    while chunk >= 1 and checks < max_checks:
+        tokens = _TOKENIZER.tokenize(text)
+        start = 0
+        removed = False
+        while start < len(tokens) and checks < max_checks:
+            end = min(len(tokens), start + chunk) - 1
+            cut = text[:tokens[start].position] + text[tokens[end].position + len(tokens[end].raw_value):]
+            checks += 1
+            if cut.strip() and model.score(cut) >= target:
+                text, removed = cut, True
+                break
+            start += chunk
+        if not removed:
+            chunk //= 2
+    return Candidate(text, model.score(text), candidate.operators)
+
+
+def _signature(pipeline: Repair, text: str) -> tuple:
+    report = pipeline.parse(text)
+    return tuple(sorted(report.applied_rules)), report.status.name
+
+
+def select_offenders(pool: Sequence[Candidate], model: CostModel, keep: int) -> List[Candidate]:
+    """Los peores casos, uno por combinación de reglas aplicadas y status (corpus variado)."""
+    chosen, signatures = [], set()
+    for candidate in pool:
+        signature = _signature(model.pipeline, candidate.text)
+        if signature not in signatures:
+            signatures.add(signature)
+            chosen.append(candidate)
+        if len(chosen) == keep:
+            break
+    return chosen
+
+
+def corpus_entry(candidate: Candidate, model: CostModel) -> Dict:
+    size = len(candidate.text.encode("utf-8"))
+    return {
+        "name": "patho_" + hashlib.sha1(candidate.text.encode("utf-8")).hexdigest()[:10],
+        "text": candidate.text,
+        "bytes": size,
+        "operators": candidate.operators,
+        "objective": model.objective,
+        "slowdown_vs_valid": candidate.score / model.reference if model.reference else None,
+        "us_per_byte": 1e6 * candidate.seconds / size,
+        "peak_bytes_per_byte": candidate.peak_bytes / size,
+    }
+
+
+def save_corpus(entries: List[Dict], path: str, merge: bool = False):
+    if merge and os.path.exists(path):
+        with open(path, encoding="utf-8") as fp:
+            previous = json.load(fp)["inputs"]
+        names = {entry["name"] for entry in entries}
+        entries = [entry for entry in previous if entry["name"] not in names] + entries
+    with open(path, "w", encoding="utf-8") as fp:
+        json.dump({"inputs": entries}, fp, indent=2, ensure_ascii=False)
+        fp.write("\n")
+
+
+def main(argv: Sequence[str] = None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=2000, help="Mutaciones como máximo.")
+    parser.add_argument("--seconds", type=float, default=120.0, help="Presupuesto de tiempo de la búsqueda.")
+    parser.add_argument("--objective", choices=OBJECTIVES, default="time")
+    parser.add_argument("--population", type=int, default=32)
+    parser.add_argument("--max-size", type=int, default=4096, help="Tamaño máximo de una entrada (bytes).")
+    parser.add_argument("--min-size", type=int, default=64, help="Denominador mínimo del coste por byte.")
+    parser.add_argument("--keep", type=int, default=8, help="Peores casos que se guardan.")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", default=PATHOLOGICAL_PATH, help="Archivo JSON del corpus patológico.")
+    parser.add_argument("--merge", action="store_true", help="Conserva las entradas ya guardadas.")
+    args = parser.parse_args(argv)
+
+    seeds = collect_seeds()
+    model = CostModel(args.objective, min_size=args.min_size)
+    print(f"{len(seeds)} semillas; referencia (JSON válido): {model.reference:.3g} por byte")
+
+    def progress(iteration: int, best: Candidate):
+        print(f"  [{iteration:5d}] x{best.score / model.reference:6.1f} vs válido  "
+              f"{len(best.text):5d} B  {'+'.join(best.operators[-4:])}", flush=True)
+
+    pool = fuzz(seeds, model, args.iterations, args.seconds, args.population, args.max_size,
+                args.seed, progress)
+    offenders = select_offenders(pool, model, args.keep)
+    entries = []
+    for candidate in offenders:
+        minimized = model.describe(minimize(candidate, model))
+        entry = corpus_entry(minimized, model)
+        entries.append(entry)
+        print(f"{entry['name']}  {entry['bytes']:5d} B  x{entry['slowdown_vs_valid']:.1f} vs válido  "
+              f"{entry['peak_bytes_per_byte']:.0f} B/B pico")
+    save_corpus(entries, args.out, args.merge)
+    print(f"\nCorpus patológico guardado en {args.out}")
+
+
+if __name__ == "__main__":
+    main()